@@ -5,9 +5,13 @@ This version uses LangGraph's built-in tool support for dynamic tool calling.
 The LLM decides which tools to call based on user queries.
 """
 
+import asyncio
+import functools
 import logging
 import uuid
-from typing import Literal
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from typing import Any, Literal
 
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -198,6 +202,30 @@ def get_llm_with_tools() -> ChatGoogleGenerativeAI:
     return llm_with_tools
 
 
+def message_text(content: str | list[Any]) -> str:
+    """
+    Extract plain text from a message's content.
+    
+    Gemini may return content as a list of content blocks instead of a
+    string; text blocks are joined and anything else is skipped.
+    
+    Args:
+        content: Message content (string or list of content blocks)
+        
+    Returns:
+        The text portion of the content
+    """
+    if isinstance(content, str):
+        return content
+    text_parts = []
+    for item in content:
+        if isinstance(item, str):
+            text_parts.append(item)
+        elif isinstance(item, dict):
+            text_parts.append(item.get("text", ""))
+    return "".join(text_parts)
+
+
 def should_continue(state: FinancialAgentState) -> Literal["tools", "end"]:
     """
     Conditional edge to determine if we should call tools or end.
@@ -225,10 +253,15 @@ def should_continue(state: FinancialAgentState) -> Literal["tools", "end"]:
 # =============================================================================
 
 
+@functools.lru_cache(maxsize=1)
 def build_financial_agent() -> StateGraph:
     """
     Build the LangGraph agent for financial analysis with tool support.
     
+    The compiled graph holds no per-request state (the session and user
+    go in the initial state), so it is built once and reused by every
+    call; build_financial_agent.cache_clear() drops it.
+    
     This function constructs a ReAct-style agent graph with the following flow:
     1. call_model_node: LLM decides whether to use tools or respond
     2. Conditional routing: If tools needed, execute them; otherwise end
@@ -297,6 +330,69 @@ def build_financial_agent() -> StateGraph:
 # =============================================================================
 
 
+@contextmanager
+def _agent_run(
+    user_id: uuid.UUID,
+    messages: list[BaseMessage],
+    session: Session,
+    conversation_context: dict | None = None
+) -> Iterator[FinancialAgentState]:
+    """
+    Set up one run of the financial agent; shared by process_message and
+    stream_message.
+    
+    Validates the messages, builds the initial state and sets the tool
+    context for the run, which is cleared again on exit.
+    
+    Args:
+        user_id: UUID of the authenticated user
+        messages: List of conversation messages (LangChain format)
+        session: Database session for querying financial data
+        conversation_context: Optional additional context to pass to the agent
+        
+    Yields:
+        The initial state to run the agent graph on
+        
+    Raises:
+        ValueError: If no messages provided or the last is not a HumanMessage
+    """
+    # Validate input
+    if not messages:
+        raise ValueError("No messages provided")
+    
+    last_message = messages[-1]
+    if not isinstance(last_message, HumanMessage):
+        raise ValueError("Last message must be a HumanMessage")
+    
+    logger.info(f"User message: {last_message.content[:100]}...")
+    
+    # Create initial state with session
+    initial_state = create_initial_state(user_id=user_id, messages=messages, session=session)
+    
+    # Add any additional context
+    if conversation_context:
+        initial_state["context"] = {
+            **initial_state.get("context", {}),
+            **conversation_context
+        }
+    
+    # Trim message history if too long (keep last N messages)
+    if len(messages) > AIConfig.MAX_CONVERSATION_HISTORY:
+        logger.info(f"Trimming message history from {len(messages)} to {AIConfig.MAX_CONVERSATION_HISTORY}")
+        initial_state["messages"] = messages[-AIConfig.MAX_CONVERSATION_HISTORY:]
+    
+    # Set context before running the agent (needed for the entire execution)
+    set_context(session, user_id)
+    logger.debug(f"Context set for agent execution: user_id={user_id}")
+    
+    try:
+        yield initial_state
+    finally:
+        # Always clear context after agent execution completes
+        clear_context()
+        logger.debug("Context cleared after agent execution")
+
+
 def process_message(
     user_id: uuid.UUID,
     messages: list[BaseMessage],
@@ -307,7 +403,7 @@ def process_message(
     Process a user message through the financial agent.
     
     This is the main entry point for interacting with the agent.
-    It builds the agent, creates the initial state, and invokes the graph.
+    It gets the (cached) agent, creates the initial state, and invokes the graph.
     
     Args:
         user_id: UUID of the authenticated user
@@ -330,41 +426,11 @@ def process_message(
     """
     logger.info(f"Processing message for user {user_id}, message count: {len(messages)}")
     
-    # Validate input
-    if not messages:
-        raise ValueError("No messages provided")
-    
-    # Extract just the user message if that's what was passed
-    last_message = messages[-1]
-    if not isinstance(last_message, HumanMessage):
-        raise ValueError("Last message must be a HumanMessage")
-    
-    logger.info(f"User message: {last_message.content[:100]}...")
-    
-    try:
-        # Build the agent
-        agent = build_financial_agent()
-        
-        # Create initial state with session
-        initial_state = create_initial_state(user_id=user_id, messages=messages, session=session)
-        
-        # Add any additional context
-        if conversation_context:
-            initial_state["context"] = {
-                **initial_state.get("context", {}),
-                **conversation_context
-            }
-        
-        # Trim message history if too long (keep last N messages)
-        if len(messages) > AIConfig.MAX_CONVERSATION_HISTORY:
-            logger.info(f"Trimming message history from {len(messages)} to {AIConfig.MAX_CONVERSATION_HISTORY}")
-            initial_state["messages"] = messages[-AIConfig.MAX_CONVERSATION_HISTORY:]
-        
-        # Set context before invoking agent (needed for the entire execution)
-        set_context(session, user_id)
-        logger.debug(f"Context set for agent execution: user_id={user_id}")
-        
+    with _agent_run(user_id, messages, session, conversation_context) as initial_state:
         try:
+            # Get the agent, built on first use
+            agent = build_financial_agent()
+            
             # Invoke the agent
             logger.info("Invoking agent graph")
             result = agent.invoke(initial_state)
@@ -386,33 +452,74 @@ def process_message(
                     logger.warning(f"Agent response is unexpected type: {type(last_response)}")
             
             return result
-        finally:
-            # Always clear context after agent execution completes
-            clear_context()
-            logger.debug("Context cleared after agent execution")
-        
-    except Exception as e:
-        logger.error(f"Error processing message: {e}", exc_info=True)
+            
+        except Exception as e:
+            logger.error(f"Error processing message: {e}", exc_info=True)
+            
+            # Create error state
+            error_state = create_initial_state(user_id=user_id, messages=messages, session=session)
+            error_state["error"] = str(e)
+            
+            # Try to format a user-friendly error response
+            try:
+                error_message = AIMessage(
+                    content="I apologize, but I'm having trouble processing your request right now. "
+                            "Please try again in a moment, or rephrase your question."
+                )
+                error_state["messages"] = messages + [error_message]
+            except Exception:
+                pass
+            
+            return error_state
+
+
+async def stream_message(
+    user_id: uuid.UUID,
+    messages: list[BaseMessage],
+    session: Session,
+    conversation_context: dict | None = None
+) -> AsyncIterator[str]:
+    """
+    Process a user message through the financial agent, streaming the reply.
+    
+    Runs the same graph as process_message but uses LangGraph's "messages"
+    stream mode, so LLM tokens from the agent node are yielded as soon as the
+    model produces them. Tool calls and tool results are not yielded.
+    
+    Args:
+        user_id: UUID of the authenticated user
+        messages: List of conversation messages (LangChain format)
+        session: Database session for querying financial data
+        conversation_context: Optional additional context to pass to the agent
         
-        # Ensure context is cleared even on error
-        clear_context()
-        logger.debug("Context cleared after error")
+    Yields:
+        Text deltas of the agent's response
         
-        # Create error state
-        error_state = create_initial_state(user_id=user_id, messages=messages, session=session)
-        error_state["error"] = str(e)
+    Raises:
+        ValueError: If no messages provided or configuration invalid
         
-        # Try to format a user-friendly error response
-        try:
-            error_message = AIMessage(
-                content="I apologize, but I'm having trouble processing your request right now. "
-                        "Please try again in a moment, or rephrase your question."
-            )
-            error_state["messages"] = messages + [error_message]
-        except Exception:
-            pass
-        
-        return error_state
+    Example:
+        >>> async for delta in stream_message(user_id=user_id, messages=messages, session=session):
+        ...     print(delta, end="")
+    """
+    logger.info(f"Streaming message for user {user_id}, message count: {len(messages)}")
+    
+    with _agent_run(user_id, messages, session, conversation_context) as initial_state:
+        # Get the agent off the event loop; compiling it on first use is
+        # blocking work
+        agent = await asyncio.to_thread(build_financial_agent)
+        
+        # The graph's nodes are synchronous, so astream runs each of them
+        # (LLM and database calls) in the default executor with a copy of
+        # the current context; the event loop stays free while they block
+        logger.info("Streaming agent graph")
+        async for chunk, metadata in agent.astream(initial_state, stream_mode="messages"):
+            # Only forward the model's own output, not tool results
+            if metadata.get("langgraph_node") != "agent" or not isinstance(chunk, AIMessage):
+                continue
+            delta = message_text(chunk.content)
+            if delta:
+                yield delta
 
 
 def process_message_simple(user_id: uuid.UUID, message_text: str, session: Session) -> str:
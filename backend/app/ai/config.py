@@ -39,14 +39,26 @@ class AIConfig:
     MAX_CONVERSATION_HISTORY: int = 10  # Keep last 10 messages for context
     ENABLE_CLARIFICATION: bool = False #True  # Enable clarifying questions
     
+    # Result of validate_config(); settings are fixed at startup, so the
+    # check only needs to run (and log) once per process
+    _is_valid: bool | None = None
+    
     @classmethod
     def validate_config(cls) -> bool:
         """
         Validate that required configuration is present
         
+        The result is computed on the first call and reused afterwards.
+        
         Returns:
             True if configuration is valid, False otherwise
         """
+        if cls._is_valid is None:
+            cls._is_valid = cls._check_config()
+        return cls._is_valid
+    
+    @classmethod
+    def _check_config(cls) -> bool:
         if not cls.GOOGLE_API_KEY:
             logger.error(
                 "GOOGLE_API_KEY not set. Please set it as an environment variable. "
@@ -71,7 +71,7 @@ def query_spending_by_category(
             .where(Transaction.category.ilike(f"%{category}%"))
             .where(Transaction.auth_date >= start_date)
             .where(Transaction.auth_date <= end_date)
-            .where(Transaction.pending == False)
+            .where(Transaction.pending.is_(False))
         )
         
         result = session.exec(total_query).first()
@@ -90,7 +90,7 @@ def query_spending_by_category(
             .where(Transaction.category.ilike(f"%{category}%"))
             .where(Transaction.auth_date >= start_date)
             .where(Transaction.auth_date <= end_date)
-            .where(Transaction.pending == False)
+            .where(Transaction.pending.is_(False))
             .group_by(Transaction.merchant_name)
             .order_by(func.sum(Transaction.amount).desc())
             .limit(3)
@@ -165,7 +165,7 @@ def query_spending_by_time_period(
             .where(Account.user_id == user_id)
             .where(Transaction.auth_date >= start_date)
             .where(Transaction.auth_date <= end_date)
-            .where(Transaction.pending == False)
+            .where(Transaction.pending.is_(False))
         )
         
         result = session.exec(total_query).first()
@@ -183,7 +183,7 @@ def query_spending_by_time_period(
             .where(Account.user_id == user_id)
             .where(Transaction.auth_date >= start_date)
             .where(Transaction.auth_date <= end_date)
-            .where(Transaction.pending == False)
+            .where(Transaction.pending.is_(False))
             .group_by(Transaction.category)
             .order_by(func.sum(Transaction.amount).desc())
         )
@@ -426,7 +426,7 @@ def get_transactions(
             select(Transaction)
             .join(Account, Transaction.account_id == Account.id)
             .where(Account.user_id == user_id)
-            .where(Transaction.pending == False)
+            .where(Transaction.pending.is_(False))
         )
         
         # Apply filters
@@ -13,10 +13,13 @@ from app.ai.tools.base import (
     current_session,
     current_user_id,
     get_all_tools,
+    get_ctx,
     get_session,
     get_user_id,
+    ilike_pattern,
     register_tool,
     set_context,
+    user_account_ids,
 )
 
 # Import all tools (this triggers their registration)
@@ -33,6 +36,10 @@ __all__ = [
     "clear_context",
     "get_session",
     "get_user_id",
+    "get_ctx",
+    # Query helpers
+    "ilike_pattern",
+    "user_account_ids",
     # Tool registry
     "get_all_tools",
     "register_tool",
@@ -10,9 +10,13 @@ This module provides:
 import logging
 import uuid
 from contextvars import ContextVar
+from decimal import Decimal
 from typing import Callable
 
-from sqlmodel import Session
+from sqlmodel import Session, select
+from sqlmodel.sql.expression import SelectOfScalar
+
+from app.models import Account
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +29,9 @@ logger = logging.getLogger(__name__)
 current_session: ContextVar[Session | None] = ContextVar("current_session", default=None)
 current_user_id: ContextVar[uuid.UUID | None] = ContextVar("current_user_id", default=None)
 
+# Number of rows fetched per round-trip when tools stream transaction results
+FETCH_BATCH_SIZE = 50
+
 # =============================================================================
 # Tool Registry
 # =============================================================================
@@ -53,7 +60,7 @@ def register_tool(tool_func: Callable) -> Callable:
     """
     if tool_func not in _tool_registry:
         _tool_registry.append(tool_func)
-        logger.debug(f"Registered tool: {tool_func.name if hasattr(tool_func, 'name') else tool_func.__name__}")
+        logger.debug("Registered tool: %s", tool_func.name if hasattr(tool_func, 'name') else tool_func.__name__)
     return tool_func
 
 
@@ -64,7 +71,7 @@ def get_all_tools() -> list[Callable]:
     Returns:
         List of all registered tool functions
     """
-    logger.info(f"Retrieved {len(_tool_registry)} registered tools")
+    logger.info("Retrieved %s registered tools", len(_tool_registry))
     return _tool_registry.copy()
 
 
@@ -111,6 +118,29 @@ def get_user_id() -> uuid.UUID:
     return user_id
 
 
+def get_ctx() -> tuple[Session, uuid.UUID]:
+    """
+    Get both the database session and user ID from context in one call.
+    
+    Tools need both values on entry, so this fuses the two lookups and
+    their None-checks into a single helper.
+    
+    Returns:
+        Tuple of (session, user_id) for the current request
+        
+    Raises:
+        RuntimeError: If session or user_id is not set in context
+    """
+    session = current_session.get()
+    user_id = current_user_id.get()
+    if session is None or user_id is None:
+        raise RuntimeError(
+            "Tool context not set. "
+            "Ensure set_context() is called before invoking tools."
+        )
+    return session, user_id
+
+
 def set_context(session: Session, user_id: uuid.UUID) -> None:
     """
     Set the session and user_id in context for tool execution.
@@ -127,7 +157,7 @@ def set_context(session: Session, user_id: uuid.UUID) -> None:
     """
     current_session.set(session)
     current_user_id.set(user_id)
-    logger.debug(f"Context set: user_id={user_id}")
+    logger.debug("Context set: user_id=%s", user_id)
 
 
 def clear_context() -> None:
@@ -140,3 +170,68 @@ def clear_context() -> None:
     current_session.set(None)
     current_user_id.set(None)
     logger.debug("Context cleared")
+
+
+# =============================================================================
+# Query Helpers
+# =============================================================================
+
+
+def ilike_pattern(value: str) -> str:
+    """
+    Build a substring ILIKE pattern from user-provided text.
+    
+    Strips the value and escapes LIKE wildcards so that inputs containing
+    '%' or '_' match literally. ILIKE is already case-insensitive, so the
+    value is not lowercased. Use with ilike(..., escape="\\").
+    
+    Args:
+        value: Raw search text (e.g., a merchant or category name)
+        
+    Returns:
+        Pattern of the form "%value%"
+        
+    Example:
+        Transaction.merchant_name.ilike(ilike_pattern("7_eleven"), escape="\\")
+    """
+    escaped = (
+        value.strip()
+        .replace("\\", "\\\\")
+        .replace("%", "\\%")
+        .replace("_", "\\_")
+    )
+    return f"%{escaped}%"
+
+
+def money(amount: Decimal | float | None) -> float:
+    """
+    Round a monetary value to cents for tool output.
+    
+    Amounts are stored as exact NUMERIC values and summed as Decimal; tool
+    results are serialized to JSON for the LLM, so they are returned as
+    plain floats.
+    
+    Args:
+        amount: Amount or aggregate from the database (None for empty sums)
+        
+    Returns:
+        The amount rounded to two decimal places
+    """
+    return float(round(amount or 0, 2))
+
+
+def user_account_ids(user_id: uuid.UUID) -> SelectOfScalar[uuid.UUID]:
+    """
+    Build a subquery selecting the IDs of all accounts owned by a user.
+    
+    Filtering with Transaction.account_id.in_(user_account_ids(user_id))
+    scopes transactions to the user without joining Account, so the planner
+    can drive the query from transaction indexes.
+    
+    Args:
+        user_id: Authenticated user's UUID
+        
+    Returns:
+        SELECT of Account.id for the user's accounts
+    """
+    return select(Account.id).where(Account.user_id == user_id)
@@ -5,15 +5,24 @@ Retrieves transactions within a specific date range or on a specific date.
 Use when user asks about transactions for a particular time period.
 """
 
+import heapq
 import logging
 from datetime import date, datetime
+from decimal import Decimal
+from operator import itemgetter
 from typing import Any
 
 from langchain_core.tools import tool
 from sqlmodel import func, select
 
-from app.ai.tools.base import get_session, get_user_id, register_tool
-from app.models import Account, Transaction
+from app.ai.tools.base import (
+    FETCH_BATCH_SIZE,
+    get_ctx,
+    money,
+    register_tool,
+    user_account_ids,
+)
+from app.models import Transaction
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +55,20 @@ for that single day.
 # Helper Functions
 # =============================================================================
 
+# Maximum number of categories itemized in category_breakdown; the rest are
+# summed into other_categories_total
+MAX_BREAKDOWN_CATEGORIES = 10
+
+# Common date formats, tried in order after the ISO fast path
+_DATE_FORMATS = (
+    "%Y-%m-%d",  # ISO format: 2024-01-15
+    "%Y/%m/%d",  # 2024/01/15
+    "%m/%d/%Y",  # 01/15/2024
+    "%m-%d-%Y",  # 01-15-2024
+    "%d-%m-%Y",  # 15-01-2024 (European)
+    "%Y%m%d",    # 20240115
+)
+
 
 def parse_date_string(date_str: str) -> date:
     """
@@ -60,17 +83,14 @@ def parse_date_string(date_str: str) -> date:
     Raises:
         ValueError: If date string cannot be parsed
     """
-    # Try common date formats
-    formats = [
-        "%Y-%m-%d",  # ISO format: 2024-01-15
-        "%Y/%m/%d",  # 2024/01/15
-        "%m/%d/%Y",  # 01/15/2024
-        "%m-%d-%Y",  # 01-15-2024
-        "%d-%m-%Y",  # 15-01-2024 (European)
-        "%Y%m%d",    # 20240115
-    ]
+    # Fast path for the ISO format the LLM is asked to use
+    try:
+        return date.fromisoformat(date_str)
+    except ValueError:
+        pass
     
-    for fmt in formats:
+    # Try common date formats
+    for fmt in _DATE_FORMATS:
         try:
             return datetime.strptime(date_str, fmt).date()
         except ValueError:
@@ -107,20 +127,24 @@ def get_transactions_between_dates(
             "total_amount": float,
             "transaction_count": int,
             "category_breakdown": dict[str, float],
+            "category_breakdown_truncated": bool,
+            "other_categories_total": float,
             "daily_average": float
         }
+        category_breakdown lists the largest categories; when there are
+        more, category_breakdown_truncated is true and the remaining ones
+        are summed in other_categories_total.
     """
-    logger.info(f"Tool called: get_transactions_between_dates(start_date={start_date}, end_date={end_date}, limit={limit})")
+    logger.info("Tool called: get_transactions_between_dates(start_date=%s, end_date=%s, limit=%s)", start_date, end_date, limit)
     
     try:
-        session = get_session()
-        user_id = get_user_id()
+        session, user_id = get_ctx()
         
         # Parse dates
         try:
             start = parse_date_string(start_date)
         except ValueError as e:
-            logger.error(f"Invalid start_date format: {start_date}")
+            logger.error("Invalid start_date format: %s", start_date)
             return {
                 "error": "Invalid date format",
                 "message": f"Could not parse start_date '{start_date}'. Please use YYYY-MM-DD format.",
@@ -134,7 +158,7 @@ def get_transactions_between_dates(
             try:
                 end = parse_date_string(end_date)
             except ValueError as e:
-                logger.error(f"Invalid end_date format: {end_date}")
+                logger.error("Invalid end_date format: %s", end_date)
                 return {
                     "error": "Invalid date format",
                     "message": f"Could not parse end_date '{end_date}'. Please use YYYY-MM-DD format.",
@@ -147,27 +171,51 @@ def get_transactions_between_dates(
         
         # Ensure start is before or equal to end
         if start > end:
-            logger.warning(f"start_date ({start}) is after end_date ({end}), swapping")
+            logger.warning("start_date (%s) is after end_date (%s), swapping", start, end)
             start, end = end, start
         
-        logger.info(f"Querying transactions for user={user_id}, date_range={start} to {end}")
+        logger.info("Querying transactions for user=%s, date_range=%s to %s", user_id, start, end)
         
-        # Query transactions within date range
+        # Query transactions within date range; the window count reports the
+        # total number of matches (before LIMIT) in the same round-trip
         txn_query = (
-            select(Transaction)
-            .join(Account, Transaction.account_id == Account.id)
-            .where(Account.user_id == user_id)
+            select(
+                Transaction.id,
+                Transaction.amount,
+                Transaction.auth_date,
+                Transaction.merchant_name,
+                Transaction.category,
+                func.count().over().label("total_count"),
+            )
+            .where(Transaction.account_id.in_(user_account_ids(user_id)))
             .where(Transaction.auth_date >= start)
             .where(Transaction.auth_date <= end)
-            .where(Transaction.pending == False)
+            .where(Transaction.pending.is_(False))
             .order_by(Transaction.auth_date.desc())
             .limit(limit)
+            .execution_options(yield_per=FETCH_BATCH_SIZE)
         )
         
-        transactions = session.exec(txn_query).all()
+        # Stream rows and format + aggregate them in a single pass
+        total_amount = Decimal(0)
+        category_totals: dict[str, Decimal] = {}
+        formatted_transactions: list[dict[str, Any]] = []
+        total_count = 0
+        for txn in session.exec(txn_query):
+            total_count = txn.total_count
+            total_amount += txn.amount
+            category = txn.category if txn.category else "Uncategorized"
+            category_totals[category] = category_totals.get(category, Decimal(0)) + txn.amount
+            formatted_transactions.append({
+                "id": str(txn.id),
+                "amount": float(txn.amount),
+                "date": txn.auth_date.isoformat(),
+                "merchant": txn.merchant_name,
+                "category": txn.category,
+            })
         
-        if not transactions:
-            logger.warning(f"No transactions found between {start} and {end}")
+        if not formatted_transactions:
+            logger.warning("No transactions found between %s and %s", start, end)
             return {
                 "start_date": start.isoformat(),
                 "end_date": end.isoformat(),
@@ -179,47 +227,20 @@ def get_transactions_between_dates(
                 "message": f"No transactions found between {start} and {end}."
             }
         
-        # Calculate total amount
-        total_amount = sum(txn.amount for txn in transactions)
-        
-        # Format transactions for response
-        formatted_transactions = [
-            {
-                "id": str(txn.id),
-                "amount": float(txn.amount),
-                "date": txn.auth_date.isoformat(),
-                "merchant": txn.merchant_name,
-                "category": txn.category,
-            }
-            for txn in transactions
-        ]
-        
-        # Calculate category breakdown
-        category_totals: dict[str, float] = {}
-        for txn in transactions:
-            category = txn.category if txn.category else "Uncategorized"
-            category_totals[category] = category_totals.get(category, 0.0) + txn.amount
-        
-        # Sort categories by amount
-        category_breakdown = dict(sorted(category_totals.items(), key=lambda x: x[1], reverse=True))
+        # Itemize the largest categories, ordered by amount; the rest are
+        # reported as one total so the breakdown still adds up
+        top_categories = heapq.nlargest(
+            MAX_BREAKDOWN_CATEGORIES, category_totals.items(), key=itemgetter(1)
+        )
+        other_categories_total = total_amount - sum(
+            (amount for _, amount in top_categories), Decimal(0)
+        )
         
         # Calculate daily average
         days_in_range = (end - start).days + 1  # +1 to include both start and end days
-        daily_average = total_amount / days_in_range if days_in_range > 0 else 0.0
-        
-        # Get total count (not limited)
-        count_query = (
-            select(func.count(Transaction.id))
-            .join(Account, Transaction.account_id == Account.id)
-            .where(Account.user_id == user_id)
-            .where(Transaction.auth_date >= start)
-            .where(Transaction.auth_date <= end)
-            .where(Transaction.pending == False)
-        )
-        
-        total_count = session.exec(count_query).one()
+        daily_average = total_amount / days_in_range if days_in_range > 0 else Decimal(0)
         
-        logger.info(f"Retrieved {len(formatted_transactions)} transactions between {start} and {end}, total: ${total_amount:.2f}")
+        logger.info("Retrieved %s transactions between %s and %s, total: $%.2f", len(formatted_transactions), start, end, total_amount)
         
         return {
             "start_date": start.isoformat(),
@@ -227,15 +248,17 @@ def get_transactions_between_dates(
             "days_in_range": days_in_range,
             "transactions": formatted_transactions,
             "transaction_count": len(formatted_transactions),
-            "total_transaction_count": int(total_count),
-            "total_amount": round(total_amount, 2),
-            "daily_average": round(daily_average, 2),
-            "category_breakdown": {k: round(v, 2) for k, v in category_breakdown.items()},
+            "total_transaction_count": total_count,
+            "total_amount": money(total_amount),
+            "daily_average": money(daily_average),
+            "category_breakdown": {k: money(v) for k, v in top_categories},
+            "category_breakdown_truncated": len(category_totals) > len(top_categories),
+            "other_categories_total": money(other_categories_total),
             "showing_limited": len(formatted_transactions) < total_count
         }
         
     except Exception as e:
-        logger.error(f"Error in get_transactions_between_dates: {e}", exc_info=True)
+        logger.error("Error in get_transactions_between_dates: %s", e, exc_info=True)
         return {
             "start_date": start_date,
             "end_date": end_date or "today",
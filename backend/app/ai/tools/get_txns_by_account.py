@@ -7,12 +7,20 @@ Use when user asks about spending or transactions in a specific account.
 
 import logging
 from datetime import date, timedelta
+from decimal import Decimal
 from typing import Any
 
 from langchain_core.tools import tool
+from sqlalchemy import bindparam
 from sqlmodel import select
 
-from app.ai.tools.base import get_session, get_user_id, register_tool
+from app.ai.tools.base import (
+    FETCH_BATCH_SIZE,
+    get_ctx,
+    ilike_pattern,
+    money,
+    register_tool,
+)
 from app.models import Account, Transaction
 
 logger = logging.getLogger(__name__)
@@ -66,32 +74,32 @@ def get_transactions_by_account(
             "date_range": {"start": date, "end": date}
         }
     """
-    logger.info(f"Tool called: get_transactions_by_account(account_type={account_type}, limit={limit}, days_back={days_back})")
+    logger.info("Tool called: get_transactions_by_account(account_type=%s, limit=%s, days_back=%s)", account_type, limit, days_back)
     
     try:
-        session = get_session()
-        user_id = get_user_id()
+        session, user_id = get_ctx()
         
         # Calculate date range
         end_date = date.today()
         start_date = end_date - timedelta(days=days_back)
         
-        # Normalize account type for flexible matching
-        account_type_normalized = account_type.lower().strip()
+        # Build an escaped pattern for flexible matching
+        account_pattern = ilike_pattern(account_type)
         
-        logger.info(f"Querying transactions for user={user_id}, account_type={account_type_normalized}, date_range={start_date} to {end_date}")
+        logger.info("Querying transactions for user=%s, account_type=%s, date_range=%s to %s", user_id, account_pattern, start_date, end_date)
         
         # First, find accounts of the specified type for this user
+        # Only id and name are needed, so skip loading full Account rows
         account_query = (
-            select(Account)
+            select(Account.id, Account.name)
             .where(Account.user_id == user_id)
-            .where(Account.name.ilike(f"%{account_type_normalized}%"))
+            .where(Account.name.ilike(account_pattern, escape="\\"))
         )
         
-        accounts = session.exec(account_query).all()
+        account_rows = session.exec(account_query).all()
         
-        if not accounts:
-            logger.warning(f"No accounts found for type: {account_type}")
+        if not account_rows:
+            logger.warning("No accounts found for type: %s", account_type)
             return {
                 "account_type": account_type,
                 "accounts_found": 0,
@@ -101,47 +109,53 @@ def get_transactions_by_account(
                 "message": f"No {account_type} accounts found for this user."
             }
         
-        account_ids = [account.id for account in accounts]
-        logger.info(f"Found {len(accounts)} accounts of type '{account_type}'")
+        account_ids = [row[0] for row in account_rows]
+        account_names = [row[1] for row in account_rows]
+        logger.info("Found %s accounts of type '%s'", len(account_ids), account_type)
         
-        # Query transactions for these accounts
+        # Query transactions for these accounts; the named expanding bind keeps
+        # one cached compiled statement regardless of how many accounts match
         txn_query = (
-            select(Transaction)
-            .where(Transaction.account_id.in_(account_ids))
+            select(
+                Transaction.id,
+                Transaction.amount,
+                Transaction.auth_date,
+                Transaction.merchant_name,
+                Transaction.category,
+                Transaction.account_id,
+            )
+            .where(Transaction.account_id.in_(bindparam("account_ids", expanding=True)))
             .where(Transaction.auth_date >= start_date)
             .where(Transaction.auth_date <= end_date)
-            .where(Transaction.pending == False)
+            .where(Transaction.pending.is_(False))
             .order_by(Transaction.auth_date.desc())
             .limit(limit)
+            .execution_options(yield_per=FETCH_BATCH_SIZE)
         )
         
-        transactions = session.exec(txn_query).all()
-        
-        # Calculate total amount
-        total_amount = sum(txn.amount for txn in transactions)
-        
-        # Format transactions for response
-        formatted_transactions = [
-            {
+        # Stream rows and format + total them in a single pass
+        total_amount = Decimal(0)
+        formatted_transactions: list[dict[str, Any]] = []
+        for txn in session.exec(txn_query, params={"account_ids": account_ids}):
+            total_amount += txn.amount
+            formatted_transactions.append({
                 "id": str(txn.id),
                 "amount": float(txn.amount),
                 "date": txn.auth_date.isoformat(),
                 "merchant": txn.merchant_name,
                 "category": txn.category,
                 "account_id": str(txn.account_id),
-            }
-            for txn in transactions
-        ]
+            })
         
-        logger.info(f"Retrieved {len(formatted_transactions)} transactions, total amount: ${total_amount:.2f}")
+        logger.info("Retrieved %s transactions, total amount: $%.2f", len(formatted_transactions), total_amount)
         
         return {
             "account_type": account_type,
-            "accounts_found": len(accounts),
-            "account_names": [acc.name for acc in accounts],
+            "accounts_found": len(account_ids),
+            "account_names": account_names,
             "transactions": formatted_transactions,
             "transaction_count": len(formatted_transactions),
-            "total_amount": round(total_amount, 2),
+            "total_amount": money(total_amount),
             "date_range": {
                 "start": start_date.isoformat(),
                 "end": end_date.isoformat()
@@ -149,7 +163,7 @@ def get_transactions_by_account(
         }
         
     except Exception as e:
-        logger.error(f"Error in get_transactions_by_account: {e}", exc_info=True)
+        logger.error("Error in get_transactions_by_account: %s", e, exc_info=True)
         return {
             "account_type": account_type,
             "accounts_found": 0,
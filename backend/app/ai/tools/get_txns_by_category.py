@@ -7,13 +7,32 @@ Use when user asks about spending in a specific category.
 
 import logging
 from datetime import date, timedelta
+from decimal import Decimal
 from typing import Any
 
 from langchain_core.tools import tool
+from sqlalchemy import (
+    Date,
+    Integer,
+    String,
+    Uuid,
+    cast,
+    literal,
+    literal_column,
+    null,
+    union_all,
+)
 from sqlmodel import func, select
 
-from app.ai.tools.base import get_session, get_user_id, register_tool
-from app.models import Account, Transaction
+from app.ai.tools.base import (
+    FETCH_BATCH_SIZE,
+    get_ctx,
+    ilike_pattern,
+    money,
+    register_tool,
+    user_account_ids,
+)
+from app.models import Transaction
 
 logger = logging.getLogger(__name__)
 
@@ -70,43 +89,127 @@ def get_transactions_by_category(
             "transactions": list[dict],
             "total_amount": float,
             "transaction_count": int,
+            "total_transaction_count": int,
+            "showing_limited": bool,
             "top_merchants": list[dict],
             "date_range": {"start": date, "end": date}
         }
     """
-    logger.info(f"Tool called: get_transactions_by_category(category={category}, limit={limit}, days_back={days_back})")
+    logger.info("Tool called: get_transactions_by_category(category=%s, limit=%s, days_back=%s)", category, limit, days_back)
     
     try:
-        session = get_session()
-        user_id = get_user_id()
+        session, user_id = get_ctx()
         
         # Calculate date range
         end_date = date.today()
         start_date = end_date - timedelta(days=days_back)
         
-        # Normalize category for flexible matching
-        category_normalized = category.lower().strip()
+        # Build an escaped pattern for flexible matching
+        category_pattern = ilike_pattern(category)
         
-        logger.info(f"Querying transactions for user={user_id}, category={category_normalized}, date_range={start_date} to {end_date}")
+        logger.info("Querying transactions for user=%s, category=%s, date_range=%s to %s", user_id, category_pattern, start_date, end_date)
         
-        # Query transactions with category filter
+        # Match transactions with category filter
         # Using ILIKE for case-insensitive partial matching
-        txn_query = (
-            select(Transaction)
-            .join(Account, Transaction.account_id == Account.id)
-            .where(Account.user_id == user_id)
-            .where(Transaction.category.ilike(f"%{category_normalized}%"))
+        matched = (
+            select(
+                Transaction.id,
+                Transaction.amount,
+                Transaction.auth_date,
+                Transaction.merchant_name,
+                Transaction.category,
+            )
+            .where(Transaction.account_id.in_(user_account_ids(user_id)))
+            .where(Transaction.category.ilike(category_pattern, escape="\\"))
             .where(Transaction.auth_date >= start_date)
             .where(Transaction.auth_date <= end_date)
-            .where(Transaction.pending == False)
-            .order_by(Transaction.auth_date.desc())
+            .where(Transaction.pending.is_(False))
+            .cte("matched")
+        )
+        
+        # Most recent transactions in the category
+        txn_rows = (
+            select(
+                literal("txn").label("row_type"),
+                matched.c.id,
+                matched.c.amount,
+                matched.c.auth_date,
+                matched.c.merchant_name,
+                matched.c.category,
+                cast(null(), Integer).label("txn_count"),
+            )
+            .order_by(matched.c.auth_date.desc())
             .limit(limit)
+            .subquery()
+        )
+        
+        # Top merchants for this category (for additional insights)
+        merchant_rows = (
+            select(
+                literal("merchant").label("row_type"),
+                cast(null(), Uuid).label("id"),
+                func.sum(matched.c.amount).label("amount"),
+                cast(null(), Date).label("auth_date"),
+                matched.c.merchant_name,
+                cast(null(), String).label("category"),
+                func.count().label("txn_count"),
+            )
+            .group_by(matched.c.merchant_name)
+            .order_by(func.sum(matched.c.amount).desc())
+            .limit(5)
+            .subquery()
+        )
+        
+        # Total and count over the whole window, not just the listed rows,
+        # aggregated by the database
+        total_row = select(
+            literal("total").label("row_type"),
+            cast(null(), Uuid).label("id"),
+            func.sum(matched.c.amount).label("amount"),
+            cast(null(), Date).label("auth_date"),
+            cast(null(), String).label("merchant_name"),
+            cast(null(), String).label("category"),
+            func.count().label("txn_count"),
+        )
+        
+        # Fetch all three in one round-trip; rows are told apart by row_type
+        combined_query = (
+            union_all(select(txn_rows), select(merchant_rows), total_row)
+            .order_by(
+                literal_column("row_type"),
+                literal_column("auth_date").desc().nulls_last(),
+                literal_column("amount").desc(),
+            )
+            .execution_options(yield_per=FETCH_BATCH_SIZE)
         )
         
-        transactions = session.exec(txn_query).all()
+        # Stream rows and format them in a single pass
+        total_amount: Decimal | None = None
+        total_count = 0
+        formatted_transactions: list[dict[str, Any]] = []
+        top_merchants: list[dict[str, Any]] = []
+        for row in session.exec(combined_query):
+            if row.row_type == "merchant":
+                top_merchants.append({
+                    "merchant": row.merchant_name,
+                    "total_spent": money(row.amount),
+                    "transaction_count": row.txn_count
+                })
+                continue
+            if row.row_type == "total":
+                total_amount = row.amount
+                total_count = row.txn_count
+                continue
+            formatted_transactions.append({
+                "id": str(row.id),
+                "amount": float(row.amount),
+                "date": row.auth_date.isoformat(),
+                "merchant": row.merchant_name,
+                "category": row.category,
+            })
         
-        if not transactions:
-            logger.warning(f"No transactions found for category: {category}")
+        if not formatted_transactions:
+            logger.warning("No transactions found for category: %s", category)
             return {
                 "category": category,
                 "transactions": [],
@@ -117,56 +220,15 @@ def get_transactions_by_category(
                 "message": f"No transactions found in category '{category}' for the specified period."
             }
         
-        # Calculate total amount
-        total_amount = sum(txn.amount for txn in transactions)
-        
-        # Format transactions for response
-        formatted_transactions = [
-            {
-                "id": str(txn.id),
-                "amount": float(txn.amount),
-                "date": txn.auth_date.isoformat(),
-                "merchant": txn.merchant_name,
-                "category": txn.category,
-            }
-            for txn in transactions
-        ]
-        
-        # Get top merchants for this category (for additional insights)
-        merchant_query = (
-            select(
-                Transaction.merchant_name,
-                func.sum(Transaction.amount).label("total"),
-                func.count(Transaction.id).label("count")
-            )
-            .join(Account, Transaction.account_id == Account.id)
-            .where(Account.user_id == user_id)
-            .where(Transaction.category.ilike(f"%{category_normalized}%"))
-            .where(Transaction.auth_date >= start_date)
-            .where(Transaction.auth_date <= end_date)
-            .where(Transaction.pending == False)
-            .group_by(Transaction.merchant_name)
-            .order_by(func.sum(Transaction.amount).desc())
-            .limit(5)
-        )
-        
-        merchant_results = session.exec(merchant_query).all()
-        top_merchants = [
-            {
-                "merchant": row.merchant_name,
-                "total_spent": round(float(row.total), 2),
-                "transaction_count": int(row.count)
-            }
-            for row in merchant_results
-        ]
-        
-        logger.info(f"Retrieved {len(formatted_transactions)} transactions in category '{category}', total: ${total_amount:.2f}")
+        logger.info("Retrieved %s transactions in category '%s', total: $%.2f", len(formatted_transactions), category, money(total_amount))
         
         return {
             "category": category,
             "transactions": formatted_transactions,
             "transaction_count": len(formatted_transactions),
-            "total_amount": round(total_amount, 2),
+            "total_transaction_count": total_count,
+            "total_amount": money(total_amount),
+            "showing_limited": len(formatted_transactions) < total_count,
             "top_merchants": top_merchants,
             "date_range": {
                 "start": start_date.isoformat(),
@@ -175,7 +237,7 @@ def get_transactions_by_category(
         }
         
     except Exception as e:
-        logger.error(f"Error in get_transactions_by_category: {e}", exc_info=True)
+        logger.error("Error in get_transactions_by_category: %s", e, exc_info=True)
         return {
             "category": category,
             "transactions": [],
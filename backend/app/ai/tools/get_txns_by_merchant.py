@@ -10,10 +10,18 @@ from datetime import date, timedelta
 from typing import Any
 
 from langchain_core.tools import tool
+from sqlalchemy import distinct, true
 from sqlmodel import func, select
 
-from app.ai.tools.base import get_session, get_user_id, register_tool
-from app.models import Account, Transaction
+from app.ai.tools.base import (
+    FETCH_BATCH_SIZE,
+    get_ctx,
+    ilike_pattern,
+    money,
+    register_tool,
+    user_account_ids,
+)
+from app.models import Transaction
 
 logger = logging.getLogger(__name__)
 
@@ -74,39 +82,71 @@ def get_transactions_by_merchant(
             "date_range": {"start": date, "end": date}
         }
     """
-    logger.info(f"Tool called: get_transactions_by_merchant(merchant_name={merchant_name}, limit={limit}, days_back={days_back})")
+    logger.info("Tool called: get_transactions_by_merchant(merchant_name=%s, limit=%s, days_back=%s)", merchant_name, limit, days_back)
     
     try:
-        session = get_session()
-        user_id = get_user_id()
+        session, user_id = get_ctx()
         
         # Calculate date range
         end_date = date.today()
         start_date = end_date - timedelta(days=days_back)
         
-        # Normalize merchant name for flexible matching
-        merchant_normalized = merchant_name.lower().strip()
+        # Build an escaped pattern for flexible matching
+        merchant_pattern = ilike_pattern(merchant_name)
         
-        logger.info(f"Querying transactions for user={user_id}, merchant={merchant_normalized}, date_range={start_date} to {end_date}")
+        logger.info("Querying transactions for user=%s, merchant=%s, date_range=%s to %s", user_id, merchant_pattern, start_date, end_date)
         
-        # Query transactions with merchant filter
+        # Match transactions with merchant filter
         # Using ILIKE for case-insensitive partial matching
-        txn_query = (
-            select(Transaction)
-            .join(Account, Transaction.account_id == Account.id)
-            .where(Account.user_id == user_id)
-            .where(Transaction.merchant_name.ilike(f"%{merchant_normalized}%"))
+        matched = (
+            select(
+                Transaction.id,
+                Transaction.amount,
+                Transaction.auth_date,
+                Transaction.merchant_name,
+                Transaction.category,
+            )
+            .where(Transaction.account_id.in_(user_account_ids(user_id)))
+            .where(Transaction.merchant_name.ilike(merchant_pattern, escape="\\"))
             .where(Transaction.auth_date >= start_date)
             .where(Transaction.auth_date <= end_date)
-            .where(Transaction.pending == False)
-            .order_by(Transaction.auth_date.desc())
+            .where(Transaction.pending.is_(False))
+            .cte("matched")
+        )
+        
+        # Summary statistics over all matches, not just the limited rows
+        summary = select(
+            func.count().label("total_count"),
+            func.sum(matched.c.amount).label("total_amount"),
+            func.avg(matched.c.amount).label("average_amount"),
+            func.array_agg(distinct(matched.c.category))
+            .filter(matched.c.category != "")
+            .label("categories"),
+        ).subquery("summary")
+        
+        # Most recent matches, each carrying the single summary row
+        txn_query = (
+            select(*matched.c, *summary.c)
+            .select_from(matched)
+            .join(summary, true())
+            .order_by(matched.c.auth_date.desc())
             .limit(limit)
+            .execution_options(yield_per=FETCH_BATCH_SIZE)
         )
         
-        transactions = session.exec(txn_query).all()
+        formatted_transactions: list[dict[str, Any]] = []
+        row = None
+        for row in session.exec(txn_query):
+            formatted_transactions.append({
+                "id": str(row.id),
+                "amount": float(row.amount),
+                "date": row.auth_date.isoformat(),
+                "merchant": row.merchant_name,
+                "category": row.category,
+            })
         
-        if not transactions:
-            logger.warning(f"No transactions found for merchant: {merchant_name}")
+        if row is None:
+            logger.warning("No transactions found for merchant: %s", merchant_name)
             return {
                 "merchant_name": merchant_name,
                 "transactions": [],
@@ -118,47 +158,20 @@ def get_transactions_by_merchant(
                 "message": f"No transactions found for merchant '{merchant_name}' in the specified period."
             }
         
-        # Calculate statistics
-        total_amount = sum(txn.amount for txn in transactions)
-        average_amount = total_amount / len(transactions) if transactions else 0.0
-        
-        # Extract unique categories
-        categories = list(set(txn.category for txn in transactions if txn.category))
-        
-        # Format transactions for response
-        formatted_transactions = [
-            {
-                "id": str(txn.id),
-                "amount": float(txn.amount),
-                "date": txn.auth_date.isoformat(),
-                "merchant": txn.merchant_name,
-                "category": txn.category,
-            }
-            for txn in transactions
-        ]
-        
-        # Get total count (not limited) for summary
-        count_query = (
-            select(func.count(Transaction.id))
-            .join(Account, Transaction.account_id == Account.id)
-            .where(Account.user_id == user_id)
-            .where(Transaction.merchant_name.ilike(f"%{merchant_normalized}%"))
-            .where(Transaction.auth_date >= start_date)
-            .where(Transaction.auth_date <= end_date)
-            .where(Transaction.pending == False)
-        )
-        
-        total_count = session.exec(count_query).one()
+        total_count = row.total_count
+        total_amount = row.total_amount
+        average_amount = row.average_amount
+        categories = row.categories or []
         
-        logger.info(f"Retrieved {len(formatted_transactions)} transactions for merchant '{merchant_name}', total: ${total_amount:.2f}")
+        logger.info("Retrieved %s transactions for merchant '%s', total: $%.2f", len(formatted_transactions), merchant_name, total_amount)
         
         return {
             "merchant_name": merchant_name,
             "transactions": formatted_transactions,
             "transaction_count": len(formatted_transactions),
-            "total_transaction_count": int(total_count),
-            "total_amount": round(total_amount, 2),
-            "average_amount": round(average_amount, 2),
+            "total_transaction_count": total_count,
+            "total_amount": money(total_amount),
+            "average_amount": money(average_amount),
             "categories": categories,
             "date_range": {
                 "start": start_date.isoformat(),
@@ -168,7 +181,7 @@ def get_transactions_by_merchant(
         }
         
     except Exception as e:
-        logger.error(f"Error in get_transactions_by_merchant: {e}", exc_info=True)
+        logger.error("Error in get_transactions_by_merchant: %s", e, exc_info=True)
         return {
             "merchant_name": merchant_name,
             "transactions": [],
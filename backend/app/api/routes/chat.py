@@ -3,26 +3,29 @@ Chat endpoint for the Financial Assistant
 Provides streaming NDJSON responses for real-time chat experience
 """
 
-import asyncio
-import json
 import logging
 import uuid
+from collections.abc import AsyncIterator
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
-from langchain_core.messages import AIMessage, HumanMessage
-from pydantic import BaseModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from pydantic import BaseModel, PrivateAttr, field_validator
 
-from app.ai.agent import process_message
+from app.ai.agent import stream_message
 from app.ai.config import AIConfig
 from app.api.deps import CurrentUser, SessionDep
+from app.api.sse import SSE_HEADERS, SSE_PREFIX, SSE_SUFFIX, sse_event
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["chat"])
 
+# Start of a text-delta chunk, up to the JSON-encoded token
+SSE_DELTA_PREFIX = SSE_PREFIX + b'{"type":"text-delta","delta":'
 
 class ChatMessage(BaseModel):
     """Single message in a chat conversation
@@ -34,136 +37,130 @@ class ChatMessage(BaseModel):
     content: str | None = None
     parts: list[dict[str, Any]] | None = None
     
+    # Extracted text, filled in on the first get_content() call
+    _content_text: str | None = PrivateAttr(default=None)
+    
     def get_content(self) -> str:
         """Extract text content from either format"""
+        if self._content_text is None:
+            self._content_text = self._extract_content()
+        return self._content_text
+    
+    def _extract_content(self) -> str:
         if self.content:
             return self.content
-        if self.parts:
-            # Extract text from parts array (AI SDK format)
-            text_parts = [
-                part.get("text", "") 
-                for part in self.parts 
-                if isinstance(part, dict) and part.get("type") == "text"
-            ]
-            return "".join(text_parts)
-        return ""
+        if not self.parts:
+            return ""
+        # Extract text from parts array (AI SDK format); pydantic has
+        # already validated each part as a dict
+        return "".join(
+            part["text"]
+            for part in self.parts
+            if part.get("type") == "text" and "text" in part
+        )
 
 
 class ChatRequest(BaseModel):
-    """Request body for chat endpoint"""
+    """Request body for chat endpoint
+    Only the most recent AIConfig.MAX_CONVERSATION_HISTORY messages are kept
+    """
     messages: list[ChatMessage]
+    
+    @field_validator("messages", mode="before")
+    @classmethod
+    def keep_recent_messages(cls, value: Any) -> Any:
+        # Older history never reaches the agent, so drop it before the
+        # per-message validation runs
+        if isinstance(value, list):
+            return value[-AIConfig.MAX_CONVERSATION_HISTORY:]
+        return value
 
 
-async def generate_agent_response(
-    user_message: str, 
-    user_id: uuid.UUID,
-    session: SessionDep,
-    conversation_history: list[ChatMessage] | None = None
-) -> str:
+def build_agent_messages(
+    history: list[ChatMessage],
+    user_message: str
+) -> list[BaseMessage]:
     """
-    Generate response using the LangGraph agent
+    Convert chat history to LangChain messages for the agent
     
     Args:
+        history: Conversation history, already trimmed to the agent's window
         user_message: The user's input message
-        user_id: The authenticated user's UUID
-        session: Database session for querying financial data
-        conversation_history: Optional conversation history for context
         
     Returns:
-        Agent's response string
+        LangChain messages ending with the user's message
     """
-    logger.info(f"Generating agent response for user {user_id}: {user_message[:50]}...")
+    messages: list[BaseMessage] = []
+    for msg in history:
+        if msg.role == "user":
+            messages.append(HumanMessage(content=msg.get_content()))
+        elif msg.role == "assistant":
+            messages.append(AIMessage(content=msg.get_content()))
     
-    try:
-        # Check if AI is configured
-        if not AIConfig.validate_config():
-            logger.warning("AI not configured, falling back to mock response")
-            #return await generate_mock_response(user_message, user_id)
-        
-        # Convert conversation history to LangChain messages
-        messages = []
-        if conversation_history:
-            for msg in conversation_history[-AIConfig.MAX_CONVERSATION_HISTORY:]:
-                content = msg.get_content()
-                if msg.role == "user":
-                    messages.append(HumanMessage(content=content))
-                elif msg.role == "assistant":
-                    messages.append(AIMessage(content=content))
-        
-        # Add current message if not already in history
-        if not messages or messages[-1].content != user_message:
-            messages.append(HumanMessage(content=user_message))
-        
-        # Process through agent with database session
-        result = process_message(
-            user_id=user_id,
-            messages=messages,
-            session=session
-        )
-        
-        # Extract response
-        if result["messages"]:
-            response_message = result["messages"][-1]
-            response = response_message.content
-            
-            # Log response details for debugging
-            logger.info(f"Agent response message type: {type(response_message)}")
-            logger.info(f"Agent response content type: {type(response)}")
-            
-            # Handle case where content is a list (multi-part message)
-            if isinstance(response, list):
-                logger.warning(f"Response content is a list with {len(response)} items: {response}")
-                # Extract text from list of content blocks
-                text_parts = []
-                for item in response:
-                    if isinstance(item, dict) and "text" in item:
-                        text_parts.append(item["text"])
-                    elif isinstance(item, str):
-                        text_parts.append(item)
-                    else:
-                        logger.warning(f"Unexpected content item type: {type(item)}, value: {item}")
-                response = " ".join(text_parts) if text_parts else "I apologize, but I couldn't generate a proper response."
-                logger.info(f"Converted list response to string: {response[:100]}...")
-            
-            logger.info(f"Agent response generated: {len(response)} characters")
-            return response
-        else:
-            logger.error("No response from agent")
-            return "I apologize, but I couldn't generate a response. Please try again."
-            
-    except Exception as e:
-        logger.error(f"Error generating agent response: {e}", exc_info=True)
-        # Fallback to mock response on error
-        logger.info("Falling back to mock response due to error")
-      #  return await generate_mock_response(user_message, user_id)
+    # Add current message if the history doesn't already end with it
+    if not messages or messages[-1].content != user_message:
+        messages.append(HumanMessage(content=user_message))
+    
+    return messages
 
 
-async def generate_mock_response(user_message: str, user_id: uuid.UUID) -> str:
+async def generate_agent_response(
+    user_message: str, 
+    user_id: uuid.UUID,
+    session: SessionDep,
+    messages: list[BaseMessage]
+) -> AsyncIterator[str]:
     """
-    Generate a mock response based on the user's message
-    In production, this would call the LangChain agent with user data
+    Generate response using the LangGraph agent, streamed as it is produced
     
     Args:
         user_message: The user's input message
-        user_id: The authenticated user's ID
+        user_id: The authenticated user's UUID
+        session: Database session for querying financial data
+        messages: Conversation as LangChain messages, ending with user_message
         
-    Returns:
-        Mock response string
+    Yields:
+        Text deltas of the agent's response
     """
-    logger.info(f"Generating response for user {user_id}: {user_message[:50]}...")
+    logger.info(f"Generating agent response for user {user_id}: {user_message[:50]}...")
     
-    # Mock responses based on keywords
-    message_lower = user_message.lower()
+    # Check if AI is configured
+    if not AIConfig.validate_config():
+        logger.warning("AI not configured, the agent will likely fail")
+    
+    # Stream through agent with database session
+    response_length = 0
+    async for delta in stream_message(
+        user_id=user_id,
+        messages=messages,
+        session=session
+    ):
+        response_length += len(delta)
+        yield delta
     
-    if "groceries" in message_lower or "grocery" in message_lower:
-        return (
+    if not response_length:
+        logger.error("No response from agent")
+        yield "I apologize, but I couldn't generate a response. Please try again."
+        return
+    
+    logger.info(f"Agent response generated: {response_length} characters")
+
+
+# Canned replies for the mock fallback, checked in order; the first entry
+# with a keyword contained in the lowercased message wins
+MOCK_RESPONSES: tuple[tuple[tuple[str, ...], str], ...] = (
+    (
+        ("groceries", "grocery"),
+        (
             "Based on your transaction history, you spent approximately $342.50 "
             "on groceries last month. This represents about 18% of your total spending. "
             "Your main grocery stores were Whole Foods ($180), Trader Joe's ($95), "
             "and local markets ($67.50). Would you like to see a detailed breakdown?"
-        )
-    elif "category" in message_lower or "categories" in message_lower:
-        return (
+        ),
+    ),
+    (
+        ("category", "categories"),
+        (
             "Here's your spending breakdown by category:\n\n"
             "🏠 Housing: $1,850 (42%)\n"
             "🚗 Transportation: $450 (10%)\n"
@@ -173,9 +170,11 @@ async def generate_mock_response(user_message: str, user_id: uuid.UUID) -> str:
             "🎬 Entertainment: $240 (5%)\n"
             "💰 Other: $680 (15%)\n\n"
             "Your highest spending category is Housing at $1,850."
-        )
-    elif "compare" in message_lower or "comparison" in message_lower:
-        return (
+        ),
+    ),
+    (
+        ("compare", "comparison"),
+        (
             "Comparing your spending:\n\n"
             "📊 This month: $4,215\n"
             "📊 Last month: $3,890\n\n"
@@ -185,9 +184,11 @@ async def generate_mock_response(user_message: str, user_id: uuid.UUID) -> str:
             "• Entertainment increased by $95\n"
             "• Utilities increased by $50\n\n"
             "Would you like tips on reducing spending in these categories?"
-        )
-    elif "save" in message_lower or "saving" in message_lower:
-        return (
+        ),
+    ),
+    (
+        ("save", "saving"),
+        (
             "Great question about savings! 💰\n\n"
             "Based on your spending patterns, here are some recommendations:\n\n"
             "1. Reduce dining out by 20% → Save $136/month\n"
@@ -195,25 +196,49 @@ async def generate_mock_response(user_message: str, user_id: uuid.UUID) -> str:
             "3. Shop sales for groceries → Save $50/month\n\n"
             "Total potential savings: $231/month or $2,772/year!\n\n"
             "Would you like specific tips for any category?"
-        )
-    else:
-        return (
-            f"I understand you're asking about: '{user_message}'. "
-            "I'm your financial assistant and I can help you analyze your spending patterns, "
-            "compare expenses across time periods, identify saving opportunities, and more. "
-            "\n\nTry asking me about:\n"
-            "• Specific spending categories (e.g., 'How much did I spend on groceries?')\n"
-            "• Spending comparisons (e.g., 'Compare this month vs last month')\n"
-            "• Saving tips (e.g., 'How can I save money?')\n"
-            "• Category breakdowns (e.g., 'Show me my spending by category')"
-        )
+        ),
+    ),
+)
+
+
+async def generate_mock_response(user_message: str, user_id: uuid.UUID) -> str:
+    """
+    Generate a mock response based on the user's message
+    In production, this would call the LangChain agent with user data
+    
+    Args:
+        user_message: The user's input message
+        user_id: The authenticated user's ID
+        
+    Returns:
+        Mock response string
+    """
+    logger.info(f"Generating response for user {user_id}: {user_message[:50]}...")
+    
+    # Mock responses based on keywords
+    message_lower = user_message.lower()
+    
+    for keywords, response in MOCK_RESPONSES:
+        if any(keyword in message_lower for keyword in keywords):
+            return response
+    
+    return (
+        f"I understand you're asking about: '{user_message}'. "
+        "I'm your financial assistant and I can help you analyze your spending patterns, "
+        "compare expenses across time periods, identify saving opportunities, and more. "
+        "\n\nTry asking me about:\n"
+        "• Specific spending categories (e.g., 'How much did I spend on groceries?')\n"
+        "• Spending comparisons (e.g., 'Compare this month vs last month')\n"
+        "• Saving tips (e.g., 'How can I save money?')\n"
+        "• Category breakdowns (e.g., 'Show me my spending by category')"
+    )
 
 
 async def stream_response_generator(
     user_message: str, 
     user_id: uuid.UUID,
     session: SessionDep,
-    conversation_history: list[ChatMessage] | None = None
+    messages: list[BaseMessage]
 ):
     """
     Generate streaming NDJSON response in AI SDK format
@@ -228,63 +253,49 @@ async def stream_response_generator(
         user_message: The user's input message
         user_id: The authenticated user's ID
         session: Database session for querying financial data
+        messages: Conversation as LangChain messages, ending with user_message
         
     Yields:
         JSON chunks in NDJSON format (newline-delimited JSON)
     """
     try:
-        # Generate the full response using agent
-        full_response = await generate_agent_response(user_message, user_id, session, conversation_history)
-        
         # Generate a unique message ID
         message_id = str(uuid.uuid4())
         
         # Send text-start chunk (SSE format: data: prefix)
-        start_data = json.dumps({
+        yield sse_event({
             "type": "text-start",
             "id": message_id
         })
-        yield f"data: {start_data}\n\n".encode('utf-8')
         
-        # Stream the response token by token (word by word for better effect)
-        words = full_response.split(" ")
+        # Everything in a text-delta chunk but the token is fixed for this
+        # message, so only the token is JSON-encoded per chunk
+        delta_suffix = b',"id":' + orjson.dumps(message_id) + b"}" + SSE_SUFFIX
         
-        for i, word in enumerate(words):
-            # Add space before word (except for the first one)
-            token = word if i == 0 else f" {word}"
-            
+        # Forward the model's tokens as they arrive
+        async for token in generate_agent_response(user_message, user_id, session, messages):
             # Yield text-delta chunks (SSE format)
-            delta_data = json.dumps({
-                "type": "text-delta",
-                "delta": token,
-                "id": message_id
-            })
-            yield f"data: {delta_data}\n\n".encode('utf-8')
-            
-            # Small delay to simulate streaming (remove in production with real LLM)
-            await asyncio.sleep(0.05)
+            yield SSE_DELTA_PREFIX + orjson.dumps(token) + delta_suffix
         
         # Send text-end chunk to signal completion (SSE format)
         # Note: The AI SDK expects "text-end", not "text-done"
-        end_data = json.dumps({
+        yield sse_event({
             "type": "text-end",
             "id": message_id
         })
-        yield f"data: {end_data}\n\n".encode('utf-8')
         
         logger.info(f"Successfully streamed response to user {user_id}")
         
     except Exception as e:
-        logger.error(f"Error streaming response: {str(e)}", exc_info=True)
+        logger.error(f"Error streaming response: {str(e)}", exc_info=logger.isEnabledFor(logging.DEBUG))
         # Stream error response in AI SDK format
-        error_chunk = json.dumps({
+        yield orjson.dumps({
             "type": "error",
             "error": str(e)
-        }) + "\n"
-        yield error_chunk.encode('utf-8')
+        }) + b"\n"
 
 
-@router.post("/chat")
+@router.post("/chat", response_class=StreamingResponse)
 async def chat_endpoint(
     request: ChatRequest,
     current_user: CurrentUser,
@@ -334,15 +345,14 @@ async def chat_endpoint(
     # Log chat interaction
     logger.debug(f"User {current_user.id} message: {user_message[:100]}")
     
+    # The request already holds only the most recent messages; convert them
+    # once here
+    messages = build_agent_messages(request.messages, user_message)
+    
     # Return streaming response with conversation history and session for context
     # Use text/event-stream for SSE format (AI SDK expects this)
     return StreamingResponse(
-        stream_response_generator(user_message, current_user.id, session, request.messages),
+        stream_response_generator(user_message, current_user.id, session, messages),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",  # Disable proxy buffering
-            "Transfer-Encoding": "chunked",
-        }
+        headers=SSE_HEADERS,
     )
@@ -8,21 +8,32 @@ Endpoints:
 - GET /plaid/link-token: Generate a Plaid Link token for frontend initialization
 - POST /plaid/exchange-token: Exchange public token for access token
 - POST /plaid/sync: Sync transactions for all connected accounts
+- POST /plaid/sync/stream: Same sync, streaming per-item progress over SSE
 - GET /plaid/status: Check if user has connected Plaid accounts
+
+Endpoints that call the Plaid API are async and run the blocking orchestrator
+work with asyncio.to_thread, so slow Plaid round trips wait in the event
+loop's default executor instead of holding threads from the threadpool that
+serves every other sync endpoint.
 """
 
+import asyncio
 import logging
+import threading
+import uuid
+from collections.abc import AsyncIterator, Generator
 from datetime import datetime
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
 from app.api.deps import CurrentUser, SessionDep
+from app.api.sse import SSE_HEADERS, sse_event
 from app.core.sync_orchestrator import SyncOrchestrator, SyncOrchestratorError
 from app.models import (
     Message,
     PlaidExchangeRequest,
-    PlaidItemPublic,
     PlaidLinkTokenResponse,
     PlaidStatusResponse,
     PlaidSyncResponse,
@@ -35,7 +46,7 @@ router = APIRouter(prefix="/plaid", tags=["plaid"])
 
 
 @router.get("/link-token", response_model=PlaidLinkTokenResponse)
-def get_link_token(
+async def get_link_token(
     session: SessionDep,
     current_user: CurrentUser,
 ) -> Any:
@@ -62,7 +73,8 @@ def get_link_token(
         logger.info(f"Creating Plaid link token for user: {current_user.id}")
         
         orchestrator = SyncOrchestrator(session)
-        result = orchestrator.handle_link_token_request(
+        result = await asyncio.to_thread(
+            orchestrator.handle_link_token_request,
             user_id=current_user.id,
             client_name="WalletAI"
         )
@@ -92,7 +104,7 @@ def get_link_token(
     except Exception as e:
         logger.error(
             f"Unexpected error creating link token for user {current_user.id}: {e}",
-            exc_info=True
+            exc_info=logger.isEnabledFor(logging.DEBUG)
         )
         raise HTTPException(
             status_code=500,
@@ -101,7 +113,7 @@ def get_link_token(
 
 
 @router.post("/exchange-token", response_model=Message)
-def exchange_public_token(
+async def exchange_public_token(
     *,
     session: SessionDep,
     current_user: CurrentUser,
@@ -140,7 +152,8 @@ def exchange_public_token(
         )
         
         orchestrator = SyncOrchestrator(session)
-        result = orchestrator.handle_public_token_exchange(
+        result = await asyncio.to_thread(
+            orchestrator.handle_public_token_exchange,
             user_id=current_user.id,
             public_token=request.public_token,
             institution_name=request.institution_name,
@@ -170,7 +183,7 @@ def exchange_public_token(
     except Exception as e:
         logger.error(
             f"Unexpected error exchanging token for user {current_user.id}: {e}",
-            exc_info=True
+            exc_info=logger.isEnabledFor(logging.DEBUG)
         )
         raise HTTPException(
             status_code=500,
@@ -179,7 +192,7 @@ def exchange_public_token(
 
 
 @router.post("/sync", response_model=PlaidSyncResponse)
-def sync_transactions(
+async def sync_transactions(
     session: SessionDep,
     current_user: CurrentUser,
 ) -> Any:
@@ -209,7 +222,9 @@ def sync_transactions(
         logger.info(f"Syncing transactions for user: {current_user.id}")
         
         orchestrator = SyncOrchestrator(session)
-        result = orchestrator.sync_user_transactions(user_id=current_user.id)
+        result = await asyncio.to_thread(
+            orchestrator.sync_user_transactions, user_id=current_user.id
+        )
         
         if result["items_synced"] == 0:
             logger.warning(
@@ -249,7 +264,7 @@ def sync_transactions(
     except Exception as e:
         logger.error(
             f"Unexpected error syncing transactions for user {current_user.id}: {e}",
-            exc_info=True
+            exc_info=logger.isEnabledFor(logging.DEBUG)
         )
         raise HTTPException(
             status_code=500,
@@ -257,6 +272,151 @@ def sync_transactions(
         )
 
 
+def _run_syncs(
+    syncs: Generator[dict[str, Any], None, None],
+    loop: asyncio.AbstractEventLoop,
+    results: asyncio.Queue[dict[str, Any] | None],
+    stop: threading.Event,
+) -> None:
+    """
+    Drive a user's PlaidItem syncs on one worker thread.
+    
+    Each result is handed to the event loop through results. The generator
+    is advanced and closed on this thread only, so it is never closed while
+    still running; once stop is set, it is closed after the item in progress
+    finishes.
+    
+    Args:
+        syncs: The orchestrator's iter_user_transaction_syncs generator
+        loop: Event loop of the streaming response
+        results: Queue the results are put on, read by the event loop
+        stop: Set when the client has gone away
+    """
+    try:
+        for result in syncs:
+            loop.call_soon_threadsafe(results.put_nowait, result)
+            if stop.is_set():
+                break
+    finally:
+        syncs.close()
+
+
+async def sync_progress_generator(
+    orchestrator: SyncOrchestrator,
+    user_id: uuid.UUID,
+) -> AsyncIterator[bytes]:
+    """
+    Sync a user's PlaidItems and stream the progress as SSE chunks
+    
+    The PlaidItems are synced on one worker thread (see _run_syncs); each
+    result is sent as an "item-synced" event as soon as it finishes. A final
+    "sync-complete" event carries the totals, or an "error" event is sent
+    instead. If the user's transactions are already being synced (e.g. by
+    POST /sync), that sync's results are streamed once it finishes instead of
+    syncing twice.
+    
+    Args:
+        orchestrator: SyncOrchestrator bound to the request's session
+        user_id: ID of the user
+        
+    Yields:
+        SSE-framed JSON chunks
+    """
+    syncs = orchestrator.iter_user_transaction_syncs(user_id)
+    results: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+    stop = threading.Event()
+    worker = asyncio.ensure_future(asyncio.to_thread(
+        _run_syncs, syncs, asyncio.get_running_loop(), results, stop
+    ))
+    # None marks the end of the results, even if the worker failed
+    worker.add_done_callback(lambda _: results.put_nowait(None))
+    total_added = 0
+    total_modified = 0
+    total_removed = 0
+    items_synced = 0
+    
+    try:
+        while (result := await results.get()) is not None:
+            items_synced += 1
+            if result["success"]:
+                total_added += result["added_count"]
+                total_modified += result["modified_count"]
+                total_removed += result["removed_count"]
+            yield sse_event({"type": "item-synced", **result})
+        # Raises the error that ended the syncs, if any
+        await worker
+        
+        if items_synced == 0:
+            logger.warning(f"No Plaid items found for user: {user_id}")
+            yield sse_event({
+                "type": "error",
+                "error": "No connected bank accounts found. Please connect a bank account first.",
+            })
+            return
+        
+        logger.info(
+            f"Streamed transaction sync complete for user: {user_id}, "
+            f"items_synced: {items_synced}"
+        )
+        
+        yield sse_event({
+            "type": "sync-complete",
+            "total_added": total_added,
+            "total_modified": total_modified,
+            "total_removed": total_removed,
+            "items_synced": items_synced,
+        })
+        
+    except Exception as e:
+        logger.error(
+            f"Unexpected error streaming sync for user {user_id}: {e}",
+            exc_info=logger.isEnabledFor(logging.DEBUG)
+        )
+        yield sse_event({
+            "type": "error",
+            "error": "An unexpected error occurred while syncing transactions",
+        })
+    finally:
+        # On a disconnect the worker may still be syncing an item with the
+        # request's session; wait for it to stop and close the syncs. A
+        # second cancellation interrupts only the wait, not the worker
+        stop.set()
+        await asyncio.wait({worker})
+
+
+@router.post("/sync/stream", response_class=StreamingResponse)
+async def stream_sync_transactions(
+    session: SessionDep,
+    current_user: CurrentUser,
+) -> StreamingResponse:
+    """
+    Sync transactions for all connected Plaid accounts, streaming progress.
+    
+    Performs the same sync as POST /plaid/sync, but responds immediately
+    with a Server-Sent Events stream and reports each PlaidItem as it
+    finishes, so clients get feedback during long syncs and are not cut off
+    by proxy timeouts.
+    
+    Returns:
+        StreamingResponse with SSE content
+        
+    Example:
+        POST /api/v1/plaid/sync/stream
+        Response (SSE stream):
+            data: {"type":"item-synced","plaid_item_id":"...","institution_name":"Chase Bank","added_count":15,"modified_count":3,"removed_count":1,"success":true}
+            
+            data: {"type":"sync-complete","total_added":15,"total_modified":3,"total_removed":1,"items_synced":1}
+    """
+    logger.info(f"Streaming transaction sync for user: {current_user.id}")
+    
+    orchestrator = SyncOrchestrator(session)
+    return StreamingResponse(
+        sync_progress_generator(orchestrator, current_user.id),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
 @router.get("/status", response_model=PlaidStatusResponse)
 def get_plaid_status(
     session: SessionDep,
@@ -293,23 +453,11 @@ def get_plaid_status(
         logger.info(f"Checking Plaid status for user: {current_user.id}")
         
         orchestrator = SyncOrchestrator(session)
-        plaid_items = orchestrator.db_service.get_plaid_items_for_user(
+        items_public = orchestrator.db_service.get_plaid_item_summaries_for_user(
             user_id=current_user.id
         )
         
-        is_connected = len(plaid_items) > 0
-        
-        # Convert PlaidItem objects to PlaidItemPublic
-        items_public = [
-            PlaidItemPublic(
-                id=item.id,
-                user_id=item.user_id,
-                item_id=item.item_id,
-                institution_name=item.institution_name,
-                cursor=item.cursor,
-            )
-            for item in plaid_items
-        ]
+        is_connected = len(items_public) > 0
         
         logger.info(
             f"Plaid status retrieved for user: {current_user.id}, "
@@ -324,7 +472,7 @@ def get_plaid_status(
     except Exception as e:
         logger.error(
             f"Unexpected error checking Plaid status for user {current_user.id}: {e}",
-            exc_info=True
+            exc_info=logger.isEnabledFor(logging.DEBUG)
         )
         raise HTTPException(
             status_code=500,
@@ -41,10 +41,18 @@ def read_users(session: SessionDep, skip: int = 0, limit: int = 100) -> Any:
     count_statement = select(func.count()).select_from(User)
     count = session.exec(count_statement).one()
 
-    statement = select(User).offset(skip).limit(limit)
-    users = session.exec(statement).all()
+    # Only the public columns: no User instances (or password hashes) are
+    # loaded just to be serialized
+    statement = (
+        select(
+            User.id, User.email, User.is_active, User.is_superuser, User.full_name
+        )
+        .offset(skip)
+        .limit(limit)
+    )
 
-    return UsersPublic(data=users, count=count)
+    data = [UserPublic(**row._mapping) for row in session.exec(statement)]
+    return UsersPublic(data=data, count=count)
 
 
 @router.post(
@@ -0,0 +1,25 @@
+"""
+Server-Sent Events framing shared by the streaming endpoints
+"""
+
+from typing import Any
+
+import orjson
+
+# SSE framing around each JSON chunk, encoded once
+SSE_PREFIX = b"data: "
+SSE_SUFFIX = b"\n\n"
+
+# Response headers for SSE streams; Starlette copies them into each
+# response, so one shared mapping is safe
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",  # Disable proxy buffering
+    "Transfer-Encoding": "chunked",
+}
+
+
+def sse_event(payload: dict[str, Any]) -> bytes:
+    """Encode a payload as a single SSE data chunk"""
+    return SSE_PREFIX + orjson.dumps(payload) + SSE_SUFFIX
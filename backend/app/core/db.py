@@ -1,10 +1,83 @@
-from sqlmodel import Session, create_engine, select
+from sqlalchemy import Connection, text
+from sqlmodel import Session, SQLModel, create_engine, select
 
 from app import crud
 from app.core.config import settings
-from app.models import User, UserCreate
+from app.models import MONEY_DECIMAL_PLACES, MONEY_MAX_DIGITS, User, UserCreate
 
-engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+# Multi-row INSERTs executed with a list of parameter sets (the Plaid
+# upserts in DatabaseService) are sent as batched INSERT ... VALUES (...),
+# (...) statements of up to this many rows, keeping each batch well under
+# PostgreSQL's bind parameter limit
+INSERT_BATCH_SIZE = 1000
+
+# Connections per process. The image runs 4 workers, so this allows up to
+# 80 connections in total, under PostgreSQL's default max_connections of
+# 100, while covering the requests each worker's threadpool runs at once
+DB_POOL_SIZE = 10
+DB_MAX_OVERFLOW = 10
+# Reopen connections older than this, before servers or proxies drop them
+DB_POOL_RECYCLE_SECONDS = 1800
+
+engine = create_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    insertmanyvalues_page_size=INSERT_BATCH_SIZE,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=DB_POOL_RECYCLE_SECONDS,
+)
+
+
+# Columns created as double precision before money was stored as NUMERIC
+MONEY_COLUMNS = (("account", "current_balance"), ("transaction", "amount"))
+
+_COLUMN_DATA_TYPE = text(
+    "SELECT data_type FROM information_schema.columns "
+    "WHERE table_schema = current_schema() "
+    "AND table_name = :table AND column_name = :column"
+)
+
+
+def upgrade_schema(connection: Connection) -> None:
+    """
+    Bring tables created by an earlier create_all up to the current models.
+    
+    create_all only creates missing tables; it does not change the columns
+    or indexes of existing ones. Each step here is a no-op on a database
+    that is already up to date, so this runs on every start.
+    
+    Args:
+        connection: Connection to run the DDL on, inside a transaction
+    """
+    # gin_trgm_ops indexes need the extension, which is otherwise only
+    # created along with the transaction table
+    connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    
+    # Checked first: ALTER TABLE takes its ACCESS EXCLUSIVE lock before
+    # IF NOT EXISTS is evaluated, and would queue behind running syncs
+    accounts_refreshed_at_type = connection.execute(
+        _COLUMN_DATA_TYPE, {"table": "plaiditem", "column": "accounts_refreshed_at"}
+    ).scalar()
+    if accounts_refreshed_at_type is None:
+        connection.execute(text(
+            "ALTER TABLE plaiditem "
+            "ADD COLUMN accounts_refreshed_at TIMESTAMP WITH TIME ZONE"
+        ))
+    
+    for table, column in MONEY_COLUMNS:
+        data_type = connection.execute(
+            _COLUMN_DATA_TYPE, {"table": table, "column": column}
+        ).scalar()
+        if data_type == "double precision":
+            connection.execute(text(
+                f'ALTER TABLE "{table}" ALTER COLUMN {column} '
+                f"TYPE numeric({MONEY_MAX_DIGITS}, {MONEY_DECIMAL_PLACES})"
+            ))
+    
+    for model_table in SQLModel.metadata.sorted_tables:
+        for index in model_table.indexes:
+            index.create(connection, checkfirst=True)
 
 
 # make sure all SQLModel models are imported (app.models) before initializing DB
@@ -16,10 +89,11 @@ def init_db(session: Session) -> None:
     # Tables should be created with Alembic migrations
     # But if you don't want to use migrations, create
     # the tables un-commenting the next lines
-    from sqlmodel import SQLModel
 
     # This works because the models are already imported and registered from app.models
     SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        upgrade_schema(connection)
 
     user = session.exec(
         select(User).where(User.email == settings.FIRST_SUPERUSER)
@@ -7,29 +7,273 @@ This service handles all database operations for Plaid integration including:
 - Upserting transactions from Plaid data
 - Managing sync cursors
 - Handling removed transactions
+
+Account and transaction upserts execute one INSERT ... ON CONFLICT statement
+with a list of parameter sets. SQLAlchemy's "insertmanyvalues" mode sends
+these as multi-row VALUES batches whose size is set by the engine's
+insertmanyvalues_page_size (app.core.db.INSERT_BATCH_SIZE).
 """
 
 import logging
+import threading
 import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import date, datetime
-from typing import Any
+from typing import Any, Literal, overload
 
-from sqlmodel import Session, select
+from cachetools import TTLCache
+from sqlalchemy import (
+    DateTime,
+    String,
+    any_,
+    bindparam,
+    column,
+    delete,
+    func,
+    lambda_stmt,
+    literal_column,
+    table,
+    text,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, Insert, insert as pg_insert
+from sqlalchemy.sql import Select
+from sqlmodel import Session, SQLModel, select
 
 from app.models import (
     Account,
     AccountCreate,
     PlaidItem,
     PlaidItemCreate,
+    PlaidItemPublic,
     PlaidItemUpdate,
     Transaction,
     TransactionCreate,
 )
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Per-user PlaidItem summaries are cached briefly: the frontend polls the
+# status endpoint, often while a sync is running. Entries are dropped
+# whenever a user's PlaidItems change through this service.
+PLAID_ITEM_SUMMARY_TTL_SECONDS = 5
+_plaid_item_summary_cache = TTLCache(
+    maxsize=10_000, ttl=PLAID_ITEM_SUMMARY_TTL_SECONDS
+)
+_plaid_item_summary_lock = threading.Lock()
+
+# RETURNING column telling inserted rows from updated ones in an upsert:
+# PostgreSQL leaves xmax at 0 only for a freshly inserted row version
+UPSERT_INSERTED = literal_column("xmax = 0").label("inserted")
+
+
+def _upsert_statement(
+    model: type[SQLModel],
+    conflict_column: Any,
+    update_columns: list[str],
+    select_from: Select[Any] | None = None,
+) -> Insert:
+    """
+    INSERT ... ON CONFLICT (conflict_column) DO UPDATE of update_columns.
+    
+    The rows are bound as VALUES, or taken from select_from if given.
+    """
+    statement = pg_insert(model)
+    if select_from is not None:
+        statement = statement.from_select(
+            list(select_from.selected_columns.keys()), select_from
+        )
+    return statement.on_conflict_do_update(
+        index_elements=[conflict_column],
+        set_={column: statement.excluded[column] for column in update_columns},
+    )
+
+
+# The write statements on the sync path have a fixed shape, so they are
+# built once here and each call only binds its parameters, instead of
+# constructing a new statement (and its cache key) every time. The
+# upserts insert new rows and update existing ones; executed with a list
+# of rows they are sent as batched multi-VALUES statements (see
+# INSERT_BATCH_SIZE in app.core.db)
+_ACCOUNT_UPSERT = _upsert_statement(
+    Account,
+    Account.plaid_account_id,
+    ["name", "official_name", "type", "current_balance", "currency"],
+)
+_ACCOUNT_UPSERT_RETURNING_IDS = _ACCOUNT_UPSERT.returning(
+    Account.plaid_account_id, Account.id, UPSERT_INSERTED
+)
+_ACCOUNT_UPSERT_RETURNING_ROWS = _ACCOUNT_UPSERT.returning(
+    Account, UPSERT_INSERTED
+)
+_TRANSACTION_UPDATE_COLUMNS = [
+    "amount", "auth_date", "merchant_name", "pending", "category", "currency"
+]
+_TRANSACTION_UPSERT_RETURNING_ROWS = _upsert_statement(
+    Transaction, Transaction.plaid_transaction_id, _TRANSACTION_UPDATE_COLUMNS
+).returning(Transaction, UPSERT_INSERTED)
+# Bulk loads (see copy_transactions) COPY the rows into a temporary staging
+# table and land them with one INSERT ... SELECT upsert. The staging table
+# is dropped once loaded, or with the transaction if the load fails
+_TRANSACTION_COPY_COLUMNS = (
+    "id",
+    "account_id",
+    "plaid_transaction_id",
+    "amount",
+    "auth_date",
+    "merchant_name",
+    "pending",
+    "category",
+    "currency",
+)
+_TRANSACTION_STAGING_CREATE = text(
+    "CREATE TEMPORARY TABLE transaction_staging "
+    '(LIKE "transaction" INCLUDING DEFAULTS) ON COMMIT DROP'
+)
+_TRANSACTION_STAGING_COPY = (
+    f"COPY transaction_staging ({', '.join(_TRANSACTION_COPY_COLUMNS)}) FROM STDIN"
+)
+_TRANSACTION_STAGING_DROP = text("DROP TABLE transaction_staging")
+_TRANSACTION_UPSERT_FROM_STAGING = _upsert_statement(
+    Transaction,
+    Transaction.plaid_transaction_id,
+    _TRANSACTION_UPDATE_COLUMNS,
+    select_from=table(
+        "transaction_staging",
+        *(column(name) for name in _TRANSACTION_COPY_COLUMNS),
+    ).select(),
+)
+# The cursor is written in a single UPDATE; RETURNING hands back the
+# stored row, so the item is neither loaded first nor refreshed. The ORM's
+# "evaluate" session sync would read the parameters' build-time values,
+# so it is off; the returned row updates the session instead. A NULL
+# accounts_refreshed_at keeps the stored value
+_CURSOR_UPDATE = (
+    update(PlaidItem)
+    .where(PlaidItem.id == bindparam("plaid_item_id"))
+    .values(
+        cursor=bindparam("new_cursor"),
+        accounts_refreshed_at=func.coalesce(
+            bindparam("accounts_refreshed_at", type_=DateTime(timezone=True)),
+            PlaidItem.accounts_refreshed_at,
+        ),
+    )
+    .returning(PlaidItem)
+    .execution_options(synchronize_session=False)
+)
+# Records when an item's accounts were stored outside a sync (at link
+# time), returning the stored row like _CURSOR_UPDATE
+_ACCOUNTS_REFRESHED_UPDATE = (
+    update(PlaidItem)
+    .where(PlaidItem.id == bindparam("plaid_item_id"))
+    .values(
+        accounts_refreshed_at=bindparam(
+            "accounts_refreshed_at", type_=DateTime(timezone=True)
+        ),
+    )
+    .returning(PlaidItem)
+    .execution_options(synchronize_session=False)
+)
+# One set-based DELETE using the unique plaid_transaction_id index; the
+# ids are bound as a single array parameter (= ANY(:ids)), so any number
+# of them is one statement. Deleted rows are removed from the session by
+# their RETURNING primary keys ("fetch")
+_TRANSACTION_DELETE = (
+    delete(Transaction)
+    .where(
+        Transaction.plaid_transaction_id
+        == any_(bindparam("ids", type_=ARRAY(String)))
+    )
+    .execution_options(synchronize_session="fetch")
+)
+
+
+def _extract_category(txn_data: dict[str, Any]) -> str:
+    """Category of a Plaid transaction, from either payload shape."""
+    categories = txn_data.get("category", [])
+    if isinstance(categories, list) and categories:
+        return ", ".join(categories)
+    return txn_data.get("personal_finance_category", {}).get("primary", "Other")
+
+
+def _transaction_rows(
+    transactions: list[dict[str, Any]],
+    account_mapping: dict[str, uuid.UUID],
+) -> dict[str, dict[str, Any]]:
+    """
+    Build Transaction rows from Plaid data, keyed by plaid_transaction_id.
+    
+    Transactions without an ID or with an account missing from
+    account_mapping are skipped.
+    """
+    # One row per plaid_transaction_id; a repeated id keeps its last
+    # values, since ON CONFLICT cannot touch the same row twice
+    rows: dict[str, dict[str, Any]] = {}
+    # Bound once: the loop below runs once per transaction
+    get_account_id = account_mapping.get
+    
+    for txn_data in transactions:
+        plaid_transaction_id = txn_data.get("transaction_id")
+        plaid_account_id = txn_data.get("account_id")
+        
+        if not plaid_transaction_id:
+            logger.warning("Skipping transaction without transaction_id")
+            continue
+        
+        account_id = get_account_id(plaid_account_id) if plaid_account_id else None
+        if account_id is None:
+            # Lazy formatting: this runs once per skipped row
+            logger.warning(
+                "Skipping transaction %s: account_id %s not found in mapping",
+                plaid_transaction_id, plaid_account_id
+            )
+            continue
+        
+        # Extract transaction details
+        amount = txn_data.get("amount", 0.0)
+        
+        # Parse date; Plaid sends ISO 8601 dates (YYYY-MM-DD)
+        date_str = txn_data.get("date")
+        if isinstance(date_str, str):
+            auth_date = date.fromisoformat(date_str)
+        elif isinstance(date_str, date):
+            auth_date = date_str
+        else:
+            auth_date = date.today()
+        
+        merchant_name = txn_data.get("merchant_name") or txn_data.get("name", "Unknown")
+        pending = txn_data.get("pending", False)
+        
+        category = _extract_category(txn_data)
+        
+        currency = txn_data.get("iso_currency_code", "USD")
+        
+        rows[plaid_transaction_id] = {
+            "id": uuid.uuid4(),
+            "account_id": account_id,
+            "plaid_transaction_id": plaid_transaction_id,
+            "amount": amount,
+            "auth_date": auth_date,
+            "merchant_name": merchant_name,
+            "pending": pending,
+            "category": category,
+            "currency": currency,
+        }
+    
+    return rows
+
+
+def invalidate_plaid_item_summaries(user_id: uuid.UUID) -> None:
+    """
+    Drop the cached PlaidItem summaries for a user.
+    
+    Args:
+        user_id: ID of the user whose PlaidItems changed
+    """
+    with _plaid_item_summary_lock:
+        _plaid_item_summary_cache.pop(user_id, None)
+
 
 class DatabaseServiceError(Exception):
     """Base exception for database service errors."""
@@ -50,6 +294,9 @@ class DatabaseService:
     - Updating sync cursors for incremental syncs
     - Deleting removed transactions
     
+    Each write method commits on its own unless it runs inside
+    unit_of_work(), which commits all of them together.
+    
     All methods include comprehensive error handling and logging.
     """
     
@@ -61,8 +308,79 @@ class DatabaseService:
             session: SQLModel database session
         """
         self.session = session
+        self._in_unit_of_work = False
+        # Users whose cached summaries go stale when unit_of_work commits
+        self._pending_invalidations: set[uuid.UUID] = set()
         logger.info("DatabaseService initialized")
     
+    @contextmanager
+    def unit_of_work(self) -> Iterator[None]:
+        """
+        Run several write methods in a single database transaction.
+        
+        Inside the block the write methods only flush their changes; the
+        transaction is committed once when the block exits, or rolled back
+        if it raises, so either all of the writes are kept or none are.
+        
+        Example:
+            >>> with db_service.unit_of_work():
+            ...     db_service.upsert_transactions(transactions, account_mapping)
+            ...     db_service.update_sync_cursor(plaid_item_id, cursor)
+        """
+        if self._in_unit_of_work:
+            # Nested blocks join the outer transaction
+            yield
+            return
+        
+        self._in_unit_of_work = True
+        try:
+            yield
+            self._in_unit_of_work = False
+            self._commit()
+            # Only now are the changes visible to other sessions; dropping
+            # the summaries earlier would let a concurrent read cache the
+            # old values again
+            for user_id in self._pending_invalidations:
+                invalidate_plaid_item_summaries(user_id)
+        except Exception:
+            self.session.rollback()
+            raise
+        finally:
+            self._in_unit_of_work = False
+            self._pending_invalidations.clear()
+    
+    def _commit(self) -> None:
+        """
+        Commit a write, or only flush it inside unit_of_work().
+        
+        The commit does not expire the instances loaded in the session.
+        Upserted and updated rows come back fully populated by RETURNING;
+        letting the commit expire them would make the first attribute access
+        on each one issue its own SELECT to reload it.
+        """
+        if self._in_unit_of_work:
+            self.session.flush()
+            return
+        
+        expire_on_commit = self.session.expire_on_commit
+        self.session.expire_on_commit = False
+        try:
+            self.session.commit()
+        finally:
+            self.session.expire_on_commit = expire_on_commit
+    
+    def _invalidate_summaries(self, user_id: uuid.UUID) -> None:
+        """
+        Drop a user's cached PlaidItem summaries once the write is committed.
+        
+        Inside unit_of_work() the write has only been flushed, so the
+        summaries are dropped when the block commits instead.
+        """
+        if self._in_unit_of_work:
+            self._pending_invalidations.add(user_id)
+            return
+        invalidate_plaid_item_summaries(user_id)
+    
     def create_plaid_item(
         self,
         user_id: uuid.UUID,
@@ -96,8 +414,8 @@ class DatabaseService:
         """
         try:
             logger.info(
-                f"Creating PlaidItem for user_id: {user_id}, "
-                f"item_id: {item_id}, institution: {institution_name}"
+                "Creating PlaidItem for user_id: %s, item_id: %s, "
+                "institution: %s", user_id, item_id, institution_name
             )
             
             plaid_item_create = PlaidItemCreate(
@@ -114,10 +432,9 @@ class DatabaseService:
             self.session.add(plaid_item)
             self.session.commit()
             self.session.refresh(plaid_item)
+            invalidate_plaid_item_summaries(user_id)
             
-            logger.info(
-                f"PlaidItem created successfully, id: {plaid_item.id}"
-            )
+            logger.info("PlaidItem created successfully, id: %s", plaid_item.id)
             
             return plaid_item
             
@@ -147,13 +464,18 @@ class DatabaseService:
             ...     print(f"{item.institution_name}: {item.item_id}")
         """
         try:
-            logger.info(f"Retrieving PlaidItems for user_id: {user_id}")
+            logger.info("Retrieving PlaidItems for user_id: %s", user_id)
             
-            statement = select(PlaidItem).where(PlaidItem.user_id == user_id)
-            plaid_items = list(self.session.exec(statement).all())
+            # lambda_stmt builds the SELECT once per process and afterwards
+            # only re-binds user_id, skipping the construction and cache-key
+            # generation of a fresh select() on every call
+            statement = lambda_stmt(
+                lambda: select(PlaidItem).where(PlaidItem.user_id == user_id)
+            )
+            plaid_items = list(self.session.scalars(statement).all())
             
             logger.info(
-                f"Retrieved {len(plaid_items)} PlaidItems for user_id: {user_id}"
+                "Retrieved %d PlaidItems for user_id: %s", len(plaid_items), user_id
             )
             
             return plaid_items
@@ -163,6 +485,63 @@ class DatabaseService:
             logger.error(error_msg, exc_info=True)
             raise DatabaseServiceError(message=error_msg)
     
+    def get_plaid_item_summaries_for_user(
+        self, user_id: uuid.UUID
+    ) -> list[PlaidItemPublic]:
+        """
+        Retrieve the public view of all PlaidItems for a user.
+        
+        Selects only the columns exposed by PlaidItemPublic, so no ORM
+        instances (and no lazy-loaded relationships or access tokens) are
+        loaded while serializing the response. Results are cached per user
+        for PLAID_ITEM_SUMMARY_TTL_SECONDS.
+        
+        Args:
+            user_id: ID of the user
+            
+        Returns:
+            List of PlaidItemPublic instances
+            
+        Raises:
+            DatabaseServiceError: If retrieval fails
+        """
+        with _plaid_item_summary_lock:
+            cached = _plaid_item_summary_cache.get(user_id)
+        if cached is not None:
+            return list(cached)
+        
+        try:
+            logger.info("Retrieving PlaidItem summaries for user_id: %s", user_id)
+            
+            statement = select(
+                PlaidItem.id,
+                PlaidItem.user_id,
+                PlaidItem.item_id,
+                PlaidItem.institution_name,
+                PlaidItem.cursor,
+            ).where(PlaidItem.user_id == user_id)
+            
+            summaries = [
+                PlaidItemPublic(
+                    id=row.id,
+                    user_id=row.user_id,
+                    item_id=row.item_id,
+                    institution_name=row.institution_name,
+                    cursor=row.cursor,
+                )
+                for row in self.session.exec(statement)
+            ]
+            
+            with _plaid_item_summary_lock:
+                _plaid_item_summary_cache[user_id] = summaries
+            
+            return list(summaries)
+            
+        except Exception as e:
+            error_msg = f"Error retrieving PlaidItem summaries: {e}"
+            logger.error(error_msg, exc_info=True)
+            raise DatabaseServiceError(message=error_msg)
+    
     def get_plaid_item_by_id(self, plaid_item_id: uuid.UUID) -> PlaidItem | None:
         """
         Retrieve a PlaidItem by its ID.
@@ -177,15 +556,16 @@ class DatabaseService:
             DatabaseServiceError: If retrieval fails
         """
         try:
-            logger.info(f"Retrieving PlaidItem with id: {plaid_item_id}")
+            logger.info("Retrieving PlaidItem with id: %s", plaid_item_id)
             
-            statement = select(PlaidItem).where(PlaidItem.id == plaid_item_id)
-            plaid_item = self.session.exec(statement).first()
+            # Primary-key load: served from the identity map when the item is
+            # already in this session
+            plaid_item = self.session.get(PlaidItem, plaid_item_id)
             
             if plaid_item:
-                logger.info(f"PlaidItem found: {plaid_item.institution_name}")
+                logger.info("PlaidItem found: %s", plaid_item.institution_name)
             else:
-                logger.warning(f"PlaidItem not found with id: {plaid_item_id}")
+                logger.warning("PlaidItem not found with id: %s", plaid_item_id)
             
             return plaid_item
             
@@ -194,16 +574,36 @@ class DatabaseService:
             logger.error(error_msg, exc_info=True)
             raise DatabaseServiceError(message=error_msg)
     
+    @overload
+    def upsert_accounts(
+        self,
+        accounts: list[dict[str, Any]],
+        plaid_item_id: uuid.UUID,
+        user_id: uuid.UUID,
+        return_mapping: Literal[False] = False,
+    ) -> list[Account]: ...
+    
+    @overload
+    def upsert_accounts(
+        self,
+        accounts: list[dict[str, Any]],
+        plaid_item_id: uuid.UUID,
+        user_id: uuid.UUID,
+        return_mapping: Literal[True],
+    ) -> dict[str, uuid.UUID]: ...
+    
     def upsert_accounts(
         self,
         accounts: list[dict[str, Any]],
         plaid_item_id: uuid.UUID,
         user_id: uuid.UUID,
-    ) -> list[Account]:
+        return_mapping: bool = False,
+    ) -> list[Account] | dict[str, uuid.UUID]:
         """
         Upsert accounts from Plaid data.
         
-        This method performs insert or update operations based on plaid_account_id.
+        This method performs insert or update operations based on plaid_account_id
+        with a batched INSERT ... ON CONFLICT DO UPDATE statement.
         If an account with the same plaid_account_id exists, it is updated.
         Otherwise, a new account is created.
         
@@ -211,9 +611,12 @@ class DatabaseService:
             accounts: List of account dictionaries from Plaid API
             plaid_item_id: ID of the associated PlaidItem
             user_id: ID of the user who owns these accounts
+            return_mapping: Return only a plaid_account_id -> Account.id
+                mapping instead of Account instances
             
         Returns:
-            List of upserted Account instances
+            List of upserted Account instances, or the id mapping when
+            return_mapping is True
             
         Raises:
             DatabaseServiceError: If upsert fails
@@ -233,13 +636,18 @@ class DatabaseService:
             ...     accounts_data, plaid_item_id, user_id
             ... )
         """
+        if not accounts:
+            return {} if return_mapping else []
+        
         try:
             logger.info(
-                f"Upserting {len(accounts)} accounts for "
-                f"plaid_item_id: {plaid_item_id}"
+                "Upserting %d accounts for plaid_item_id: %s",
+                len(accounts), plaid_item_id
             )
             
-            upserted_accounts = []
+            # One row per plaid_account_id; a repeated id keeps its last
+            # values, since ON CONFLICT cannot touch the same row twice
+            rows: dict[str, dict[str, Any]] = {}
             
             for account_data in accounts:
                 plaid_account_id = account_data.get("account_id")
@@ -248,12 +656,6 @@ class DatabaseService:
                     logger.warning("Skipping account without account_id")
                     continue
                 
-                # Check if account already exists
-                statement = select(Account).where(
-                    Account.plaid_account_id == plaid_account_id
-                )
-                existing_account = self.session.exec(statement).first()
-                
                 # Extract account details
                 name = account_data.get("name", "")
                 official_name = account_data.get("official_name", name)
@@ -262,48 +664,65 @@ class DatabaseService:
                 current_balance = balances.get("current", 0.0)
                 currency = balances.get("iso_currency_code", "USD")
                 
-                if existing_account:
-                    # Update existing account
-                    logger.info(
-                        f"Updating existing account: {plaid_account_id}"
-                    )
-                    
-                    existing_account.name = name
-                    existing_account.official_name = official_name
-                    existing_account.type = account_type
-                    existing_account.current_balance = current_balance
-                    existing_account.currency = currency
-                    
-                    self.session.add(existing_account)
-                    upserted_accounts.append(existing_account)
-                else:
-                    # Create new account
-                    logger.info(
-                        f"Creating new account: {plaid_account_id}"
-                    )
-                    
-                    account = Account(
-                        user_id=user_id,
-                        plaid_item_id=plaid_item_id,
-                        plaid_account_id=plaid_account_id,
-                        name=name,
-                        official_name=official_name,
-                        type=account_type,
-                        current_balance=current_balance,
-                        currency=currency,
-                    )
-                    
-                    self.session.add(account)
-                    upserted_accounts.append(account)
+                rows[plaid_account_id] = {
+                    "id": uuid.uuid4(),
+                    "user_id": user_id,
+                    "plaid_item_id": plaid_item_id,
+                    "plaid_account_id": plaid_account_id,
+                    "name": name,
+                    "official_name": official_name,
+                    "type": account_type,
+                    "current_balance": current_balance,
+                    "currency": currency,
+                }
+            
+            if not rows:
+                logger.info("No accounts to upsert")
+                return {} if return_mapping else []
+            
+            # RETURNING hands back the stored rows, including existing ids
+            inserted_count = 0
+            
+            if return_mapping:
+                # Only the ids are needed, so no Account instances are built
+                account_mapping: dict[str, uuid.UUID] = {}
+                for plaid_account_id, account_id, inserted in self.session.execute(
+                    _ACCOUNT_UPSERT_RETURNING_IDS,
+                    list(rows.values()),
+                ).tuples():
+                    account_mapping[plaid_account_id] = account_id
+                    inserted_count += inserted
+                
+                self._commit()
+                
+                logger.info(
+                    "Successfully upserted %d accounts: %d inserted, %d updated",
+                    len(account_mapping), inserted_count,
+                    len(account_mapping) - inserted_count
+                )
+                
+                return account_mapping
             
-            self.session.commit()
+            upserted_by_plaid_id: dict[str, Account] = {}
+            for account, inserted in self.session.execute(
+                _ACCOUNT_UPSERT_RETURNING_ROWS,
+                list(rows.values()),
+                execution_options={"populate_existing": True},
+            ).tuples():
+                upserted_by_plaid_id[account.plaid_account_id] = account
+                inserted_count += inserted
+            
+            self._commit()
             
-            # Refresh all accounts to get IDs
-            for account in upserted_accounts:
-                self.session.refresh(account)
+            # RETURNING order is not guaranteed; keep the input order
+            upserted_accounts = [
+                upserted_by_plaid_id[plaid_account_id] for plaid_account_id in rows
+            ]
             
             logger.info(
-                f"Successfully upserted {len(upserted_accounts)} accounts"
+                "Successfully upserted %d accounts: %d inserted, %d updated",
+                len(upserted_accounts), inserted_count,
+                len(upserted_accounts) - inserted_count
             )
             
             return upserted_accounts
@@ -322,7 +741,8 @@ class DatabaseService:
         """
         Upsert transactions from Plaid data.
         
-        This method performs insert or update operations based on plaid_transaction_id.
+        This method performs insert or update operations based on plaid_transaction_id
+        with a batched INSERT ... ON CONFLICT DO UPDATE statement.
         If a transaction with the same plaid_transaction_id exists, it is updated.
         Otherwise, a new transaction is created.
         
@@ -354,103 +774,41 @@ class DatabaseService:
             ...     transactions_data, account_mapping
             ... )
         """
+        if not transactions:
+            return []
+        
         try:
-            logger.info(
-                f"Upserting {len(transactions)} transactions"
-            )
+            logger.info("Upserting %d transactions", len(transactions))
             
-            upserted_transactions = []
+            rows = _transaction_rows(transactions, account_mapping)
             
-            for txn_data in transactions:
-                plaid_transaction_id = txn_data.get("transaction_id")
-                plaid_account_id = txn_data.get("account_id")
-                
-                if not plaid_transaction_id:
-                    logger.warning("Skipping transaction without transaction_id")
-                    continue
-                
-                if not plaid_account_id or plaid_account_id not in account_mapping:
-                    logger.warning(
-                        f"Skipping transaction {plaid_transaction_id}: "
-                        f"account_id {plaid_account_id} not found in mapping"
-                    )
-                    continue
-                
-                account_id = account_mapping[plaid_account_id]
-                
-                # Check if transaction already exists
-                statement = select(Transaction).where(
-                    Transaction.plaid_transaction_id == plaid_transaction_id
-                )
-                existing_transaction = self.session.exec(statement).first()
-                
-                # Extract transaction details
-                amount = txn_data.get("amount", 0.0)
-                
-                # Parse date
-                date_str = txn_data.get("date")
-                if isinstance(date_str, str):
-                    auth_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-                elif isinstance(date_str, date):
-                    auth_date = date_str
-                else:
-                    auth_date = date.today()
-                
-                merchant_name = txn_data.get("merchant_name") or txn_data.get("name", "Unknown")
-                pending = txn_data.get("pending", False)
-                
-                # Extract category
-                categories = txn_data.get("category", [])
-                if isinstance(categories, list) and categories:
-                    category = ", ".join(categories)
-                else:
-                    category = txn_data.get("personal_finance_category", {}).get("primary", "Other")
-                
-                currency = txn_data.get("iso_currency_code", "USD")
-                
-                if existing_transaction:
-                    # Update existing transaction
-                    logger.debug(
-                        f"Updating existing transaction: {plaid_transaction_id}"
-                    )
-                    
-                    existing_transaction.amount = amount
-                    existing_transaction.auth_date = auth_date
-                    existing_transaction.merchant_name = merchant_name
-                    existing_transaction.pending = pending
-                    existing_transaction.category = category
-                    existing_transaction.currency = currency
-                    
-                    self.session.add(existing_transaction)
-                    upserted_transactions.append(existing_transaction)
-                else:
-                    # Create new transaction
-                    logger.debug(
-                        f"Creating new transaction: {plaid_transaction_id}"
-                    )
-                    
-                    transaction = Transaction(
-                        account_id=account_id,
-                        plaid_transaction_id=plaid_transaction_id,
-                        amount=amount,
-                        auth_date=auth_date,
-                        merchant_name=merchant_name,
-                        pending=pending,
-                        category=category,
-                        currency=currency,
-                    )
-                    
-                    self.session.add(transaction)
-                    upserted_transactions.append(transaction)
+            if not rows:
+                logger.info("No transactions to upsert")
+                return []
             
-            self.session.commit()
+            # RETURNING hands back the stored rows
+            upserted_by_plaid_id: dict[str, Transaction] = {}
+            inserted_count = 0
+            for transaction, inserted in self.session.execute(
+                _TRANSACTION_UPSERT_RETURNING_ROWS,
+                list(rows.values()),
+                execution_options={"populate_existing": True},
+            ).tuples():
+                upserted_by_plaid_id[transaction.plaid_transaction_id] = transaction
+                inserted_count += inserted
             
-            # Refresh all transactions to get IDs
-            for transaction in upserted_transactions:
-                self.session.refresh(transaction)
+            self._commit()
+            
+            # RETURNING order is not guaranteed; keep the input order
+            upserted_transactions = [
+                upserted_by_plaid_id[plaid_transaction_id]
+                for plaid_transaction_id in rows
+            ]
             
             logger.info(
-                f"Successfully upserted {len(upserted_transactions)} transactions"
+                "Successfully upserted %d transactions: %d inserted, %d updated",
+                len(upserted_transactions), inserted_count,
+                len(upserted_transactions) - inserted_count
             )
             
             return upserted_transactions
@@ -461,10 +819,80 @@ class DatabaseService:
             logger.error(error_msg, exc_info=True)
             raise DatabaseServiceError(message=error_msg)
     
+    def copy_transactions(
+        self,
+        transactions: list[dict[str, Any]],
+        account_mapping: dict[str, uuid.UUID],
+    ) -> int:
+        """
+        Bulk upsert transactions from Plaid data with COPY.
+        
+        Meant for large loads such as an initial sync. The rows are
+        streamed into a temporary staging table with COPY, then upserted
+        into the transaction table by a single INSERT ... SELECT ... ON
+        CONFLICT DO UPDATE. Rows are built and skipped as in
+        upsert_transactions, but no Transaction instances are loaded.
+        
+        Args:
+            transactions: List of transaction dictionaries from Plaid API
+            account_mapping: Mapping from plaid_account_id to Account.id
+            
+        Returns:
+            Number of transactions inserted or updated
+            
+        Raises:
+            DatabaseServiceError: If the load fails
+            
+        Example:
+            >>> db_service = DatabaseService(session)
+            >>> count = db_service.copy_transactions(
+            ...     transactions_data, account_mapping
+            ... )
+        """
+        if not transactions:
+            return 0
+        
+        try:
+            logger.info("Copying %d transactions", len(transactions))
+            
+            rows = _transaction_rows(transactions, account_mapping)
+            
+            if not rows:
+                logger.info("No transactions to copy")
+                return 0
+            
+            self.session.execute(_TRANSACTION_STAGING_CREATE)
+            # COPY goes through the psycopg connection of the session's
+            # transaction, so it sees the staging table
+            driver_connection = self.session.connection().connection.driver_connection
+            with driver_connection.cursor() as cursor:
+                with cursor.copy(_TRANSACTION_STAGING_COPY) as copy:
+                    for row in rows.values():
+                        copy.write_row(
+                            [row[name] for name in _TRANSACTION_COPY_COLUMNS]
+                        )
+            upserted_count = self.session.execute(
+                _TRANSACTION_UPSERT_FROM_STAGING
+            ).rowcount
+            self.session.execute(_TRANSACTION_STAGING_DROP)
+            
+            self._commit()
+            
+            logger.info("Successfully copied %d transactions", upserted_count)
+            
+            return upserted_count
+            
+        except Exception as e:
+            self.session.rollback()
+            error_msg = f"Error copying transactions: {e}"
+            logger.error(error_msg, exc_info=True)
+            raise DatabaseServiceError(message=error_msg)
+    
     def update_sync_cursor(
         self,
         plaid_item_id: uuid.UUID,
         cursor: str,
+        accounts_refreshed_at: datetime | None = None,
     ) -> PlaidItem:
         """
         Update the sync cursor for a PlaidItem.
@@ -475,6 +903,8 @@ class DatabaseService:
         Args:
             plaid_item_id: ID of the PlaidItem to update
             cursor: New cursor value from Plaid Transactions Sync API
+            accounts_refreshed_at: When the item's accounts were stored in
+                the same sync (left unchanged if None)
             
         Returns:
             Updated PlaidItem instance
@@ -489,26 +919,29 @@ class DatabaseService:
             ... )
         """
         try:
-            logger.info(
-                f"Updating sync cursor for plaid_item_id: {plaid_item_id}"
-            )
-            
-            statement = select(PlaidItem).where(PlaidItem.id == plaid_item_id)
-            plaid_item = self.session.exec(statement).first()
+            logger.info("Updating sync cursor for plaid_item_id: %s", plaid_item_id)
+            
+            plaid_item = self.session.scalars(
+                _CURSOR_UPDATE,
+                {
+                    "plaid_item_id": plaid_item_id,
+                    "new_cursor": cursor,
+                    "accounts_refreshed_at": accounts_refreshed_at,
+                },
+                execution_options={"populate_existing": True},
+            ).one_or_none()
             
             if not plaid_item:
                 raise DatabaseServiceError(
                     f"PlaidItem not found with id: {plaid_item_id}"
                 )
             
-            plaid_item.cursor = cursor
-            
-            self.session.add(plaid_item)
-            self.session.commit()
-            self.session.refresh(plaid_item)
+            self._commit()
+            self._invalidate_summaries(plaid_item.user_id)
             
             logger.info(
-                f"Sync cursor updated successfully for plaid_item_id: {plaid_item_id}"
+                "Sync cursor updated successfully for plaid_item_id: %s",
+                plaid_item_id
             )
             
             return plaid_item
@@ -521,6 +954,54 @@ class DatabaseService:
             logger.error(error_msg, exc_info=True)
             raise DatabaseServiceError(message=error_msg)
     
+    def set_accounts_refreshed_at(
+        self,
+        plaid_item_id: uuid.UUID,
+        accounts_refreshed_at: datetime,
+    ) -> PlaidItem:
+        """
+        Record when a PlaidItem's accounts were last stored from Plaid.
+        
+        Syncs record this along with the cursor (see update_sync_cursor);
+        this is for accounts stored outside a sync, when an item is linked.
+        
+        Args:
+            plaid_item_id: ID of the PlaidItem to update
+            accounts_refreshed_at: When the item's accounts were stored
+            
+        Returns:
+            Updated PlaidItem instance
+            
+        Raises:
+            DatabaseServiceError: If update fails or PlaidItem not found
+        """
+        try:
+            plaid_item = self.session.scalars(
+                _ACCOUNTS_REFRESHED_UPDATE,
+                {
+                    "plaid_item_id": plaid_item_id,
+                    "accounts_refreshed_at": accounts_refreshed_at,
+                },
+                execution_options={"populate_existing": True},
+            ).one_or_none()
+            
+            if not plaid_item:
+                raise DatabaseServiceError(
+                    f"PlaidItem not found with id: {plaid_item_id}"
+                )
+            
+            self._commit()
+            
+            return plaid_item
+            
+        except DatabaseServiceError:
+            raise
+        except Exception as e:
+            self.session.rollback()
+            error_msg = f"Error updating accounts refresh time: {e}"
+            logger.error(error_msg, exc_info=True)
+            raise DatabaseServiceError(message=error_msg)
+    
     def delete_transactions(
         self,
         transaction_ids: list[str],
@@ -545,29 +1026,18 @@ class DatabaseService:
             >>> count = db_service.delete_transactions(["txn-old-1", "txn-old-2"])
             >>> print(f"Deleted {count} transactions")
         """
+        if not transaction_ids:
+            return 0
+        
         try:
-            if not transaction_ids:
-                logger.info("No transactions to delete")
-                return 0
-            
-            logger.info(
-                f"Deleting {len(transaction_ids)} transactions"
-            )
-            
-            statement = select(Transaction).where(
-                Transaction.plaid_transaction_id.in_(transaction_ids)
-            )
-            transactions = list(self.session.exec(statement).all())
+            logger.info("Deleting %d transactions", len(transaction_ids))
             
-            for transaction in transactions:
-                self.session.delete(transaction)
+            deleted_count = self.session.execute(
+                _TRANSACTION_DELETE, {"ids": transaction_ids}
+            ).rowcount
             
-            self.session.commit()
-            
-            deleted_count = len(transactions)
-            logger.info(
-                f"Successfully deleted {deleted_count} transactions"
-            )
+            self._commit()
+            logger.info("Successfully deleted %d transactions", deleted_count)
             
             return deleted_count
             
@@ -577,6 +1047,39 @@ class DatabaseService:
             logger.error(error_msg, exc_info=True)
             raise DatabaseServiceError(message=error_msg)
     
+    def get_account_mapping(
+        self,
+        plaid_item_id: uuid.UUID,
+    ) -> dict[str, uuid.UUID]:
+        """
+        Map the Plaid account IDs of a PlaidItem's stored accounts to their IDs.
+        
+        Args:
+            plaid_item_id: ID of the PlaidItem
+            
+        Returns:
+            Dictionary mapping plaid_account_id to Account.id
+            
+        Raises:
+            DatabaseServiceError: If retrieval fails
+        """
+        try:
+            # Built once and re-bound per call (see get_plaid_items_for_user)
+            # Plain (plaid_account_id, id) rows, not Account instances, so
+            # the dict is built without loading ORM objects
+            statement = lambda_stmt(
+                lambda: select(Account.plaid_account_id, Account.id).where(
+                    Account.plaid_item_id == plaid_item_id,
+                    Account.plaid_account_id.is_not(None),
+                )
+            )
+            return dict(self.session.execute(statement).tuples().all())
+            
+        except Exception as e:
+            error_msg = f"Error retrieving account mapping: {e}"
+            logger.error(error_msg, exc_info=True)
+            raise DatabaseServiceError(message=error_msg)
+    
     def get_account_by_plaid_id(
         self,
         plaid_account_id: str,
@@ -594,10 +1097,13 @@ class DatabaseService:
             DatabaseServiceError: If retrieval fails
         """
         try:
-            statement = select(Account).where(
-                Account.plaid_account_id == plaid_account_id
+            # Built once and re-bound per call (see get_plaid_items_for_user)
+            statement = lambda_stmt(
+                lambda: select(Account).where(
+                    Account.plaid_account_id == plaid_account_id
+                )
             )
-            account = self.session.exec(statement).first()
+            account = self.session.scalars(statement).first()
             
             return account
             
@@ -8,12 +8,27 @@ This service handles all communication with the Plaid API including:
 - Syncing transactions using the Transactions Sync API
 """
 
+import atexit
+import functools
+import hashlib
 import logging
+import os
+import random
+import socket
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
+from itertools import chain
 from typing import Any
 
+import plaid
+import urllib3
+from cachetools import LRUCache
 from plaid import ApiException
 from plaid.api import plaid_api
+from plaid.model.accounts_get_request import AccountsGetRequest
 from plaid.model.country_code import CountryCode
 from plaid.model.item_public_token_exchange_request import (
     ItemPublicTokenExchangeRequest,
@@ -22,13 +37,84 @@ from plaid.model.link_token_create_request import LinkTokenCreateRequest
 from plaid.model.link_token_create_request_user import LinkTokenCreateRequestUser
 from plaid.model.products import Products
 from plaid.model.transactions_sync_request import TransactionsSyncRequest
+from urllib3.connection import HTTPConnection
 
 from app.core.config import settings
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Plaid API host for each PLAID_ENV setting
+PLAID_HOSTS = {
+    "sandbox": plaid.Environment.Sandbox,
+    "development": plaid.Environment.Sandbox,  # Use Sandbox for development
+    "production": plaid.Environment.Production,
+}
+
+# Connections kept open to Plaid, shared by every thread using the client.
+# Never smaller than the SDK's own default of cpu_count() * 5
+PLAID_CONNECTION_POOL_SIZE = max(32, (os.cpu_count() or 1) * 5)
+
+# urllib3's defaults (TCP_NODELAY) plus TCP keep-alive, so idle pooled
+# connections are not silently dropped between syncs
+PLAID_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+# How long cached account responses are served before calling Plaid again;
+# balances change slowly
+ACCOUNTS_CACHE_TTL_SECONDS = 30
+
+# Maximum number of cached account responses
+PLAID_RESPONSE_CACHE_SIZE = 1024
+
+# Link token settings; the SDK validates these models on construction, so
+# they are built once rather than on every request
+LINK_TOKEN_PRODUCTS = [Products("transactions"), Products("auth")]
+LINK_TOKEN_COUNTRY_CODES = [CountryCode("US")]
+
+# Retries of a rate-limited (HTTP 429) call, and the longest wait between them
+PLAID_RATE_LIMIT_MAX_RETRIES = 8
+PLAID_MAX_RETRY_DELAY_SECONDS = 60.0
+
+# (connect, read) timeouts in seconds for Plaid calls, so a hung connection
+# cannot hold a worker thread indefinitely. Sync pages can be large, so
+# they get longer to arrive
+PLAID_REQUEST_TIMEOUT = (3.0, 30.0)
+PLAID_SYNC_REQUEST_TIMEOUT = (3.0, 60.0)
+
+# Concurrent Plaid requests made by the *_batch methods
+PLAID_BATCH_MAX_WORKERS = 16
+
+# Bounds on one paginated sync, so a cursor that never reaches
+# has_more = False cannot keep a worker thread calling Plaid forever
+PLAID_SYNC_MAX_PAGES = 200
+PLAID_SYNC_MAX_EMPTY_PAGES = 3
+
+
+def _access_token_key(access_token: str) -> str:
+    """Cache key for an access token, so the token itself is not stored."""
+    return hashlib.blake2b(access_token.encode(), digest_size=16).hexdigest()
+
+
+def _retry_delay(error: ApiException, attempt: int) -> float:
+    """
+    Seconds to wait before retrying a rate-limited call.
+    
+    Honors the Retry-After header when it is given in seconds; otherwise
+    backs off exponentially with jitter.
+    
+    Args:
+        error: The 429 response
+        attempt: Number of retries already made
+    """
+    retry_after = (error.headers or {}).get("Retry-After")
+    if retry_after is not None:
+        try:
+            return min(float(retry_after), PLAID_MAX_RETRY_DELAY_SECONDS)
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+    return min(2 ** attempt + random.random(), PLAID_MAX_RETRY_DELAY_SECONDS)
+
 
 class PlaidServiceError(Exception):
     """Base exception for Plaid service errors."""
@@ -44,6 +130,11 @@ class PlaidAPIError(PlaidServiceError):
     pass
 
 
+class PlaidRateLimitError(PlaidAPIError):
+    """Exception raised when Plaid keeps rate limiting a call after retries."""
+    pass
+
+
 class PlaidService:
     """
     Service class for interacting with the Plaid API.
@@ -62,30 +153,106 @@ class PlaidService:
         Initialize the PlaidService with configuration from settings.
         
         Sets up the Plaid API client with appropriate credentials and environment.
+        The client keeps a pool of keep-alive connections, so reuse one
+        PlaidService (from get_plaid_service) rather than creating one per
+        request.
         """
-        import plaid
-        
-        # Map environment string to Plaid environment
-        env_map = {
-            "sandbox": plaid.Environment.Sandbox,
-            "development": plaid.Environment.Sandbox,  # Use Sandbox for development
-            "production": plaid.Environment.Production,
-        }
-        
         configuration = plaid.Configuration(
-            host=env_map[settings.PLAID_ENV],
+            host=PLAID_HOSTS[settings.PLAID_ENV],
             api_key={
                 "clientId": settings.PLAID_CLIENT_ID,
                 "secret": settings.PLAID_SECRET,
             }
         )
+        # Passed through to the client's urllib3 PoolManager
+        configuration.connection_pool_maxsize = PLAID_CONNECTION_POOL_SIZE
+        configuration.socket_options = PLAID_SOCKET_OPTIONS
         
         api_client = plaid.ApiClient(configuration)
+        atexit.register(api_client.close)
         self.client = plaid_api.PlaidApi(api_client)
         
-        logger.info(
-            f"PlaidService initialized with environment: {settings.PLAID_ENV}"
+        # Recent responses as (expires_at, response); expired entries are
+        # kept until evicted so they can stand in during Plaid outages
+        self._accounts_cache: LRUCache[str, tuple[float, dict[str, Any]]] = (
+            LRUCache(maxsize=PLAID_RESPONSE_CACHE_SIZE)
         )
+        # Plaid calls in progress, keyed like the cache; see get_accounts
+        self._accounts_inflight: dict[str, Future[dict[str, Any]]] = {}
+        self._cache_lock = threading.Lock()
+        
+        logger.info("PlaidService initialized with environment: %s", settings.PLAID_ENV)
+    
+    def _cache_get(
+        self,
+        cache: LRUCache[Any, tuple[float, dict[str, Any]]],
+        key: Any,
+        allow_expired: bool = False,
+    ) -> dict[str, Any] | None:
+        """
+        Look up a cached Plaid response.
+        
+        Args:
+            cache: The endpoint's response cache
+            key: Cache key of the request
+            allow_expired: Also return a response past its TTL
+            
+        Returns:
+            The cached response, or None if there is no usable entry
+        """
+        with self._cache_lock:
+            entry = cache.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if allow_expired or time.monotonic() < expires_at:
+            return response
+        return None
+    
+    def _cache_set(
+        self,
+        cache: LRUCache[Any, tuple[float, dict[str, Any]]],
+        key: Any,
+        response: dict[str, Any],
+        ttl: float,
+    ) -> None:
+        """Cache a Plaid response for ttl seconds."""
+        with self._cache_lock:
+            cache[key] = (time.monotonic() + ttl, response)
+    
+    def _call_with_backoff(
+        self,
+        call: Callable[..., Any],
+        request: Any,
+        timeout: tuple[float, float] = PLAID_REQUEST_TIMEOUT,
+    ) -> Any:
+        """
+        Call a Plaid endpoint, retrying rate-limited (HTTP 429) responses.
+        
+        Waits between attempts as given by _retry_delay; any other error,
+        or a 429 after PLAID_RATE_LIMIT_MAX_RETRIES retries, is raised.
+        
+        Args:
+            call: Bound PlaidApi method
+            request: Request model to pass to it
+            timeout: (connect, read) timeout in seconds for each attempt
+            
+        Returns:
+            The endpoint's response
+        """
+        for attempt in range(PLAID_RATE_LIMIT_MAX_RETRIES):
+            try:
+                return call(request, _request_timeout=timeout)
+            except ApiException as e:
+                if e.status != 429:
+                    raise
+                delay = _retry_delay(e, attempt)
+                logger.warning(
+                    "Plaid rate limit hit, retrying in %.1fs (retry %d of %d)",
+                    delay, attempt + 1, PLAID_RATE_LIMIT_MAX_RETRIES
+                )
+                time.sleep(delay)
+        return call(request, _request_timeout=timeout)
     
     def create_link_token(
         self,
@@ -96,7 +263,8 @@ class PlaidService:
         Create a link token for Plaid Link initialization.
         
         The link token is used by the frontend to initialize Plaid Link,
-        which allows users to connect their bank accounts.
+        which allows users to connect their bank accounts. A link token can
+        only be used once, so a new one is created on every call.
         
         Args:
             user_id: Unique identifier for the user
@@ -109,7 +277,7 @@ class PlaidService:
                 - request_id: Plaid request ID for tracking
                 
         Raises:
-            PlaidAPIError: If the Plaid API returns an error
+            PlaidAPIError: If the Plaid API returns an error or cannot be reached
             PlaidServiceError: For other service-level errors
             
         Example:
@@ -118,22 +286,24 @@ class PlaidService:
             >>> link_token = result["link_token"]
         """
         try:
-            logger.info(f"Creating link token for user_id: {user_id}")
+            logger.info("Creating link token for user_id: %s", user_id)
             
             request = LinkTokenCreateRequest(
                 user=LinkTokenCreateRequestUser(client_user_id=user_id),
                 client_name=client_name,
-                products=[Products("transactions"), Products("auth")],
-                country_codes=[CountryCode("US")],
+                products=LINK_TOKEN_PRODUCTS,
+                country_codes=LINK_TOKEN_COUNTRY_CODES,
                 language="en",
             )
             
-            response = self.client.link_token_create(request)
+            response = self.client.link_token_create(
+                request, _request_timeout=PLAID_REQUEST_TIMEOUT
+            )
             result = response.to_dict()
             
             logger.info(
-                f"Link token created successfully for user_id: {user_id}, "
-                f"request_id: {result.get('request_id')}"
+                "Link token created successfully for user_id: %s, request_id: %s",
+                user_id, result.get("request_id")
             )
             
             return {
@@ -144,11 +314,21 @@ class PlaidService:
             
         except ApiException as e:
             error_msg = f"Plaid API error creating link token: {e}"
-            logger.error(error_msg, exc_info=True)
+            logger.error(
+                error_msg,
+                exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
             raise PlaidAPIError(
                 message=error_msg,
                 error_code=getattr(e, "error_code", None)
             )
+        except urllib3.exceptions.HTTPError as e:
+            error_msg = f"Plaid request failed creating link token: {e}"
+            logger.error(
+                error_msg,
+                exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
+            raise PlaidAPIError(message=error_msg)
         except Exception as e:
             error_msg = f"Unexpected error creating link token: {e}"
             logger.error(error_msg, exc_info=True)
@@ -172,7 +352,7 @@ class PlaidService:
                 - request_id: Plaid request ID for tracking
                 
         Raises:
-            PlaidAPIError: If the Plaid API returns an error
+            PlaidAPIError: If the Plaid API returns an error or cannot be reached
             PlaidServiceError: For other service-level errors
             
         Example:
@@ -185,13 +365,14 @@ class PlaidService:
             logger.info("Exchanging public token for access token")
             
             request = ItemPublicTokenExchangeRequest(public_token=public_token)
-            response = self.client.item_public_token_exchange(request)
+            response = self.client.item_public_token_exchange(
+                request, _request_timeout=PLAID_REQUEST_TIMEOUT
+            )
             result = response.to_dict()
             
             logger.info(
-                f"Public token exchanged successfully, "
-                f"item_id: {result['item_id']}, "
-                f"request_id: {result.get('request_id')}"
+                "Public token exchanged successfully, item_id: %s, request_id: %s",
+                result["item_id"], result.get("request_id")
             )
             
             return {
@@ -202,11 +383,21 @@ class PlaidService:
             
         except ApiException as e:
             error_msg = f"Plaid API error exchanging public token: {e}"
-            logger.error(error_msg, exc_info=True)
+            logger.error(
+                error_msg,
+                exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
             raise PlaidAPIError(
                 message=error_msg,
                 error_code=getattr(e, "error_code", None)
             )
+        except urllib3.exceptions.HTTPError as e:
+            error_msg = f"Plaid request failed exchanging public token: {e}"
+            logger.error(
+                error_msg,
+                exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
+            raise PlaidAPIError(message=error_msg)
         except Exception as e:
             error_msg = f"Unexpected error exchanging public token: {e}"
             logger.error(error_msg, exc_info=True)
@@ -218,6 +409,9 @@ class PlaidService:
         
         Retrieves all accounts associated with the given access token,
         including account names, types, balances, and other metadata.
+        Responses are cached for ACCOUNTS_CACHE_TTL_SECONDS; if Plaid fails
+        with a server error, the last response is returned even if expired.
+        Concurrent calls for the same access token share one Plaid request.
         
         Args:
             access_token: Access token for the Plaid Item
@@ -235,7 +429,7 @@ class PlaidService:
                 - request_id: Plaid request ID for tracking
                 
         Raises:
-            PlaidAPIError: If the Plaid API returns an error
+            PlaidAPIError: If the Plaid API returns an error or cannot be reached
             PlaidServiceError: For other service-level errors
             
         Example:
@@ -244,39 +438,139 @@ class PlaidService:
             >>> for account in result["accounts"]:
             ...     print(f"{account['name']}: ${account['balances']['current']}")
         """
+        cache_key = _access_token_key(access_token)
+        cached = self._cache_get(self._accounts_cache, cache_key)
+        if cached is not None:
+            return cached
+        
+        # Single flight: concurrent cache misses for the same item wait for
+        # one Plaid call instead of each making their own
+        future: Future[dict[str, Any]] = Future()
+        with self._cache_lock:
+            pending = self._accounts_inflight.setdefault(cache_key, future)
+        if pending is not future:
+            return pending.result()
+        
         try:
-            logger.info("Fetching accounts from Plaid")
+            accounts = self._fetch_accounts(access_token, cache_key)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._cache_lock:
+                del self._accounts_inflight[cache_key]
+        
+        future.set_result(accounts)
+        return accounts
+    
+    def _fetch_accounts(self, access_token: str, cache_key: str) -> dict[str, Any]:
+        """
+        Fetch accounts from Plaid and cache the response.
+        
+        Args:
+            access_token: Access token for the Plaid Item
+            cache_key: Cache key of the access token
             
-            from plaid.model.accounts_get_request import AccountsGetRequest
+        Returns:
+            Same as get_accounts
+            
+        Raises:
+            PlaidAPIError: If the Plaid API returns an error or cannot be
+                reached, and no cached response can stand in
+            PlaidServiceError: For other service-level errors
+        """
+        try:
+            logger.info("Fetching accounts from Plaid")
             
             request = AccountsGetRequest(access_token=access_token)
-            response = self.client.accounts_get(request)
+            response = self.client.accounts_get(
+                request, _request_timeout=PLAID_REQUEST_TIMEOUT
+            )
             result = response.to_dict()
             
             logger.info(
-                f"Accounts fetched successfully, "
-                f"count: {len(result['accounts'])}, "
-                f"request_id: {result.get('request_id')}"
+                "Accounts fetched successfully, count: %d, request_id: %s",
+                len(result["accounts"]), result.get("request_id")
             )
             
-            return {
+            accounts = {
                 "accounts": result["accounts"],
                 "item": result.get("item"),
                 "request_id": result.get("request_id"),
             }
+            self._cache_set(
+                self._accounts_cache,
+                cache_key,
+                accounts,
+                ACCOUNTS_CACHE_TTL_SECONDS,
+            )
+            
+            return accounts
             
         except ApiException as e:
+            if (e.status or 0) >= 500:
+                stale = self._cache_get(
+                    self._accounts_cache, cache_key, allow_expired=True
+                )
+                if stale is not None:
+                    logger.warning(
+                        "Plaid API error fetching accounts (status %s), "
+                        "serving cached accounts", e.status
+                    )
+                    return stale
+            
             error_msg = f"Plaid API error fetching accounts: {e}"
-            logger.error(error_msg, exc_info=True)
+            logger.error(
+                error_msg,
+                exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
             raise PlaidAPIError(
                 message=error_msg,
                 error_code=getattr(e, "error_code", None)
             )
+        except urllib3.exceptions.HTTPError as e:
+            stale = self._cache_get(
+                self._accounts_cache, cache_key, allow_expired=True
+            )
+            if stale is not None:
+                logger.warning(
+                    "Plaid request failed fetching accounts (%s), "
+                    "serving cached accounts", e
+                )
+                return stale
+            
+            error_msg = f"Plaid request failed fetching accounts: {e}"
+            logger.error(
+                error_msg,
+                exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
+            raise PlaidAPIError(message=error_msg)
         except Exception as e:
             error_msg = f"Unexpected error fetching accounts: {e}"
             logger.error(error_msg, exc_info=True)
             raise PlaidServiceError(message=error_msg)
     
+    def get_accounts_batch(
+        self,
+        access_tokens: list[str],
+        max_workers: int = PLAID_BATCH_MAX_WORKERS,
+    ) -> dict[str, dict[str, Any] | PlaidServiceError]:
+        """
+        Fetch accounts for several Plaid Items concurrently.
+        
+        Meant for jobs that refresh many Items at once; each token is
+        fetched with get_accounts on a thread pool.
+        
+        Args:
+            access_tokens: Access tokens of the Plaid Items
+            max_workers: Maximum number of concurrent Plaid requests
+            
+        Returns:
+            Dictionary mapping each access token to its get_accounts result,
+            or to the PlaidServiceError raised for it
+        """
+        return self._run_batch(self.get_accounts, access_tokens, max_workers)
+    
     def sync_transactions(
         self,
         access_token: str,
@@ -306,7 +600,9 @@ class PlaidService:
                 - request_id: Plaid request ID for tracking
                 
         Raises:
-            PlaidAPIError: If the Plaid API returns an error
+            PlaidRateLimitError: If Plaid still rate limits the call after
+                PLAID_RATE_LIMIT_MAX_RETRIES retries
+            PlaidAPIError: If the Plaid API returns an error or cannot be reached
             PlaidServiceError: For other service-level errors
             
         Example:
@@ -322,9 +618,11 @@ class PlaidService:
             avoid re-fetching all historical data.
         """
         try:
-            logger.info(
-                f"Syncing transactions, cursor: {cursor[:20] if cursor else 'None'}..."
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Syncing transactions, cursor: %s...",
+                    cursor[:20] if cursor else None
+                )
             
             request_data = {
                 "access_token": access_token,
@@ -335,19 +633,13 @@ class PlaidService:
                 request_data["cursor"] = cursor
             
             request = TransactionsSyncRequest(**request_data)
-            response = self.client.transactions_sync(request)
-            result = response.to_dict()
-            
-            logger.info(
-                f"Transactions synced successfully, "
-                f"added: {len(result.get('added', []))}, "
-                f"modified: {len(result.get('modified', []))}, "
-                f"removed: {len(result.get('removed', []))}, "
-                f"has_more: {result.get('has_more', False)}, "
-                f"request_id: {result.get('request_id')}"
+            response = self._call_with_backoff(
+                self.client.transactions_sync,
+                request,
+                PLAID_SYNC_REQUEST_TIMEOUT,
             )
-            
-            return {
+            result = response.to_dict()
+            page = {
                 "added": result.get("added", []),
                 "modified": result.get("modified", []),
                 "removed": result.get("removed", []),
@@ -356,32 +648,142 @@ class PlaidService:
                 "request_id": result.get("request_id"),
             }
             
+            # Per-page detail; sync_all_transactions logs the totals
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Transactions synced successfully, added: %d, modified: %d, "
+                    "removed: %d, has_more: %s, request_id: %s",
+                    len(page["added"]),
+                    len(page["modified"]),
+                    len(page["removed"]),
+                    page["has_more"],
+                    page["request_id"],
+                )
+            
+            return page
+            
         except ApiException as e:
             error_msg = f"Plaid API error syncing transactions: {e}"
-            logger.error(error_msg, exc_info=True)
-            raise PlaidAPIError(
+            logger.error(
+                error_msg,
+                exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
+            error_class = PlaidRateLimitError if e.status == 429 else PlaidAPIError
+            raise error_class(
                 message=error_msg,
                 error_code=getattr(e, "error_code", None)
             )
+        except urllib3.exceptions.HTTPError as e:
+            error_msg = f"Plaid request failed syncing transactions: {e}"
+            logger.error(
+                error_msg,
+                exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
+            raise PlaidAPIError(message=error_msg)
         except Exception as e:
             error_msg = f"Unexpected error syncing transactions: {e}"
             logger.error(error_msg, exc_info=True)
             raise PlaidServiceError(message=error_msg)
     
+    def iter_sync_transactions(
+        self,
+        access_token: str,
+        cursor: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Sync all available transactions, yielding one page at a time.
+        
+        Calls sync_transactions with each page's next_cursor until Plaid
+        reports has_more = False. Callers can process each page as it
+        arrives instead of holding the whole sync in memory.
+        
+        The sync stops early, leaving has_more = True on the last page, if it
+        runs past PLAID_SYNC_MAX_PAGES pages, if Plaid returns a cursor it
+        already returned, or after PLAID_SYNC_MAX_EMPTY_PAGES pages in a row
+        with no changes.
+        
+        Args:
+            access_token: Access token for the Plaid Item
+            cursor: Optional cursor from previous sync
+            
+        Yields:
+            Each sync_transactions result, in order
+            
+        Raises:
+            PlaidRateLimitError: If Plaid keeps rate limiting a page
+            PlaidAPIError: If the Plaid API returns an error or cannot be reached
+            PlaidServiceError: For other service-level errors
+            
+        Example:
+            >>> service = PlaidService()
+            >>> for page in service.iter_sync_transactions("access-sandbox-xxx"):
+            ...     store(page["added"], page["modified"], page["removed"])
+            ...     cursor = page["next_cursor"]
+        """
+        current_cursor = cursor
+        seen_cursors = {cursor} if cursor else set()
+        empty_pages = 0
+        for _ in range(PLAID_SYNC_MAX_PAGES):
+            page = self.sync_transactions(
+                access_token=access_token,
+                cursor=current_cursor,
+            )
+            yield page
+            
+            if not page["has_more"]:
+                return
+            
+            if page["added"] or page["modified"] or page["removed"]:
+                empty_pages = 0
+            else:
+                empty_pages += 1
+            current_cursor = page["next_cursor"]
+            
+            if current_cursor in seen_cursors:
+                logger.warning(
+                    "Plaid returned a repeated sync cursor, stopping the sync"
+                )
+                return
+            if empty_pages >= PLAID_SYNC_MAX_EMPTY_PAGES:
+                logger.warning(
+                    "Plaid returned %d empty pages in a row, stopping the sync",
+                    empty_pages
+                )
+                return
+            seen_cursors.add(current_cursor)
+        
+        logger.warning(
+            "Transaction sync reached %d pages, stopping the sync",
+            PLAID_SYNC_MAX_PAGES
+        )
+    
     def sync_all_transactions(
         self,
         access_token: str,
         cursor: str | None = None,
+        on_page: Callable[[dict[str, Any]], None] | None = None,
     ) -> dict[str, Any]:
         """
         Sync all available transactions, handling pagination automatically.
         
-        This is a convenience method that calls sync_transactions repeatedly
-        until all available data has been fetched (has_more = False).
+        This is a convenience method that collects every page of
+        iter_sync_transactions until all available data has been fetched
+        (has_more = False).
+        
+        If on_page is given, each page is passed to it instead of being
+        collected, so the result's added/modified/removed lists are empty.
+        on_page runs in a worker thread, one page at a time and in order,
+        while the next page is fetched from Plaid.
+        
+        If Plaid keeps rate limiting a page after the first, or the sync is
+        stopped early by iter_sync_transactions, the pages fetched so far are
+        returned with has_more = True and the cursor after the last of them,
+        so the caller can store them and resume from there later.
         
         Args:
             access_token: Access token for the Plaid Item
             cursor: Optional cursor from previous sync
+            on_page: Optional callback that handles each page as it arrives
             
         Returns:
             Dictionary containing:
@@ -389,12 +791,15 @@ class PlaidService:
                 - modified: Aggregated list of all modified transactions
                 - removed: Aggregated list of all removed transaction objects
                 - next_cursor: Final cursor for future syncs
+                - has_more: Whether the sync stopped before reaching the end
                 - total_synced: Total number of transactions synced
                 - request_id: Last Plaid request ID
                 
         Raises:
-            PlaidAPIError: If the Plaid API returns an error
-            PlaidServiceError: For other service-level errors
+            PlaidRateLimitError: If the first page stays rate limited
+            PlaidAPIError: If the Plaid API returns an error or cannot be reached
+            PlaidServiceError: For other service-level errors, including
+                errors raised by on_page
             
         Example:
             >>> service = PlaidService()
@@ -403,55 +808,82 @@ class PlaidService:
             >>> # Save cursor for next sync
             >>> cursor = result["next_cursor"]
         """
+        # Pages are kept as-is and concatenated once after the loop,
+        # instead of regrowing the aggregate lists on every page
+        pages: list[dict[str, Any]] = []
+        iterations = added_count = modified_count = removed_count = 0
+        next_cursor, has_more, request_id = cursor, False, None
+        writer = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="plaid-page")
+            if on_page is not None
+            else None
+        )
+        pending: Future[None] | None = None
+        
         try:
             logger.info("Starting full transaction sync")
             
-            all_added = []
-            all_modified = []
-            all_removed = []
-            current_cursor = cursor
-            last_request_id = None
-            iteration = 0
-            
-            while True:
-                iteration += 1
-                result = self.sync_transactions(
-                    access_token=access_token,
-                    cursor=current_cursor,
+            try:
+                for page in self.iter_sync_transactions(access_token, cursor):
+                    iterations += 1
+                    next_cursor = page["next_cursor"]
+                    has_more = page["has_more"]
+                    request_id = page.get("request_id")
+                    added_count += len(page["added"])
+                    modified_count += len(page["modified"])
+                    removed_count += len(page["removed"])
+                    
+                    if writer is None:
+                        pages.append(page)
+                    else:
+                        # Wait for the previous page before handing over
+                        # this one; the next Plaid request overlaps it
+                        if pending is not None:
+                            pending.result()
+                        pending = writer.submit(on_page, page)
+                    
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Sync iteration %d: added=%d, modified=%d, "
+                            "removed=%d, has_more=%s",
+                            iterations,
+                            len(page["added"]),
+                            len(page["modified"]),
+                            len(page["removed"]),
+                            page["has_more"],
+                        )
+            except PlaidRateLimitError:
+                if iterations == 0:
+                    raise
+                logger.warning(
+                    "Plaid rate limit persisted after %d pages, "
+                    "returning the partial sync", iterations
                 )
-                
-                all_added.extend(result["added"])
-                all_modified.extend(result["modified"])
-                all_removed.extend(result["removed"])
-                current_cursor = result["next_cursor"]
-                last_request_id = result.get("request_id")
-                
-                logger.info(
-                    f"Sync iteration {iteration}: "
-                    f"added={len(result['added'])}, "
-                    f"modified={len(result['modified'])}, "
-                    f"removed={len(result['removed'])}, "
-                    f"has_more={result['has_more']}"
-                )
-                
-                if not result["has_more"]:
-                    break
             
-            total_synced = len(all_added) + len(all_modified) + len(all_removed)
+            if pending is not None:
+                pending.result()
+            
+            total_synced = added_count + modified_count + removed_count
             
             logger.info(
-                f"Full transaction sync complete, "
-                f"total_synced: {total_synced}, "
-                f"iterations: {iteration}"
+                "Full transaction sync complete, added: %d, modified: %d, "
+                "removed: %d, total_synced: %d, iterations: %d",
+                added_count, modified_count, removed_count,
+                total_synced, iterations
             )
             
             return {
-                "added": all_added,
-                "modified": all_modified,
-                "removed": all_removed,
-                "next_cursor": current_cursor,
+                "added": list(chain.from_iterable(page["added"] for page in pages)),
+                "modified": list(
+                    chain.from_iterable(page["modified"] for page in pages)
+                ),
+                "removed": list(
+                    chain.from_iterable(page["removed"] for page in pages)
+                ),
+                "next_cursor": next_cursor,
+                "has_more": has_more,
                 "total_synced": total_synced,
-                "request_id": last_request_id,
+                "request_id": request_id,
             }
             
         except PlaidAPIError:
@@ -462,7 +894,85 @@ class PlaidService:
             error_msg = f"Unexpected error in full transaction sync: {e}"
             logger.error(error_msg, exc_info=True)
             raise PlaidServiceError(message=error_msg)
+        finally:
+            if writer is not None:
+                writer.shutdown(wait=True)
+    
+    def sync_all_transactions_batch(
+        self,
+        cursors: dict[str, str | None],
+        max_workers: int = PLAID_BATCH_MAX_WORKERS,
+    ) -> dict[str, dict[str, Any] | PlaidServiceError]:
+        """
+        Run sync_all_transactions for several Plaid Items concurrently.
+        
+        Args:
+            cursors: Access token of each Plaid Item mapped to its stored
+                cursor, or None for an initial sync
+            max_workers: Maximum number of Items synced at once
+            
+        Returns:
+            Dictionary mapping each access token to its sync_all_transactions
+            result, or to the PlaidServiceError raised for it
+        """
+        return self._run_batch(
+            lambda access_token: self.sync_all_transactions(
+                access_token, cursors[access_token]
+            ),
+            list(cursors),
+            max_workers,
+        )
+    
+    def _run_batch(
+        self,
+        call: Callable[[str], dict[str, Any]],
+        access_tokens: list[str],
+        max_workers: int,
+    ) -> dict[str, dict[str, Any] | PlaidServiceError]:
+        """
+        Call a per-Item method for each access token on a thread pool.
+        
+        Args:
+            call: Method taking an access token
+            access_tokens: Access tokens to call it with
+            max_workers: Maximum number of concurrent calls
+            
+        Returns:
+            Dictionary mapping each access token to the call's result, or to
+            the PlaidServiceError it raised
+        """
+        if not access_tokens:
+            return {}
+        
+        results: dict[str, dict[str, Any] | PlaidServiceError] = {}
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(access_tokens)),
+            thread_name_prefix="plaid-batch",
+        ) as executor:
+            futures = {
+                executor.submit(call, access_token): access_token
+                for access_token in access_tokens
+            }
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except PlaidServiceError as e:
+                    results[futures[future]] = e
+        
+        logger.info(
+            "Plaid batch complete, items: %d, failed: %d",
+            len(results),
+            sum(isinstance(result, PlaidServiceError) for result in results.values()),
+        )
+        return results
 
 
-# Singleton instance for easy import
-plaid_service = PlaidService()
+@functools.lru_cache(maxsize=1)
+def get_plaid_service() -> PlaidService:
+    """
+    Return the process-wide PlaidService, creating it on first use.
+    
+    Sharing one instance shares its connection pool and response caches;
+    creating it lazily keeps importing this module free of client setup.
+    """
+    return PlaidService()
@@ -9,18 +9,45 @@ This orchestrator coordinates between PlaidService and DatabaseService to:
 """
 
 import logging
+import threading
 import uuid
-from typing import Any
+from collections.abc import Generator, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, NamedTuple
 
 from sqlmodel import Session
 
 from app.core.db_service import DatabaseService, DatabaseServiceError
-from app.core.plaid_service import PlaidService, PlaidServiceError
+from app.core.plaid_service import (
+    PlaidService,
+    PlaidServiceError,
+    get_plaid_service,
+)
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Threads making Plaid API calls for one user's sync; one per item
+PLAID_FETCH_MAX_WORKERS = 16
+
+# Stored accounts (and balances) younger than this are reused by an
+# incremental sync instead of being fetched from Plaid again
+ACCOUNTS_REFRESH_MAX_AGE = timedelta(hours=24)
+
+# User syncs in progress in this process; see sync_user_transactions and
+# iter_user_transaction_syncs
+_user_syncs_inflight: dict[uuid.UUID, Future[dict[str, Any]]] = {}
+_user_syncs_lock = threading.Lock()
+
+
+class PlaidItemUpdates(NamedTuple):
+    """Plaid API results for one PlaidItem sync."""
+    
+    transactions: dict[str, Any]
+    # None if the accounts were not fetched because no added or modified
+    # transactions need the account mapping
+    accounts: dict[str, Any] | None
+
 
 class SyncOrchestratorError(Exception):
     """Base exception for sync orchestrator errors."""
@@ -55,10 +82,11 @@ class SyncOrchestrator:
         
         Args:
             session: SQLModel database session
-            plaid_service: Optional PlaidService instance (creates new one if None)
+            plaid_service: Optional PlaidService instance (uses the shared
+                get_plaid_service() instance, and its connection pool, if None)
         """
         self.db_service = DatabaseService(session)
-        self.plaid_service = plaid_service or PlaidService()
+        self.plaid_service = plaid_service or get_plaid_service()
         logger.info("SyncOrchestrator initialized")
     
     def handle_link_token_request(
@@ -91,7 +119,7 @@ class SyncOrchestrator:
             >>> link_token = result["link_token"]
         """
         try:
-            logger.info(f"Handling link token request for user_id: {user_id}")
+            logger.info("Handling link token request for user_id: %s", user_id)
             
             result = self.plaid_service.create_link_token(
                 user_id=str(user_id),
@@ -99,7 +127,7 @@ class SyncOrchestrator:
             )
             
             logger.info(
-                f"Link token created successfully for user_id: {user_id}"
+                "Link token created successfully for user_id: %s", user_id
             )
             
             return result
@@ -155,8 +183,8 @@ class SyncOrchestrator:
         """
         try:
             logger.info(
-                f"Handling public token exchange for user_id: {user_id}, "
-                f"institution: {institution_name}"
+                "Handling public token exchange for user_id: %s, "
+                "institution: %s", user_id, institution_name
             )
             
             # Exchange public token for access token
@@ -167,7 +195,7 @@ class SyncOrchestrator:
             access_token = exchange_result["access_token"]
             item_id = exchange_result["item_id"]
             
-            logger.info(f"Public token exchanged, item_id: {item_id}")
+            logger.info("Public token exchanged, item_id: %s", item_id)
             
             # Create PlaidItem in database
             plaid_item = self.db_service.create_plaid_item(
@@ -187,11 +215,15 @@ class SyncOrchestrator:
                 plaid_item_id=plaid_item.id,
                 user_id=user_id,
             )
+            # The first sync can then reuse these accounts
+            plaid_item = self.db_service.set_accounts_refreshed_at(
+                plaid_item_id=plaid_item.id,
+                accounts_refreshed_at=datetime.now(timezone.utc),
+            )
             
             logger.info(
-                f"Public token exchange complete, "
-                f"plaid_item_id: {plaid_item.id}, "
-                f"accounts: {len(accounts)}"
+                "Public token exchange complete, plaid_item_id: %s, "
+                "accounts: %d", plaid_item.id, len(accounts)
             )
             
             return {
@@ -226,6 +258,10 @@ class SyncOrchestrator:
         This method retrieves all PlaidItems for the user and syncs transactions
         for each one using cursor-based pagination.
         
+        If a sync for the same user is already running in this process
+        (e.g. a streamed sync and a manual refresh), the call waits for it
+        and returns its result instead of syncing the same items again.
+        
         Args:
             user_id: ID of the user
             
@@ -247,91 +283,321 @@ class SyncOrchestrator:
             ...       f"Modified: {result['total_modified']}, "
             ...       f"Removed: {result['total_removed']}")
         """
+        future: Future[dict[str, Any]] = Future()
+        with _user_syncs_lock:
+            pending = _user_syncs_inflight.setdefault(user_id, future)
+        if pending is not future:
+            logger.info(
+                "Waiting for the sync already running for user_id: %s", user_id
+            )
+            return pending.result()
+        
         try:
-            logger.info(f"Syncing transactions for user_id: {user_id}")
+            result = self._sync_user_transactions(user_id)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _user_syncs_lock:
+                del _user_syncs_inflight[user_id]
+        
+        future.set_result(result)
+        return result
+    
+    def _sync_user_transactions(
+        self,
+        user_id: uuid.UUID,
+    ) -> dict[str, Any]:
+        """
+        Sync all transactions for a user; see sync_user_transactions.
+        
+        Args:
+            user_id: ID of the user
             
-            # Get all PlaidItems for the user
-            plaid_items = self.db_service.get_plaid_items_for_user(user_id)
+        Returns:
+            Same as sync_user_transactions
             
-            if not plaid_items:
-                logger.info(f"No PlaidItems found for user_id: {user_id}")
-                return {
-                    "total_added": 0,
-                    "total_modified": 0,
-                    "total_removed": 0,
-                    "items_synced": 0,
-                    "results": [],
-                }
+        Raises:
+            SyncOrchestratorError: If sync fails
+        """
+        try:
+            logger.info("Syncing transactions for user_id: %s", user_id)
+            
+            results = list(self._iter_plaid_item_syncs(user_id))
+            return self._summarize_user_syncs(user_id, results)
             
+        except DatabaseServiceError as e:
+            error_msg = f"Database error syncing user transactions: {e.message}"
+            logger.error(error_msg)
+            raise SyncOrchestratorError(message=error_msg)
+        except Exception as e:
+            error_msg = f"Unexpected error syncing user transactions: {e}"
+            logger.error(error_msg, exc_info=True)
+            raise SyncOrchestratorError(message=error_msg)
+    
+    def _summarize_user_syncs(
+        self,
+        user_id: uuid.UUID,
+        results: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """
+        Total the PlaidItem sync results of a user sync.
+        
+        Args:
+            user_id: ID of the user
+            results: The sync result of each PlaidItem
+            
+        Returns:
+            Same as sync_user_transactions
+        """
+        total_added = 0
+        total_modified = 0
+        total_removed = 0
+        for result in results:
+            if result["success"]:
+                total_added += result["added_count"]
+                total_modified += result["modified_count"]
+                total_removed += result["removed_count"]
+        
+        logger.info(
+            "User transaction sync complete for user_id: %s, "
+            "added: %d, modified: %d, removed: %d",
+            user_id, total_added, total_modified, total_removed
+        )
+        
+        return {
+            "total_added": total_added,
+            "total_modified": total_modified,
+            "total_removed": total_removed,
+            "items_synced": len(results),
+            "results": results,
+        }
+    
+    def iter_user_transaction_syncs(
+        self,
+        user_id: uuid.UUID,
+    ) -> Generator[dict[str, Any], None, None]:
+        """
+        Sync transactions for each of a user's PlaidItems, one at a time.
+        
+        Yields the result of each PlaidItem sync as soon as it finishes, so
+        callers can report progress. A failing PlaidItem yields a result
+        with success=False and does not stop the remaining items.
+        
+        Shares sync_user_transactions' per-user guard: if a sync for the
+        same user is already running in this process, this waits for it
+        and yields its results instead of syncing the same items again.
+        A sync started here is likewise joined by sync_user_transactions.
+        
+        Args:
+            user_id: ID of the user
+            
+        Yields:
+            The sync_plaid_item result for each PlaidItem, or a failure
+            result containing plaid_item_id, institution_name, success and
+            error
+            
+        Raises:
+            DatabaseServiceError: If the user's PlaidItems cannot be loaded
+            SyncOrchestratorError: If the running sync this joined failed
+        """
+        future: Future[dict[str, Any]] = Future()
+        with _user_syncs_lock:
+            pending = _user_syncs_inflight.setdefault(user_id, future)
+        if pending is not future:
             logger.info(
-                f"Found {len(plaid_items)} PlaidItems for user_id: {user_id}"
+                "Waiting for the sync already running for user_id: %s", user_id
             )
+            yield from pending.result()["results"]
+            return
+        
+        results = []
+        try:
+            for result in self._iter_plaid_item_syncs(user_id):
+                results.append(result)
+                yield result
+        except GeneratorExit:
+            # The caller stopped early (e.g. the client disconnected)
+            future.set_exception(SyncOrchestratorError(
+                message=f"Sync for user_id {user_id} stopped before finishing"
+            ))
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _user_syncs_lock:
+                del _user_syncs_inflight[user_id]
+        
+        future.set_result(self._summarize_user_syncs(user_id, results))
+    
+    def _iter_plaid_item_syncs(
+        self,
+        user_id: uuid.UUID,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Sync a user's PlaidItems; see iter_user_transaction_syncs.
+        
+        Callers hold the user's entry in _user_syncs_inflight.
+        
+        Args:
+            user_id: ID of the user
             
-            # Sync each PlaidItem
-            total_added = 0
-            total_modified = 0
-            total_removed = 0
-            results = []
+        Yields:
+            The sync_plaid_item result for each PlaidItem, or a failure
+            result containing plaid_item_id, institution_name, success and
+            error
             
-            for plaid_item in plaid_items:
+        Raises:
+            DatabaseServiceError: If the user's PlaidItems cannot be loaded
+        """
+        # Get all PlaidItems for the user
+        plaid_items = self.db_service.get_plaid_items_for_user(user_id)
+        
+        if not plaid_items:
+            logger.info("No PlaidItems found for user_id: %s", user_id)
+            return
+        
+        logger.info(
+            "Found %d PlaidItems for user_id: %s", len(plaid_items), user_id
+        )
+        
+        executor = ThreadPoolExecutor(
+            max_workers=min(PLAID_FETCH_MAX_WORKERS, len(plaid_items)),
+            thread_name_prefix="plaid-fetch",
+        )
+        try:
+            # Start every item's Plaid calls up front, so the items are
+            # fetched concurrently; the database writes below still run one
+            # item at a time on this thread
+            fetches = [
+                self._fetch_plaid_item(executor, plaid_item)
+                for plaid_item in plaid_items
+            ]
+            
+            # Sync each PlaidItem
+            for plaid_item, fetch in zip(plaid_items, fetches, strict=True):
                 try:
-                    result = self.sync_plaid_item(plaid_item)
-                    total_added += result["added_count"]
-                    total_modified += result["modified_count"]
-                    total_removed += result["removed_count"]
-                    results.append(result)
+                    result = self.sync_plaid_item(plaid_item, fetch)
                 except Exception as e:
+                    # sync_plaid_item already logged the cause; expected
+                    # failures (e.g. ITEM_LOGIN_REQUIRED) need no traceback
                     logger.error(
-                        f"Error syncing plaid_item_id {plaid_item.id}: {e}",
-                        exc_info=True
+                        "Error syncing plaid_item_id %s: %s", plaid_item.id, e,
+                        exc_info=logger.isEnabledFor(logging.DEBUG)
                     )
-                    results.append({
+                    result = {
                         "plaid_item_id": plaid_item.id,
                         "institution_name": plaid_item.institution_name,
                         "success": False,
                         "error": str(e),
-                    })
-            
-            logger.info(
-                f"User transaction sync complete for user_id: {user_id}, "
-                f"added: {total_added}, modified: {total_modified}, "
-                f"removed: {total_removed}"
-            )
+                    }
+                yield result
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _fetch_plaid_item(
+        self,
+        executor: ThreadPoolExecutor,
+        plaid_item: Any,
+    ) -> Future[PlaidItemUpdates]:
+        """
+        Start the Plaid API calls needed to sync a PlaidItem.
+        
+        The item's attributes are read here, on the caller's thread, since
+        the session is not thread-safe.
+        
+        Args:
+            executor: Executor to run the Plaid calls on
+            plaid_item: PlaidItem instance to fetch updates for
             
-            return {
-                "total_added": total_added,
-                "total_modified": total_modified,
-                "total_removed": total_removed,
-                "items_synced": len(plaid_items),
-                "results": results,
-            }
+        Returns:
+            Future of the item's PlaidItemUpdates
+        """
+        return executor.submit(
+            self._fetch_plaid_updates,
+            access_token=plaid_item.access_token,
+            cursor=plaid_item.cursor,
+            accounts_refreshed_at=plaid_item.accounts_refreshed_at,
+        )
+    
+    def _fetch_plaid_updates(
+        self,
+        access_token: str,
+        cursor: str | None,
+        accounts_refreshed_at: datetime | None = None,
+    ) -> PlaidItemUpdates:
+        """
+        Fetch a PlaidItem's transaction changes, and its accounts if needed.
+        
+        Accounts (and so balances) are fetched when the stored ones are
+        older than ACCOUNTS_REFRESH_MAX_AGE, whether or not any transactions
+        changed, and on an initial sync (no cursor). They are then fetched
+        concurrently with the transactions; otherwise an item with no
+        changes costs a single Plaid call.
+        
+        Args:
+            access_token: Access token of the PlaidItem
+            cursor: The PlaidItem's stored sync cursor
+            accounts_refreshed_at: When the item's accounts were last stored
             
-        except DatabaseServiceError as e:
-            error_msg = f"Database error syncing user transactions: {e.message}"
-            logger.error(error_msg)
-            raise SyncOrchestratorError(message=error_msg)
-        except Exception as e:
-            error_msg = f"Unexpected error syncing user transactions: {e}"
-            logger.error(error_msg, exc_info=True)
-            raise SyncOrchestratorError(message=error_msg)
+        Returns:
+            PlaidItemUpdates with the sync and accounts results
+        """
+        if (
+            cursor is None
+            or accounts_refreshed_at is None
+            or datetime.now(timezone.utc) - accounts_refreshed_at
+            >= ACCOUNTS_REFRESH_MAX_AGE
+        ):
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                accounts_future = executor.submit(
+                    self.plaid_service.get_accounts,
+                    access_token=access_token,
+                )
+                sync_result = self.plaid_service.sync_all_transactions(
+                    access_token=access_token,
+                    cursor=cursor,
+                )
+                return PlaidItemUpdates(
+                    transactions=sync_result,
+                    accounts=accounts_future.result(),
+                )
+        
+        return PlaidItemUpdates(
+            transactions=self.plaid_service.sync_all_transactions(
+                access_token=access_token,
+                cursor=cursor,
+            ),
+            accounts=None,
+        )
     
     def sync_plaid_item(
         self,
         plaid_item: Any,
+        fetch: Future[PlaidItemUpdates] | None = None,
     ) -> dict[str, Any]:
         """
         Sync transactions for a single PlaidItem.
         
         This method performs cursor-based transaction sync for a PlaidItem:
-        1. Calls Plaid Transactions Sync API with current cursor
+        1. Calls Plaid Transactions Sync API with current cursor, and
+           fetches the item's accounts if the stored ones are stale, or if
+           a transaction belongs to an account not stored yet
         2. Upserts accounts (in case of updates)
-        3. Maps Plaid account IDs to database Account IDs
-        4. Upserts transactions
+        3. Maps Plaid account IDs to database Account IDs (from the stored
+           accounts if they were not fetched)
+        4. Upserts transactions (bulk loaded with COPY on an initial sync)
         5. Handles removed transactions
         6. Updates sync cursor
         
+        Steps 2-6 are skipped when Plaid reports no changes, returns the
+        item's current cursor and the accounts were not refreshed.
+        
         Args:
             plaid_item: PlaidItem instance to sync
+            fetch: Plaid calls already started for this item with
+                _fetch_plaid_item; they are made here if None
             
         Returns:
             Dictionary containing:
@@ -353,18 +619,19 @@ class SyncOrchestrator:
         """
         try:
             logger.info(
-                f"Syncing plaid_item_id: {plaid_item.id}, "
-                f"institution: {plaid_item.institution_name}"
+                "Syncing plaid_item_id: %s, institution: %s",
+                plaid_item.id, plaid_item.institution_name
             )
             
-            # Get the current cursor
-            cursor = plaid_item.cursor
-            
-            # Sync all transactions with pagination
-            sync_result = self.plaid_service.sync_all_transactions(
-                access_token=plaid_item.access_token,
-                cursor=cursor,
-            )
+            if fetch is None:
+                updates = self._fetch_plaid_updates(
+                    access_token=plaid_item.access_token,
+                    cursor=plaid_item.cursor,
+                    accounts_refreshed_at=plaid_item.accounts_refreshed_at,
+                )
+            else:
+                updates = fetch.result()
+            sync_result = updates.transactions
             
             added = sync_result["added"]
             modified = sync_result["modified"]
@@ -372,62 +639,96 @@ class SyncOrchestrator:
             next_cursor = sync_result["next_cursor"]
             
             logger.info(
-                f"Plaid sync complete for item {plaid_item.id}: "
-                f"added={len(added)}, modified={len(modified)}, "
-                f"removed={len(removed)}"
-            )
-            
-            # Get all accounts for this PlaidItem
-            # We need to refresh accounts in case they changed
-            accounts_result = self.plaid_service.get_accounts(
-                access_token=plaid_item.access_token
+                "Plaid sync complete for item %s: added=%d, modified=%d, "
+                "removed=%d", plaid_item.id, len(added), len(modified),
+                len(removed)
             )
             
-            # Upsert accounts
-            accounts = self.db_service.upsert_accounts(
-                accounts=accounts_result["accounts"],
-                plaid_item_id=plaid_item.id,
-                user_id=plaid_item.user_id,
-            )
-            
-            # Create mapping from plaid_account_id to Account.id
-            account_mapping = {
-                account.plaid_account_id: account.id
-                for account in accounts
-                if account.plaid_account_id
-            }
-            
-            # Upsert added and modified transactions
-            all_transactions = added + modified
+            # Nothing to store: skip the database writes entirely
+            if (
+                not (added or modified or removed)
+                and next_cursor == plaid_item.cursor
+                and updates.accounts is None
+            ):
+                return {
+                    "plaid_item_id": str(plaid_item.id),
+                    "institution_name": plaid_item.institution_name,
+                    "added_count": 0,
+                    "modified_count": 0,
+                    "removed_count": 0,
+                    "success": True,
+                }
             
-            if all_transactions:
-                self.db_service.upsert_transactions(
-                    transactions=all_transactions,
-                    account_mapping=account_mapping,
+            removed_ids = [
+                txn.get("transaction_id")
+                for txn in removed
+                if txn.get("transaction_id")
+            ]
+            
+            accounts = updates.accounts
+            account_mapping: dict[str, uuid.UUID] | None = None
+            if accounts is None and (added or modified):
+                # The stored accounts are recent; they are only fetched now
+                # if a transaction belongs to an account not stored yet
+                account_mapping = self.db_service.get_account_mapping(
+                    plaid_item.id
                 )
+                if any(
+                    txn.get("account_id") not in account_mapping
+                    for txn in added + modified
+                ):
+                    accounts = self.plaid_service.get_accounts(
+                        access_token=plaid_item.access_token
+                    )
             
-            # Handle removed transactions
-            removed_count = 0
-            if removed:
-                removed_ids = [
-                    txn.get("transaction_id")
-                    for txn in removed
-                    if txn.get("transaction_id")
-                ]
+            # Store the accounts, the transaction changes and the new cursor
+            # in one database transaction, so a failure part way through
+            # never leaves the cursor past changes that were not saved
+            with self.db_service.unit_of_work():
+                accounts_refreshed_at: datetime | None = None
+                if accounts is not None:
+                    # Upsert accounts, keeping only the plaid_account_id to
+                    # Account.id mapping the transactions need
+                    account_mapping = self.db_service.upsert_accounts(
+                        accounts=accounts["accounts"],
+                        plaid_item_id=plaid_item.id,
+                        user_id=plaid_item.user_id,
+                        return_mapping=True,
+                    )
+                    accounts_refreshed_at = datetime.now(timezone.utc)
                 
+                # Only added or modified transactions need the mapping
+                if account_mapping is not None and (added or modified):
+                    # Upsert added and modified transactions; an initial
+                    # sync brings the item's whole history, so it is bulk
+                    # loaded with COPY
+                    if plaid_item.cursor is None:
+                        self.db_service.copy_transactions(
+                            transactions=added + modified,
+                            account_mapping=account_mapping,
+                        )
+                    else:
+                        self.db_service.upsert_transactions(
+                            transactions=added + modified,
+                            account_mapping=account_mapping,
+                        )
+                
+                # Handle removed transactions
+                removed_count = 0
                 if removed_ids:
                     removed_count = self.db_service.delete_transactions(
                         transaction_ids=removed_ids
                     )
-            
-            # Update sync cursor
-            self.db_service.update_sync_cursor(
-                plaid_item_id=plaid_item.id,
-                cursor=next_cursor,
-            )
+                
+                # Update sync cursor
+                self.db_service.update_sync_cursor(
+                    plaid_item_id=plaid_item.id,
+                    cursor=next_cursor,
+                    accounts_refreshed_at=accounts_refreshed_at,
+                )
             
             logger.info(
-                f"PlaidItem sync complete for plaid_item_id: {plaid_item.id}"
+                "PlaidItem sync complete for plaid_item_id: %s", plaid_item.id
             )
             
             return {
@@ -0,0 +1,140 @@
+"""
+Sync Worker for scheduled transaction syncs.
+
+Syncs every user with a linked Plaid item on one bounded pool of worker
+threads, for a scheduled (e.g. nightly) job rather than per HTTP request.
+The stalest users are synced first. Run it with: python -m app.core.sync_worker
+"""
+
+import logging
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any
+
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from app.core.db import engine
+from app.core.plaid_service import PlaidService, get_plaid_service
+from app.core.sync_orchestrator import SyncOrchestrator
+from app.models import PlaidItem
+
+logger = logging.getLogger(__name__)
+
+# Users synced at once. Each worker holds a database connection for its
+# user's sync, so this stays below DB_POOL_SIZE + DB_MAX_OVERFLOW; it
+# also bounds the Plaid request rate of a full run.
+SYNC_MAX_WORKERS = 8
+
+# Users to sync, stalest first: users with an item never synced (no
+# cursor), then by the oldest accounts refresh among their items. The pool
+# starts syncs in submission order, so this is the order they run in
+_USERS_BY_STALENESS = (
+    select(PlaidItem.user_id)
+    .group_by(PlaidItem.user_id)
+    .order_by(
+        func.bool_or(PlaidItem.cursor.is_(None)).desc(),
+        func.min(PlaidItem.accounts_refreshed_at).asc().nulls_first(),
+    )
+)
+
+
+def _sync_user(user_id: uuid.UUID, plaid_service: PlaidService) -> dict[str, Any]:
+    """
+    Sync one user's transactions in a session of its own.
+    
+    Sessions are not thread-safe, so each worker opens its own; the
+    PlaidService and its connection pool are shared.
+    
+    Args:
+        user_id: ID of the user
+        plaid_service: PlaidService to make the Plaid calls with
+    
+    Returns:
+        The sync_user_transactions result
+    """
+    with Session(engine) as session:
+        orchestrator = SyncOrchestrator(session, plaid_service=plaid_service)
+        return orchestrator.sync_user_transactions(user_id)
+
+
+def sync_all_users(
+    plaid_service: PlaidService | None = None,
+    max_workers: int = SYNC_MAX_WORKERS,
+) -> dict[str, int]:
+    """
+    Sync transactions for every user with at least one PlaidItem.
+    
+    Users are synced stalest first (see _USERS_BY_STALENESS), so when a
+    run is cut short or rate-limited the oldest data is refreshed first.
+    A failed user sync is logged and counted; it does not stop the others.
+    
+    Args:
+        plaid_service: Optional PlaidService instance (uses the shared
+            get_plaid_service() instance if None)
+        max_workers: Number of users synced at once
+    
+    Returns:
+        Dictionary containing:
+            - users_synced: Number of users synced successfully
+            - users_failed: Number of users whose sync failed
+            - total_added: Total number of transactions added
+            - total_modified: Total number of transactions modified
+            - total_removed: Total number of transactions removed
+    
+    Example:
+        >>> summary = sync_all_users()
+        >>> print(f"Synced {summary['users_synced']} users")
+    """
+    plaid_service = plaid_service or get_plaid_service()
+    
+    with Session(engine) as session:
+        user_ids = session.exec(_USERS_BY_STALENESS).all()
+    
+    logger.info("Syncing transactions for %d users", len(user_ids))
+    
+    summary = {
+        "users_synced": 0,
+        "users_failed": 0,
+        "total_added": 0,
+        "total_modified": 0,
+        "total_removed": 0,
+    }
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_sync_user, user_id, plaid_service): user_id
+            for user_id in user_ids
+        }
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                # The orchestrator already logged the cause
+                logger.error(
+                    "Error syncing user_id %s: %s", futures[future], e,
+                    exc_info=logger.isEnabledFor(logging.DEBUG)
+                )
+                summary["users_failed"] += 1
+                continue
+            summary["users_synced"] += 1
+            summary["total_added"] += result["total_added"]
+            summary["total_modified"] += result["total_modified"]
+            summary["total_removed"] += result["total_removed"]
+    
+    logger.info(
+        "Synced %d users (%d failed): added=%d, modified=%d, removed=%d",
+        summary["users_synced"], summary["users_failed"],
+        summary["total_added"], summary["total_modified"],
+        summary["total_removed"]
+    )
+    
+    return summary
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    sync_all_users()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,9 @@
 import uuid
-from datetime import date
+from datetime import date, datetime
+from decimal import Decimal
 
 from pydantic import EmailStr
+from sqlalchemy import DDL, DateTime, Index, event, text
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -91,6 +93,10 @@ class PlaidItem(PlaidItemBase, table=True):
     user_id: uuid.UUID = Field(
         foreign_key="user.id", nullable=False, ondelete="CASCADE", index=True
     )
+    # When the item's accounts (and balances) were last stored from Plaid
+    accounts_refreshed_at: datetime | None = Field(
+        default=None, sa_type=DateTime(timezone=True)
+    )
     user: User | None = Relationship(back_populates="plaid_items")
     accounts: list["Account"] = Relationship(back_populates="plaid_item", cascade_delete=True)
 
@@ -126,13 +132,25 @@ class NewPassword(SQLModel):
     new_password: str = Field(min_length=8, max_length=128)
 
 
+# Money is stored as NUMERIC(MONEY_MAX_DIGITS, MONEY_DECIMAL_PLACES): exact,
+# unlike double precision, and summed by PostgreSQL without casts. The API
+# models still return floats, so the JSON responses keep numeric amounts
+MONEY_MAX_DIGITS = 18
+MONEY_DECIMAL_PLACES = 4
+
+
 # Shared properties
 class AccountBase(SQLModel):
     name: str = Field(max_length=255)
     official_name: str = Field(max_length=255)
     type: str = Field(max_length=255)
-    current_balance: float = Field(default=0.0)
+    current_balance: Decimal = Field(
+        default=Decimal(0),
+        max_digits=MONEY_MAX_DIGITS,
+        decimal_places=MONEY_DECIMAL_PLACES,
+    )
     currency: str = Field(max_length=255)
+    # Unique index: the ON CONFLICT target of DatabaseService.upsert_accounts
     plaid_account_id: str | None = Field(default=None, max_length=255, unique=True, index=True)
 
 
@@ -146,7 +164,11 @@ class AccountUpdate(AccountBase):
     name: str | None = Field(default=None, max_length=255)  # type: ignore
     official_name: str | None = Field(default=None, max_length=255)  # type: ignore
     type: str | None = Field(default=None, max_length=255)  # type: ignore
-    current_balance: float | None = Field(default=None)
+    current_balance: Decimal | None = Field(  # type: ignore
+        default=None,
+        max_digits=MONEY_MAX_DIGITS,
+        decimal_places=MONEY_DECIMAL_PLACES,
+    )
     currency: str | None = Field(default=None, max_length=255)  # type: ignore
     plaid_account_id: str | None = Field(default=None, max_length=255)  # type: ignore
 
@@ -155,7 +177,7 @@ class AccountUpdate(AccountBase):
 class Account(AccountBase, table=True):
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     user_id: uuid.UUID = Field(
-        foreign_key="user.id", nullable=False, ondelete="CASCADE"
+        foreign_key="user.id", nullable=False, ondelete="CASCADE", index=True
     )
     plaid_item_id: uuid.UUID | None = Field(
         default=None, foreign_key="plaiditem.id", nullable=True, ondelete="CASCADE", index=True
@@ -170,22 +192,20 @@ class AccountPublic(AccountBase):
     id: uuid.UUID
     user_id: uuid.UUID
     plaid_item_id: uuid.UUID | None
-    name: str
-    official_name: str
-    type: str
-    current_balance: float
-    currency: str
-    plaid_account_id: str | None
+    current_balance: float  # type: ignore
 
 
 # Shared properties
 class TransactionBase(SQLModel):
-    amount: float
+    amount: Decimal = Field(
+        max_digits=MONEY_MAX_DIGITS, decimal_places=MONEY_DECIMAL_PLACES
+    )
     auth_date: date
     merchant_name: str = Field(max_length=255)
     pending: bool = Field(default=False)
     category: str = Field(max_length=255)
     currency: str = Field(max_length=10, default="USD")
+    # Unique index: the ON CONFLICT target of DatabaseService.upsert_transactions
     plaid_transaction_id: str | None = Field(default=None, max_length=255, unique=True, index=True)
 
 
@@ -196,7 +216,11 @@ class TransactionCreate(TransactionBase):
 
 # Properties to receive on transaction update
 class TransactionUpdate(TransactionBase):
-    amount: float | None = Field(default=None)
+    amount: Decimal | None = Field(  # type: ignore
+        default=None,
+        max_digits=MONEY_MAX_DIGITS,
+        decimal_places=MONEY_DECIMAL_PLACES,
+    )
     auth_date: date | None = Field(default=None)
     merchant_name: str | None = Field(default=None, max_length=255)  # type: ignore
     pending: bool | None = Field(default=None)
@@ -207,24 +231,46 @@ class TransactionUpdate(TransactionBase):
 
 # Database model, database table inferred from class name
 class Transaction(TransactionBase, table=True):
+    # Partial index over posted transactions only; the AI tools always filter
+    # on pending IS false, and pending rows are a small fraction of the table
+    __table_args__ = (
+        Index(
+            "ix_transaction_posted_account_id_auth_date",
+            "account_id",
+            "auth_date",
+            postgresql_where=text("pending IS false"),
+        ),
+        # Trigram index so ILIKE '%merchant%' lookups can use an index probe
+        Index(
+            "ix_transaction_merchant_name_trgm",
+            "merchant_name",
+            postgresql_using="gin",
+            postgresql_ops={"merchant_name": "gin_trgm_ops"},
+        ),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    # Full (non-partial) index: ON DELETE CASCADE from account looks up
+    # every row of the account, pending or not
     account_id: uuid.UUID = Field(
-        foreign_key="account.id", nullable=False, ondelete="CASCADE"
+        foreign_key="account.id", nullable=False, ondelete="CASCADE", index=True
     )
     account: Account | None = Relationship(back_populates="transactions")
 
 
+# gin_trgm_ops requires the pg_trgm extension to exist before the table is created
+event.listen(
+    Transaction.__table__,  # type: ignore[attr-defined]
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+)
+
+
 # Properties to return via API, id is always required
 class TransactionPublic(TransactionBase):
     id: uuid.UUID
     account_id: uuid.UUID
-    amount: float
-    auth_date: date
-    merchant_name: str
-    pending: bool
-    category: str
-    currency: str
-    plaid_transaction_id: str | None
+    amount: float  # type: ignore
 
 
 # Plaid API response models
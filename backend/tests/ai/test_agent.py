@@ -5,6 +5,7 @@ Tests the full agent execution flow including context management
 and tool execution through the LangGraph workflow.
 """
 
+import asyncio
 import uuid
 from datetime import date, timedelta
 from unittest.mock import MagicMock, patch
@@ -13,7 +14,8 @@ import pytest
 from langchain_core.messages import AIMessage, HumanMessage
 from sqlmodel import Session
 
-from app.ai.agent import build_financial_agent, process_message
+from app import crud
+from app.ai.agent import build_financial_agent, process_message, stream_message
 from app.ai.tools.base import clear_context, current_session, current_user_id
 from app.models import Account, Transaction, User, UserCreate
 
@@ -21,8 +23,6 @@ from app.models import Account, Transaction, User, UserCreate
 @pytest.fixture
 def test_user(db: Session) -> User:
     """Create a test user for agent queries."""
-    from app import crud
-    
     user_create = UserCreate(
         email=f"testuser_{uuid.uuid4()}@example.com",
         password="testpassword123",
@@ -209,6 +209,16 @@ class TestAgentContextManagement:
             # Verify the agent was created
             assert agent is not None
     
+    def test_agent_graph_is_built_once(self) -> None:
+        """Test that the compiled agent graph is reused across calls."""
+        with patch("app.ai.agent.AIConfig") as mock_config:
+            mock_config.validate_config.return_value = True
+            
+            build_financial_agent.cache_clear()
+            agent = build_financial_agent()
+            
+            assert build_financial_agent() is agent
+    
     def test_multiple_tool_calls_maintain_context(
         self,
         db: Session,
@@ -269,6 +279,58 @@ class TestAgentContextManagement:
             assert current_session.get() is None
             assert current_user_id.get() is None
 
+    
+    def test_stream_message_yields_agent_text_and_clears_context(
+        self,
+        db: Session,
+        test_user: User,
+        test_account: Account,
+        test_transactions: list[Transaction],
+    ) -> None:
+        """Test that streaming yields only the agent's text and clears context."""
+        # Ensure context is clear before test
+        clear_context()
+        
+        messages = [HumanMessage(content="Show my grocery spending")]
+        
+        with patch("app.ai.agent.ChatGoogleGenerativeAI") as mock_llm_class:
+            mock_llm = MagicMock()
+            mock_llm_class.return_value = mock_llm
+            
+            tool_call_message = AIMessage(
+                content="",
+                tool_calls=[
+                    {
+                        "name": "get_transactions_by_category",
+                        "args": {"category": "groceries", "limit": 20, "days_back": 30},
+                        "id": "call_123",
+                    }
+                ],
+            )
+            response_message = AIMessage(content="You spent $137.30 on groceries.")
+            
+            mock_llm.invoke.side_effect = [tool_call_message, response_message]
+            mock_llm.bind_tools.return_value = mock_llm
+            
+            async def collect() -> list[str]:
+                return [
+                    delta
+                    async for delta in stream_message(
+                        user_id=test_user.id,
+                        messages=messages,
+                        session=db,
+                    )
+                ]
+            
+            deltas = asyncio.run(collect())
+            
+            # Tool results are not streamed, only the final answer
+            assert "".join(deltas) == response_message.content
+            
+            # Verify context was cleared after streaming
+            assert current_session.get() is None
+            assert current_user_id.get() is None
+
 
 class TestAgentIntegration:
     """Integration tests for the full agent workflow."""
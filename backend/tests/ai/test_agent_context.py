@@ -4,11 +4,21 @@ Unit tests for agent context management without requiring full database setup.
 Tests that the context is properly managed during agent execution.
 """
 
+import uuid
 from unittest.mock import MagicMock, patch
 
+import pytest
 from langchain_core.messages import AIMessage, HumanMessage
 
-from app.ai.tools.base import clear_context, current_session, current_user_id
+from app.ai.agent import call_tools_node, process_message
+from app.ai.state import FinancialAgentState
+from app.ai.tools.base import (
+    clear_context,
+    current_session,
+    current_user_id,
+    get_ctx,
+    set_context,
+)
 
 
 class TestAgentContextManagement:
@@ -23,10 +33,6 @@ class TestAgentContextManagement:
     
     def test_set_and_clear_context(self) -> None:
         """Test basic context setting and clearing."""
-        from app.ai.tools.base import set_context
-        import uuid
-        from unittest.mock import MagicMock
-        
         # Clear first
         clear_context()
         
@@ -48,13 +54,26 @@ class TestAgentContextManagement:
         assert current_session.get() is None
         assert current_user_id.get() is None
     
+    def test_get_ctx_returns_session_and_user_id(self) -> None:
+        """Test that get_ctx returns both context values in one call."""
+        clear_context()
+        
+        # Missing context should raise
+        with pytest.raises(RuntimeError):
+            get_ctx()
+        
+        mock_session = MagicMock()
+        test_user_id = uuid.uuid4()
+        set_context(mock_session, test_user_id)
+        
+        session, user_id = get_ctx()
+        assert session is mock_session
+        assert user_id == test_user_id
+        
+        clear_context()
+    
     def test_context_available_in_tools_node(self) -> None:
         """Test that the call_tools_node sets context before tool execution."""
-        import uuid
-        from unittest.mock import MagicMock, patch
-        from app.ai.agent import call_tools_node
-        from app.ai.state import FinancialAgentState
-        
         # Clear context first
         clear_context()
         
@@ -110,10 +129,6 @@ class TestAgentContextManagement:
     
     def test_process_message_sets_and_clears_context(self) -> None:
         """Test that process_message sets context before execution and clears after."""
-        import uuid
-        from unittest.mock import MagicMock, patch
-        from app.ai.agent import process_message
-        
         # Clear context first
         clear_context()
         
@@ -149,10 +164,6 @@ class TestAgentContextManagement:
     
     def test_process_message_clears_context_on_error(self) -> None:
         """Test that context is cleared even when an error occurs."""
-        import uuid
-        from unittest.mock import MagicMock, patch
-        from app.ai.agent import process_message
-        
         # Clear context first
         clear_context()
         
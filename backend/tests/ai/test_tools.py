@@ -10,6 +10,7 @@ from datetime import date, timedelta
 import pytest
 from sqlmodel import Session
 
+from app import crud
 from app.ai.tools import (
     compare_spending_periods,
     get_category_breakdown,
@@ -25,8 +26,6 @@ from app.models import Account, Transaction, User, UserCreate
 @pytest.fixture
 def test_user(db: Session) -> User:
     """Create a test user for financial queries."""
-    from app import crud
-    
     user_create = UserCreate(
         email=f"testuser_{uuid.uuid4()}@example.com",
         password="testpassword123",
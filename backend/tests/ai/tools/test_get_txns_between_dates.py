@@ -0,0 +1,100 @@
+"""
+Unit tests for get_transactions_between_dates tool.
+
+Tests the date-range transaction query functionality with proper database setup.
+"""
+
+import uuid
+from datetime import date, timedelta
+
+import pytest
+from sqlmodel import Session
+
+from app import crud
+from app.ai.tools import get_transactions_between_dates, set_context
+from app.ai.tools.get_txns_between_dates import MAX_BREAKDOWN_CATEGORIES
+from app.models import Account, Transaction, User, UserCreate
+
+
+@pytest.fixture
+def test_user(db: Session) -> User:
+    """Create a test user for financial queries."""
+    user_create = UserCreate(
+        email=f"testuser_{uuid.uuid4()}@example.com",
+        password="testpassword123",
+        full_name="Test User",
+    )
+    user = crud.create_user(session=db, user_create=user_create)
+    return user
+
+
+@pytest.fixture
+def test_account(db: Session, test_user: User) -> Account:
+    """Create a test checking account."""
+    account = Account(
+        user_id=test_user.id,
+        name="My Checking",
+        official_name="Test Checking Account",
+        type="depository",
+        current_balance=5000.0,
+        currency="USD",
+        plaid_account_id=f"test-checking-{uuid.uuid4()}",
+    )
+    db.add(account)
+    db.commit()
+    db.refresh(account)
+    return account
+
+
+@pytest.fixture
+def test_transactions(db: Session, test_account: Account) -> list[Transaction]:
+    """Create one transaction in each of more categories than are itemized."""
+    yesterday = date.today() - timedelta(days=1)
+    
+    # Category i spends (i + 1) * 10, so the two smallest are 10 and 20
+    transactions = [
+        Transaction(
+            account_id=test_account.id,
+            amount=(i + 1) * 10,
+            auth_date=yesterday,
+            merchant_name=f"Merchant {i}",
+            category=f"Category {i}",
+            pending=False,
+            currency="USD",
+            plaid_transaction_id=f"txn-{uuid.uuid4()}",
+        )
+        for i in range(MAX_BREAKDOWN_CATEGORIES + 2)
+    ]
+    
+    for txn in transactions:
+        db.add(txn)
+    db.commit()
+    
+    return transactions
+
+
+class TestGetTransactionsBetweenDates:
+    """Tests for get_transactions_between_dates tool."""
+    
+    def test_get_transactions_between_dates_category_breakdown_truncated(
+        self,
+        db: Session,
+        test_user: User,
+        test_transactions: list[Transaction],
+    ) -> None:
+        """Test that categories beyond the breakdown are totalled, not dropped."""
+        set_context(db, test_user.id)
+        
+        start_date = (date.today() - timedelta(days=1)).isoformat()
+        result = get_transactions_between_dates.invoke({"start_date": start_date})
+        
+        assert len(result["category_breakdown"]) == MAX_BREAKDOWN_CATEGORIES
+        assert "Category 0" not in result["category_breakdown"]
+        assert "Category 1" not in result["category_breakdown"]
+        assert result["category_breakdown_truncated"] is True
+        assert result["other_categories_total"] == 30.0  # 10 + 20
+        assert (
+            sum(result["category_breakdown"].values())
+            + result["other_categories_total"]
+            == result["total_amount"]
+        )
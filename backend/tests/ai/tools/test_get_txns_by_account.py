@@ -10,6 +10,7 @@ from datetime import date, timedelta
 import pytest
 from sqlmodel import Session
 
+from app import crud
 from app.ai.tools import get_transactions_by_account, set_context
 from app.models import Account, Transaction, User, UserCreate
 
@@ -17,8 +18,6 @@ from app.models import Account, Transaction, User, UserCreate
 @pytest.fixture
 def test_user(db: Session) -> User:
     """Create a test user for financial queries."""
-    from app import crud
-    
     user_create = UserCreate(
         email=f"testuser_{uuid.uuid4()}@example.com",
         password="testpassword123",
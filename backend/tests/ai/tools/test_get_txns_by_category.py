@@ -0,0 +1,157 @@
+"""
+Unit tests for get_transactions_by_category tool.
+
+Tests the category-based transaction query functionality with proper database setup.
+"""
+
+import uuid
+from datetime import date, timedelta
+
+import pytest
+from sqlmodel import Session
+
+from app import crud
+from app.ai.tools import get_transactions_by_category, set_context
+from app.models import Account, Transaction, User, UserCreate
+
+
+@pytest.fixture
+def test_user(db: Session) -> User:
+    """Create a test user for financial queries."""
+    user_create = UserCreate(
+        email=f"testuser_{uuid.uuid4()}@example.com",
+        password="testpassword123",
+        full_name="Test User",
+    )
+    user = crud.create_user(session=db, user_create=user_create)
+    return user
+
+
+@pytest.fixture
+def test_account(db: Session, test_user: User) -> Account:
+    """Create a test checking account."""
+    account = Account(
+        user_id=test_user.id,
+        name="My Checking",
+        official_name="Test Checking Account",
+        type="depository",
+        current_balance=5000.0,
+        currency="USD",
+        plaid_account_id=f"test-checking-{uuid.uuid4()}",
+    )
+    db.add(account)
+    db.commit()
+    db.refresh(account)
+    return account
+
+
+@pytest.fixture
+def test_transactions(db: Session, test_account: Account) -> list[Transaction]:
+    """Create grocery and restaurant transactions."""
+    today = date.today()
+    
+    transactions = [
+        Transaction(
+            account_id=test_account.id,
+            amount=52.30,
+            auth_date=today - timedelta(days=1),
+            merchant_name="Whole Foods",
+            category="Food and Drink, Groceries",
+            pending=False,
+            currency="USD",
+            plaid_transaction_id=f"txn-{uuid.uuid4()}",
+        ),
+        Transaction(
+            account_id=test_account.id,
+            amount=32.50,
+            auth_date=today - timedelta(days=2),
+            merchant_name="Trader Joe's",
+            category="Food and Drink, Groceries",
+            pending=False,
+            currency="USD",
+            plaid_transaction_id=f"txn-{uuid.uuid4()}",
+        ),
+        Transaction(
+            account_id=test_account.id,
+            amount=20.00,
+            auth_date=today - timedelta(days=3),
+            merchant_name="Whole Foods",
+            category="Food and Drink, Groceries",
+            pending=False,
+            currency="USD",
+            plaid_transaction_id=f"txn-{uuid.uuid4()}",
+        ),
+        Transaction(
+            account_id=test_account.id,
+            amount=45.00,
+            auth_date=today - timedelta(days=2),
+            merchant_name="Restaurant ABC",
+            category="Food and Drink, Restaurants",
+            pending=False,
+            currency="USD",
+            plaid_transaction_id=f"txn-{uuid.uuid4()}",
+        ),
+    ]
+    
+    for txn in transactions:
+        db.add(txn)
+    db.commit()
+    
+    return transactions
+
+
+class TestGetTransactionsByCategory:
+    """Tests for get_transactions_by_category tool."""
+    
+    def test_get_transactions_by_category(
+        self,
+        db: Session,
+        test_user: User,
+        test_transactions: list[Transaction],
+    ) -> None:
+        """Test totals and top merchants for a category."""
+        set_context(db, test_user.id)
+        
+        result = get_transactions_by_category.invoke({"category": "groceries"})
+        
+        assert result["transaction_count"] == 3
+        assert result["total_transaction_count"] == 3
+        assert result["total_amount"] == 104.80  # 52.30 + 32.50 + 20.00
+        assert result["showing_limited"] is False
+        assert result["top_merchants"][0] == {
+            "merchant": "Whole Foods",
+            "total_spent": 72.30,
+            "transaction_count": 2,
+        }
+    
+    def test_get_transactions_by_category_total_covers_limited_rows(
+        self,
+        db: Session,
+        test_user: User,
+        test_transactions: list[Transaction],
+    ) -> None:
+        """Test that the total includes transactions beyond the limit."""
+        set_context(db, test_user.id)
+        
+        result = get_transactions_by_category.invoke({"category": "groceries", "limit": 1})
+        
+        assert result["transaction_count"] == 1
+        assert result["transactions"][0]["merchant"] == "Whole Foods"
+        assert result["total_transaction_count"] == 3
+        assert result["total_amount"] == 104.80
+        assert result["showing_limited"] is True
+    
+    def test_get_transactions_by_category_no_matches(
+        self,
+        db: Session,
+        test_user: User,
+        test_transactions: list[Transaction],
+    ) -> None:
+        """Test a category without transactions."""
+        set_context(db, test_user.id)
+        
+        result = get_transactions_by_category.invoke({"category": "travel"})
+        
+        assert result["transaction_count"] == 0
+        assert result["total_amount"] == 0.0
+        assert result["top_merchants"] == []
@@ -0,0 +1,100 @@
+"""
+Unit tests for the Plaid sync progress stream.
+"""
+
+import asyncio
+import threading
+import uuid
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.api.routes.plaid import sync_progress_generator
+from app.api.sse import sse_event
+
+
+def _item_result(item_id: str, added_count: int) -> dict[str, Any]:
+    return {
+        "item_id": item_id,
+        "success": True,
+        "added_count": added_count,
+        "modified_count": 0,
+        "removed_count": 0,
+    }
+
+
+class TestSyncProgressGenerator:
+    """Tests for sync_progress_generator."""
+    
+    def test_sync_progress_generator_streams_items_and_totals(self) -> None:
+        """Test that each item is streamed, followed by the totals."""
+        results = [_item_result("item-1", 2), _item_result("item-2", 3)]
+        orchestrator = MagicMock()
+        orchestrator.iter_user_transaction_syncs.return_value = (
+            result for result in results
+        )
+        
+        async def collect() -> list[bytes]:
+            return [
+                chunk
+                async for chunk in sync_progress_generator(orchestrator, uuid.uuid4())
+            ]
+        
+        chunks = asyncio.run(collect())
+        
+        assert chunks == [
+            sse_event({"type": "item-synced", **results[0]}),
+            sse_event({"type": "item-synced", **results[1]}),
+            sse_event({
+                "type": "sync-complete",
+                "total_added": 5,
+                "total_modified": 0,
+                "total_removed": 0,
+                "items_synced": 2,
+            }),
+        ]
+    
+    def test_sync_progress_generator_cancelled_mid_item(self) -> None:
+        """Test that a disconnect mid-item waits for the item, then closes the syncs."""
+        syncing = threading.Event()
+        release = threading.Event()
+        closed = threading.Event()
+        synced: list[str] = []
+        
+        def syncs() -> Iterator[dict[str, Any]]:
+            try:
+                for item_id in ("item-1", "item-2", "item-3"):
+                    if item_id == "item-2":
+                        syncing.set()
+                        release.wait(timeout=5)
+                    synced.append(item_id)
+                    yield _item_result(item_id, 1)
+            finally:
+                closed.set()
+        
+        orchestrator = MagicMock()
+        orchestrator.iter_user_transaction_syncs.return_value = syncs()
+        
+        async def cancel_mid_item() -> bytes:
+            stream = sync_progress_generator(orchestrator, uuid.uuid4())
+            first = await anext(stream)
+            next_chunk = asyncio.ensure_future(anext(stream))
+            await asyncio.to_thread(syncing.wait, 5)
+            
+            next_chunk.cancel()
+            # Let the cancellation reach the stream before item-2 finishes
+            await asyncio.sleep(0)
+            release.set()
+            
+            with pytest.raises(asyncio.CancelledError):
+                await next_chunk
+            return first
+        
+        first = asyncio.run(cancel_mid_item())
+        
+        assert first == sse_event({"type": "item-synced", **_item_result("item-1", 1)})
+        # item-2 was allowed to finish, but item-3 was never started
+        assert synced == ["item-1", "item-2"]
+        assert closed.is_set()
@@ -0,0 +1,55 @@
+"""
+Unit tests for the schema upgrade run by init_db.
+"""
+
+from sqlalchemy import inspect, text
+from sqlmodel import Session
+
+from app.core.db import engine, upgrade_schema
+
+
+def _column_type(session: Session, table: str, column: str) -> str:
+    return session.execute(
+        text(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_name = :table AND column_name = :column"
+        ),
+        {"table": table, "column": column},
+    ).scalar_one()
+
+
+class TestUpgradeSchema:
+    """Tests for upgrade_schema."""
+    
+    def test_upgrade_schema_upgrades_old_tables(self, db: Session) -> None:
+        """Test that float money columns and missing indexes are upgraded."""
+        # Recreate the schema of a database made before these changes
+        with engine.begin() as connection:
+            connection.execute(text(
+                'ALTER TABLE "transaction" ALTER COLUMN amount TYPE double precision'
+            ))
+            connection.execute(text(
+                "DROP INDEX ix_transaction_merchant_name_trgm"
+            ))
+            connection.execute(text(
+                "ALTER TABLE plaiditem DROP COLUMN accounts_refreshed_at"
+            ))
+        
+        with engine.begin() as connection:
+            upgrade_schema(connection)
+        
+        assert _column_type(db, "transaction", "amount") == "numeric"
+        index_names = {
+            index["name"] for index in inspect(engine).get_indexes("transaction")
+        }
+        assert "ix_transaction_merchant_name_trgm" in index_names
+        columns = {column["name"] for column in inspect(engine).get_columns("plaiditem")}
+        assert "accounts_refreshed_at" in columns
+    
+    def test_upgrade_schema_is_idempotent(self, db: Session) -> None:
+        """Test that upgrading an up-to-date database changes nothing."""
+        with engine.begin() as connection:
+            upgrade_schema(connection)
+            upgrade_schema(connection)
+        
+        assert _column_type(db, "account", "current_balance") == "numeric"
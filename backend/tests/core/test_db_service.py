@@ -5,12 +5,15 @@ Tests all methods of DatabaseService with proper database setup and teardown.
 """
 
 import uuid
-from datetime import date, datetime
+from datetime import date, datetime, timezone
+from decimal import Decimal
 from typing import Generator
 
 import pytest
-from sqlmodel import Session, delete
+from sqlmodel import Session, delete, select
 
+from app import crud
+from app.core.db import engine
 from app.core.db_service import DatabaseService, DatabaseServiceError
 from app.models import Account, PlaidItem, Transaction, User, UserCreate
 
@@ -18,8 +21,6 @@ from app.models import Account, PlaidItem, Transaction, User, UserCreate
 @pytest.fixture
 def test_user(db: Session) -> User:
     """Create a test user for database operations."""
-    from app import crud
-    
     user_create = UserCreate(
         email=f"testuser_{uuid.uuid4()}@example.com",
         password="testpassword123",
@@ -109,8 +110,6 @@ class TestGetPlaidItemsForUser:
     ) -> None:
         """Test retrieving PlaidItems when user has none."""
         # Create a new user without any PlaidItems
-        from app import crud
-        
         new_user_create = UserCreate(
             email=f"newuser_{uuid.uuid4()}@example.com",
             password="testpassword123",
@@ -150,6 +149,45 @@ class TestGetPlaidItemsForUser:
         assert item2.id in item_ids
 
 
+class TestGetPlaidItemSummariesForUser:
+    """Tests for get_plaid_item_summaries_for_user method."""
+    
+    def test_get_plaid_item_summaries_success(
+        self,
+        db_service: DatabaseService,
+        test_user: User,
+        test_plaid_item: PlaidItem,
+    ) -> None:
+        """Test retrieving the public view of a user's PlaidItems."""
+        summaries = db_service.get_plaid_item_summaries_for_user(test_user.id)
+        
+        assert len(summaries) == 1
+        summary = summaries[0]
+        assert summary.id == test_plaid_item.id
+        assert summary.user_id == test_user.id
+        assert summary.item_id == test_plaid_item.item_id
+        assert summary.institution_name == test_plaid_item.institution_name
+        assert not hasattr(summary, "access_token")
+    
+    def test_get_plaid_item_summaries_refreshed_after_cursor_update(
+        self,
+        db_service: DatabaseService,
+        test_user: User,
+        test_plaid_item: PlaidItem,
+    ) -> None:
+        """Test that cached summaries are dropped when the cursor changes."""
+        summaries = db_service.get_plaid_item_summaries_for_user(test_user.id)
+        assert summaries[0].cursor is None
+        
+        db_service.update_sync_cursor(
+            plaid_item_id=test_plaid_item.id,
+            cursor="cursor-abc123",
+        )
+        
+        summaries = db_service.get_plaid_item_summaries_for_user(test_user.id)
+        assert summaries[0].cursor == "cursor-abc123"
+
+
 class TestGetPlaidItemById:
     """Tests for get_plaid_item_by_id method."""
     
@@ -275,6 +313,100 @@ class TestUpsertAccounts:
         assert updated_accounts[0].name == "Updated Checking"
         assert updated_accounts[0].current_balance == 250.0
     
+    def test_upsert_accounts_mixed_new_and_existing(
+        self,
+        db_service: DatabaseService,
+        test_user: User,
+        test_plaid_item: PlaidItem,
+    ) -> None:
+        """Test a batch that updates one account and inserts another."""
+        existing_data = {
+            "account-mixed-1": {
+                "account_id": "account-mixed-1",
+                "name": "Checking",
+                "official_name": "Plaid Checking",
+                "type": "depository",
+                "balances": {
+                    "current": 100.0,
+                    "iso_currency_code": "USD",
+                },
+            },
+        }
+        
+        initial_accounts = db_service.upsert_accounts(
+            accounts=list(existing_data.values()),
+            plaid_item_id=test_plaid_item.id,
+            user_id=test_user.id,
+        )
+        
+        initial_id = initial_accounts[0].id
+        
+        mixed_data = [
+            {
+                "account_id": "account-mixed-2",
+                "name": "Savings",
+                "official_name": "Plaid Savings",
+                "type": "depository",
+                "balances": {
+                    "current": 500.0,
+                    "iso_currency_code": "USD",
+                },
+            },
+            {
+                **existing_data["account-mixed-1"],
+                "balances": {
+                    "current": 75.0,
+                    "iso_currency_code": "USD",
+                },
+            },
+        ]
+        
+        accounts = db_service.upsert_accounts(
+            accounts=mixed_data,
+            plaid_item_id=test_plaid_item.id,
+            user_id=test_user.id,
+        )
+        
+        assert [account.plaid_account_id for account in accounts] == [
+            "account-mixed-2",
+            "account-mixed-1",
+        ]
+        assert accounts[0].id != initial_id
+        assert accounts[0].current_balance == 500.0
+        assert accounts[1].id == initial_id  # Same ID
+        assert accounts[1].current_balance == 75.0
+    
+    def test_upsert_accounts_return_mapping(
+        self,
+        db_service: DatabaseService,
+        test_user: User,
+        test_plaid_item: PlaidItem,
+    ) -> None:
+        """Test upserting accounts and getting back only the id mapping."""
+        accounts_data = [
+            {
+                "account_id": "account-mapping-1",
+                "name": "Checking",
+                "official_name": "Plaid Checking",
+                "type": "depository",
+                "balances": {
+                    "current": 100.0,
+                    "iso_currency_code": "USD",
+                },
+            },
+        ]
+        
+        account_mapping = db_service.upsert_accounts(
+            accounts=accounts_data,
+            plaid_item_id=test_plaid_item.id,
+            user_id=test_user.id,
+            return_mapping=True,
+        )
+        
+        account = db_service.get_account_by_plaid_id("account-mapping-1")
+        assert account is not None
+        assert account_mapping == {"account-mapping-1": account.id}
+    
     def test_upsert_accounts_empty_list(
         self,
         db_service: DatabaseService,
@@ -448,6 +580,178 @@ class TestUpsertTransactions:
         )
         
         assert len(transactions) == 0
+    
+    def test_upsert_transactions_duplicate_ids_in_batch(
+        self,
+        db_service: DatabaseService,
+        test_user: User,
+        test_plaid_item: PlaidItem,
+    ) -> None:
+        """Test that a repeated transaction_id in one batch keeps the last values."""
+        accounts = db_service.upsert_accounts(
+            accounts=[
+                {
+                    "account_id": "account-txn-dup",
+                    "name": "Checking",
+                    "official_name": "Test Checking",
+                    "type": "depository",
+                    "balances": {"current": 100.0, "iso_currency_code": "USD"},
+                },
+            ],
+            plaid_item_id=test_plaid_item.id,
+            user_id=test_user.id,
+        )
+        
+        transaction_data = {
+            "transaction_id": "txn-dup-1",
+            "account_id": "account-txn-dup",
+            "amount": 25.50,
+            "date": "2024-01-15",
+            "merchant_name": "Starbucks",
+            "pending": True,
+            "category": ["Food and Drink"],
+        }
+        
+        transactions = db_service.upsert_transactions(
+            transactions=[transaction_data, {**transaction_data, "pending": False}],
+            account_mapping={"account-txn-dup": accounts[0].id},
+        )
+        
+        assert len(transactions) == 1
+        assert transactions[0].plaid_transaction_id == "txn-dup-1"
+        assert transactions[0].pending is False
+    
+    def test_upsert_transactions_category_shapes(
+        self,
+        db_service: DatabaseService,
+        test_user: User,
+        test_plaid_item: PlaidItem,
+    ) -> None:
+        """Test categories from both Plaid payload shapes in one batch."""
+        accounts = db_service.upsert_accounts(
+            accounts=[
+                {
+                    "account_id": "account-txn-category",
+                    "name": "Checking",
+                    "official_name": "Test Checking",
+                    "type": "depository",
+                    "balances": {"current": 100.0, "iso_currency_code": "USD"},
+                },
+            ],
+            plaid_item_id=test_plaid_item.id,
+            user_id=test_user.id,
+        )
+        
+        transactions_data = [
+            {
+                "transaction_id": "txn-pfc-1",
+                "account_id": "account-txn-category",
+                "amount": 12.00,
+                "date": "2024-01-15",
+                "merchant_name": "Chipotle",
+                "personal_finance_category": {"primary": "FOOD_AND_DRINK"},
+            },
+            {
+                "transaction_id": "txn-legacy-1",
+                "account_id": "account-txn-category",
+                "amount": 40.00,
+                "date": "2024-01-16",
+                "merchant_name": "Shell",
+                "category": ["Travel", "Gas Stations"],
+            },
+        ]
+        
+        transactions = db_service.upsert_transactions(
+            transactions=transactions_data,
+            account_mapping={"account-txn-category": accounts[0].id},
+        )
+        
+        assert [txn.category for txn in transactions] == [
+            "FOOD_AND_DRINK",
+            "Travel, Gas Stations",
+        ]
+
+
+class TestCopyTransactions:
+    """Tests for copy_transactions method."""
+    
+    def test_copy_transactions_inserts_and_updates(
+        self,
+        db: Session,
+        db_service: DatabaseService,
+        test_user: User,
+        test_plaid_item: PlaidItem,
+    ) -> None:
+        """Test bulk loading new transactions and updating existing ones."""
+        accounts = db_service.upsert_accounts(
+            accounts=[
+                {
+                    "account_id": "account-copy-1",
+                    "name": "Checking",
+                    "type": "depository",
+                    "balances": {"current": 100.0, "iso_currency_code": "USD"},
+                },
+            ],
+            plaid_item_id=test_plaid_item.id,
+            user_id=test_user.id,
+        )
+        account_mapping = {"account-copy-1": accounts[0].id}
+        
+        transactions_data = [
+            {
+                "transaction_id": "txn-copy-1",
+                "account_id": "account-copy-1",
+                "amount": 25.50,
+                "date": "2024-01-15",
+                "merchant_name": "Starbucks",
+                "pending": False,
+                "category": ["Food and Drink", "Coffee Shop"],
+            },
+            {
+                "transaction_id": "txn-copy-2",
+                "account_id": "account-copy-1",
+                "amount": 100.00,
+                "date": "2024-01-16",
+                "name": "Whole Foods",
+                "pending": True,
+                "category": ["Shops", "Groceries"],
+            },
+            {
+                "transaction_id": "txn-copy-unknown",
+                "account_id": "account-unknown",
+                "amount": 5.00,
+                "date": "2024-01-16",
+                "merchant_name": "Skipped",
+            },
+        ]
+        
+        count = db_service.copy_transactions(
+            transactions=transactions_data,
+            account_mapping=account_mapping,
+        )
+        
+        assert count == 2
+        
+        # Copying a transaction again updates it in place
+        transactions_data[0]["amount"] = 30.25
+        count = db_service.copy_transactions(
+            transactions=transactions_data[:1],
+            account_mapping=account_mapping,
+        )
+        
+        assert count == 1
+        stored = db.exec(
+            select(Transaction).where(Transaction.account_id == accounts[0].id)
+        ).all()
+        amounts = {txn.plaid_transaction_id: txn.amount for txn in stored}
+        assert amounts == {"txn-copy-1": Decimal("30.25"), "txn-copy-2": Decimal("100")}
+    
+    def test_copy_transactions_empty(
+        self,
+        db_service: DatabaseService,
+    ) -> None:
+        """Test copying an empty transaction list."""
+        assert db_service.copy_transactions(transactions=[], account_mapping={}) == 0
 
 
 class TestUpdateSyncCursor:
@@ -488,6 +792,27 @@ class TestUpdateSyncCursor:
         
         assert updated_item.cursor == "cursor-2"
     
+    def test_update_sync_cursor_accounts_refreshed_at(
+        self,
+        db_service: DatabaseService,
+        test_plaid_item: PlaidItem,
+    ) -> None:
+        """Test that accounts_refreshed_at is kept unless a new one is given."""
+        refreshed_at = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+        db_service.update_sync_cursor(
+            plaid_item_id=test_plaid_item.id,
+            cursor="cursor-1",
+            accounts_refreshed_at=refreshed_at,
+        )
+        
+        updated_item = db_service.update_sync_cursor(
+            plaid_item_id=test_plaid_item.id,
+            cursor="cursor-2",
+        )
+        
+        assert updated_item.cursor == "cursor-2"
+        assert updated_item.accounts_refreshed_at == refreshed_at
+    
     def test_update_sync_cursor_not_found(
         self,
         db_service: DatabaseService,
@@ -502,6 +827,39 @@ class TestUpdateSyncCursor:
         assert "not found" in str(exc_info.value).lower()
 
 
+class TestSetAccountsRefreshedAt:
+    """Tests for set_accounts_refreshed_at method."""
+    
+    def test_set_accounts_refreshed_at_success(
+        self,
+        db_service: DatabaseService,
+        test_plaid_item: PlaidItem,
+    ) -> None:
+        """Test recording when an item's accounts were stored."""
+        refreshed_at = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+        
+        updated_item = db_service.set_accounts_refreshed_at(
+            plaid_item_id=test_plaid_item.id,
+            accounts_refreshed_at=refreshed_at,
+        )
+        
+        assert updated_item.accounts_refreshed_at == refreshed_at
+        assert updated_item.cursor is None
+    
+    def test_set_accounts_refreshed_at_not_found(
+        self,
+        db_service: DatabaseService,
+    ) -> None:
+        """Test recording the refresh time of a non-existent PlaidItem."""
+        with pytest.raises(DatabaseServiceError) as exc_info:
+            db_service.set_accounts_refreshed_at(
+                plaid_item_id=uuid.uuid4(),
+                accounts_refreshed_at=datetime.now(timezone.utc),
+            )
+        
+        assert "not found" in str(exc_info.value).lower()
+
+
 class TestDeleteTransactions:
     """Tests for delete_transactions method."""
     
@@ -634,6 +992,49 @@ class TestDeleteTransactions:
         assert count == 0
 
 
+class TestGetAccountMapping:
+    """Tests for get_account_mapping method."""
+    
+    def test_get_account_mapping_success(
+        self,
+        db_service: DatabaseService,
+        test_user: User,
+        test_plaid_item: PlaidItem,
+    ) -> None:
+        """Test mapping a PlaidItem's Plaid account IDs to Account IDs."""
+        accounts = db_service.upsert_accounts(
+            accounts=[
+                {
+                    "account_id": "account-map-1",
+                    "name": "Checking",
+                    "type": "depository",
+                    "balances": {"current": 100.0, "iso_currency_code": "USD"},
+                },
+                {
+                    "account_id": "account-map-2",
+                    "name": "Savings",
+                    "type": "depository",
+                    "balances": {"current": 500.0, "iso_currency_code": "USD"},
+                },
+            ],
+            plaid_item_id=test_plaid_item.id,
+            user_id=test_user.id,
+        )
+        
+        mapping = db_service.get_account_mapping(test_plaid_item.id)
+        
+        assert mapping == {
+            account.plaid_account_id: account.id for account in accounts
+        }
+    
+    def test_get_account_mapping_no_accounts(
+        self,
+        db_service: DatabaseService,
+    ) -> None:
+        """Test mapping for a PlaidItem without accounts."""
+        assert db_service.get_account_mapping(uuid.uuid4()) == {}
+
+
 class TestGetAccountByPlaidId:
     """Tests for get_account_by_plaid_id method."""
     
@@ -676,3 +1077,88 @@ class TestGetAccountByPlaidId:
         account = db_service.get_account_by_plaid_id("account-nonexistent")
         
         assert account is None
+
+
+class TestUnitOfWork:
+    """Tests for unit_of_work method."""
+    
+    def test_unit_of_work_commits_writes_together(
+        self,
+        db_service: DatabaseService,
+        test_user: User,
+        test_plaid_item: PlaidItem,
+    ) -> None:
+        """Test that writes inside the block are committed on exit."""
+        with db_service.unit_of_work():
+            db_service.upsert_accounts(
+                accounts=[
+                    {
+                        "account_id": "account-uow-1",
+                        "name": "Checking",
+                        "official_name": "Test Checking",
+                        "type": "depository",
+                        "balances": {"current": 100.0, "iso_currency_code": "USD"},
+                    },
+                ],
+                plaid_item_id=test_plaid_item.id,
+                user_id=test_user.id,
+            )
+            db_service.update_sync_cursor(
+                plaid_item_id=test_plaid_item.id,
+                cursor="cursor-uow",
+            )
+        
+        db_service.session.rollback()
+        
+        assert db_service.get_account_by_plaid_id("account-uow-1") is not None
+        plaid_item = db_service.get_plaid_item_by_id(test_plaid_item.id)
+        assert plaid_item is not None
+        assert plaid_item.cursor == "cursor-uow"
+    
+    def test_unit_of_work_invalidates_summaries_after_commit(
+        self,
+        db_service: DatabaseService,
+        test_user: User,
+        test_plaid_item: PlaidItem,
+    ) -> None:
+        """Test that summaries cached during the block are dropped on commit."""
+        with db_service.unit_of_work():
+            db_service.update_sync_cursor(
+                plaid_item_id=test_plaid_item.id,
+                cursor="cursor-uow-summary",
+            )
+            # A concurrent status poll still sees, and caches, the old cursor
+            with Session(engine) as other_session:
+                summaries = DatabaseService(
+                    other_session
+                ).get_plaid_item_summaries_for_user(test_user.id)
+            assert summaries[0].cursor is None
+        
+        summaries = db_service.get_plaid_item_summaries_for_user(test_user.id)
+        assert summaries[0].cursor == "cursor-uow-summary"
+    
+    def test_unit_of_work_rolls_back_on_error(
+        self,
+        db_service: DatabaseService,
+        test_user: User,
+        test_plaid_item: PlaidItem,
+    ) -> None:
+        """Test that no write inside the block is kept if it raises."""
+        with pytest.raises(RuntimeError):
+            with db_service.unit_of_work():
+                db_service.upsert_accounts(
+                    accounts=[
+                        {
+                            "account_id": "account-uow-2",
+                            "name": "Checking",
+                            "official_name": "Test Checking",
+                            "type": "depository",
+                            "balances": {"current": 100.0, "iso_currency_code": "USD"},
+                        },
+                    ],
+                    plaid_item_id=test_plaid_item.id,
+                    user_id=test_user.id,
+                )
+                raise RuntimeError("sync failed")
+        
+        assert db_service.get_account_by_plaid_id("account-uow-2") is None
@@ -4,15 +4,23 @@ Unit tests for PlaidService.
 Tests all methods of PlaidService with proper mocking of Plaid API responses.
 """
 
+from concurrent.futures import Future
+from typing import Any
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from plaid import ApiException
+from urllib3.exceptions import ReadTimeoutError
 
 from app.core.plaid_service import (
+    PLAID_RATE_LIMIT_MAX_RETRIES,
+    PLAID_SYNC_MAX_EMPTY_PAGES,
+    PLAID_SYNC_REQUEST_TIMEOUT,
     PlaidAPIError,
+    PlaidRateLimitError,
     PlaidService,
     PlaidServiceError,
+    _access_token_key,
 )
 
 
@@ -57,6 +65,21 @@ class TestCreateLinkToken:
         assert call_args.user.client_user_id == "user-123"
         assert call_args.client_name == "WalletAI"
     
+    def test_create_link_token_not_reused(self, plaid_service: PlaidService) -> None:
+        """Test that every call creates a new link token, as they are single-use."""
+        mock_response = Mock()
+        mock_response.to_dict.return_value = {
+            "link_token": "link-sandbox-test-token",
+            "expiration": "2024-12-31T23:59:59Z",
+            "request_id": "test-request-id-123",
+        }
+        plaid_service.client.link_token_create.return_value = mock_response
+        
+        plaid_service.create_link_token(user_id="user-123")
+        plaid_service.create_link_token(user_id="user-123")
+        
+        assert plaid_service.client.link_token_create.call_count == 2
+    
     def test_create_link_token_custom_client_name(
         self, plaid_service: PlaidService
     ) -> None:
@@ -243,6 +266,101 @@ class TestGetAccounts:
         
         with pytest.raises(PlaidAPIError):
             plaid_service.get_accounts(access_token="invalid-token")
+    
+    def test_get_accounts_cached(self, plaid_service: PlaidService) -> None:
+        """Test that a repeated account retrieval is served from the cache."""
+        mock_response = Mock()
+        mock_response.to_dict.return_value = {
+            "accounts": [{"account_id": "account-1"}],
+            "item": {"item_id": "item-123"},
+            "request_id": "test-request-id",
+        }
+        plaid_service.client.accounts_get.return_value = mock_response
+        
+        first = plaid_service.get_accounts(access_token="access-cached-token")
+        second = plaid_service.get_accounts(access_token="access-cached-token")
+        
+        assert second == first
+        plaid_service.client.accounts_get.assert_called_once()
+    
+    def test_get_accounts_joins_inflight_request(
+        self, plaid_service: PlaidService
+    ) -> None:
+        """Test that a call waits for an in-flight request for the same token."""
+        accounts = {
+            "accounts": [{"account_id": "account-1"}],
+            "item": {"item_id": "item-123"},
+            "request_id": "test-request-id",
+        }
+        inflight: Future[dict[str, Any]] = Future()
+        inflight.set_result(accounts)
+        plaid_service._accounts_inflight[
+            _access_token_key("access-inflight-token")
+        ] = inflight
+        
+        result = plaid_service.get_accounts(access_token="access-inflight-token")
+        
+        assert result == accounts
+        plaid_service.client.accounts_get.assert_not_called()
+    
+    def test_get_accounts_server_error_serves_expired_cache(
+        self, plaid_service: PlaidService
+    ) -> None:
+        """Test that an expired cached response is used when Plaid fails."""
+        mock_response = Mock()
+        mock_response.to_dict.return_value = {
+            "accounts": [{"account_id": "account-1"}],
+            "item": {"item_id": "item-123"},
+            "request_id": "test-request-id",
+        }
+        plaid_service.client.accounts_get.return_value = mock_response
+        
+        with patch("app.core.plaid_service.ACCOUNTS_CACHE_TTL_SECONDS", 0):
+            first = plaid_service.get_accounts(access_token="access-stale-token")
+        
+        plaid_service.client.accounts_get.side_effect = ApiException(
+            status=503,
+            reason="Service Unavailable"
+        )
+        
+        result = plaid_service.get_accounts(access_token="access-stale-token")
+        
+        assert result == first
+        assert plaid_service.client.accounts_get.call_count == 2
+
+
+class TestGetAccountsBatch:
+    """Tests for get_accounts_batch method."""
+    
+    def test_get_accounts_batch(self, plaid_service: PlaidService) -> None:
+        """Test that results and errors are collected per access token."""
+        mock_response = Mock()
+        mock_response.to_dict.return_value = {
+            "accounts": [{"account_id": "account-1"}],
+            "item": {"item_id": "item-123"},
+            "request_id": "test-request-id",
+        }
+        
+        def accounts_get(request: Any, **kwargs: Any) -> Mock:
+            if request.access_token == "access-bad-token":
+                raise ApiException(status=400, reason="Invalid access token")
+            return mock_response
+        
+        plaid_service.client.accounts_get.side_effect = accounts_get
+        
+        results = plaid_service.get_accounts_batch(
+            ["access-good-token", "access-bad-token"]
+        )
+        
+        assert results["access-good-token"]["accounts"] == [
+            {"account_id": "account-1"}
+        ]
+        assert isinstance(results["access-bad-token"], PlaidAPIError)
+    
+    def test_get_accounts_batch_empty(self, plaid_service: PlaidService) -> None:
+        """Test that an empty batch makes no Plaid calls."""
+        assert plaid_service.get_accounts_batch([]) == {}
+        plaid_service.client.accounts_get.assert_not_called()
 
 
 class TestSyncTransactions:
@@ -406,6 +524,23 @@ class TestSyncTransactions:
             plaid_service.sync_transactions(
                 access_token="invalid-token"
             )
+    
+    def test_sync_transactions_timeout(
+        self, plaid_service: PlaidService
+    ) -> None:
+        """Test that a timed out sync is passed a timeout and raises PlaidAPIError."""
+        plaid_service.client.transactions_sync.side_effect = ReadTimeoutError(
+            None, "/transactions/sync", "Read timed out."
+        )
+        
+        with pytest.raises(PlaidAPIError) as exc_info:
+            plaid_service.sync_transactions(
+                access_token="access-sandbox-test-token"
+            )
+        
+        assert "Plaid request failed" in str(exc_info.value)
+        call_kwargs = plaid_service.client.transactions_sync.call_args[1]
+        assert call_kwargs["_request_timeout"] == PLAID_SYNC_REQUEST_TIMEOUT
 
 
 class TestSyncAllTransactions:
@@ -497,6 +632,62 @@ class TestSyncAllTransactions:
         # Should call API three times
         assert plaid_service.client.transactions_sync.call_count == 3
     
+    def test_sync_all_transactions_on_page(
+        self, plaid_service: PlaidService
+    ) -> None:
+        """Test that on_page receives each page in order instead of the result."""
+        responses = []
+        for i, has_more in enumerate([True, False]):
+            response = Mock()
+            response.to_dict.return_value = {
+                "added": [{"transaction_id": f"txn-{i}"}],
+                "modified": [],
+                "removed": [],
+                "next_cursor": f"cursor-{i}",
+                "has_more": has_more,
+                "request_id": f"test-request-id-{i}",
+            }
+            responses.append(response)
+        plaid_service.client.transactions_sync.side_effect = responses
+        handled: list[dict[str, Any]] = []
+        
+        result = plaid_service.sync_all_transactions(
+            access_token="access-sandbox-test-token",
+            on_page=handled.append,
+        )
+        
+        assert [page["next_cursor"] for page in handled] == ["cursor-0", "cursor-1"]
+        assert result["added"] == []
+        assert result["total_synced"] == 2
+        assert result["next_cursor"] == "cursor-1"
+        assert result["request_id"] == "test-request-id-1"
+    
+    def test_sync_all_transactions_on_page_error(
+        self, plaid_service: PlaidService
+    ) -> None:
+        """Test that an error raised by on_page fails the sync."""
+        mock_response = Mock()
+        mock_response.to_dict.return_value = {
+            "added": [],
+            "modified": [],
+            "removed": [],
+            "next_cursor": "cursor-final",
+            "has_more": False,
+            "request_id": "test-request-id",
+        }
+        plaid_service.client.transactions_sync.return_value = mock_response
+        
+        def fail(page: dict[str, Any]) -> None:
+            raise RuntimeError("write failed")
+        
+        with pytest.raises(PlaidServiceError) as exc_info:
+            plaid_service.sync_all_transactions(
+                access_token="access-sandbox-test-token",
+                on_page=fail,
+            )
+        
+        assert "write failed" in str(exc_info.value)
+    
     def test_sync_all_transactions_with_initial_cursor(
         self, plaid_service: PlaidService
     ) -> None:
@@ -534,6 +725,167 @@ class TestSyncAllTransactions:
                 access_token="invalid-token"
             )
     
+    def test_iter_sync_transactions_yields_pages(
+        self, plaid_service: PlaidService
+    ) -> None:
+        """Test that each page is yielded with the cursor chained through."""
+        first_response = Mock()
+        first_response.to_dict.return_value = {
+            "added": [{"transaction_id": "txn-1"}],
+            "modified": [],
+            "removed": [],
+            "next_cursor": "cursor-page2",
+            "has_more": True,
+            "request_id": "test-request-id-1",
+        }
+        second_response = Mock()
+        second_response.to_dict.return_value = {
+            "added": [{"transaction_id": "txn-2"}],
+            "modified": [],
+            "removed": [],
+            "next_cursor": "cursor-final",
+            "has_more": False,
+            "request_id": "test-request-id-2",
+        }
+        plaid_service.client.transactions_sync.side_effect = [
+            first_response,
+            second_response,
+        ]
+        
+        pages = list(
+            plaid_service.iter_sync_transactions(
+                access_token="access-sandbox-test-token"
+            )
+        )
+        
+        assert [page["next_cursor"] for page in pages] == [
+            "cursor-page2",
+            "cursor-final",
+        ]
+        second_request = plaid_service.client.transactions_sync.call_args_list[1][0][0]
+        assert second_request.cursor == "cursor-page2"
+    
+    def test_sync_all_transactions_retries_rate_limit(
+        self, plaid_service: PlaidService
+    ) -> None:
+        """Test that a rate-limited page is retried after a backoff."""
+        mock_response = Mock()
+        mock_response.to_dict.return_value = {
+            "added": [{"transaction_id": "txn-1"}],
+            "modified": [],
+            "removed": [],
+            "next_cursor": "cursor-final",
+            "has_more": False,
+            "request_id": "test-request-id",
+        }
+        plaid_service.client.transactions_sync.side_effect = [
+            ApiException(status=429, reason="Too Many Requests"),
+            mock_response,
+        ]
+        
+        with patch("app.core.plaid_service.time.sleep") as mock_sleep:
+            result = plaid_service.sync_all_transactions(
+                access_token="access-sandbox-test-token"
+            )
+        
+        mock_sleep.assert_called_once()
+        assert len(result["added"]) == 1
+        assert result["has_more"] is False
+    
+    def test_sync_all_transactions_rate_limit_returns_partial(
+        self, plaid_service: PlaidService
+    ) -> None:
+        """Test that a persistent rate limit returns the pages fetched so far."""
+        first_response = Mock()
+        first_response.to_dict.return_value = {
+            "added": [{"transaction_id": "txn-1"}],
+            "modified": [],
+            "removed": [],
+            "next_cursor": "cursor-page2",
+            "has_more": True,
+            "request_id": "test-request-id-1",
+        }
+        plaid_service.client.transactions_sync.side_effect = [first_response] + [
+            ApiException(status=429, reason="Too Many Requests")
+            for _ in range(PLAID_RATE_LIMIT_MAX_RETRIES + 1)
+        ]
+        
+        with patch("app.core.plaid_service.time.sleep"):
+            result = plaid_service.sync_all_transactions(
+                access_token="access-sandbox-test-token"
+            )
+        
+        assert len(result["added"]) == 1
+        assert result["next_cursor"] == "cursor-page2"
+        assert result["has_more"] is True
+    
+    def test_sync_all_transactions_stops_on_repeated_cursor(
+        self, plaid_service: PlaidService
+    ) -> None:
+        """Test that a sync stops when Plaid returns a cursor it already returned."""
+        response = Mock()
+        response.to_dict.return_value = {
+            "added": [{"transaction_id": "txn-1"}],
+            "modified": [],
+            "removed": [],
+            "next_cursor": "cursor-stuck",
+            "has_more": True,
+            "request_id": "test-request-id",
+        }
+        plaid_service.client.transactions_sync.return_value = response
+        
+        result = plaid_service.sync_all_transactions(
+            access_token="access-sandbox-test-token"
+        )
+        
+        assert plaid_service.client.transactions_sync.call_count == 2
+        assert result["next_cursor"] == "cursor-stuck"
+        assert result["has_more"] is True
+    
+    def test_sync_all_transactions_stops_on_empty_pages(
+        self, plaid_service: PlaidService
+    ) -> None:
+        """Test that a sync stops after repeated empty pages with has_more."""
+        responses = []
+        for i in range(PLAID_SYNC_MAX_EMPTY_PAGES + 2):
+            response = Mock()
+            response.to_dict.return_value = {
+                "added": [],
+                "modified": [],
+                "removed": [],
+                "next_cursor": f"cursor-{i}",
+                "has_more": True,
+                "request_id": "test-request-id",
+            }
+            responses.append(response)
+        plaid_service.client.transactions_sync.side_effect = responses
+        
+        result = plaid_service.sync_all_transactions(
+            access_token="access-sandbox-test-token"
+        )
+        
+        assert (
+            plaid_service.client.transactions_sync.call_count
+            == PLAID_SYNC_MAX_EMPTY_PAGES
+        )
+        assert result["total_synced"] == 0
+        assert result["has_more"] is True
+    
+    def test_sync_all_transactions_rate_limit_first_page(
+        self, plaid_service: PlaidService
+    ) -> None:
+        """Test that a persistent rate limit on the first page is raised."""
+        plaid_service.client.transactions_sync.side_effect = ApiException(
+            status=429,
+            reason="Too Many Requests"
+        )
+        
+        with patch("app.core.plaid_service.time.sleep"):
+            with pytest.raises(PlaidRateLimitError):
+                plaid_service.sync_all_transactions(
+                    access_token="access-sandbox-test-token"
+                )
+    
     def test_sync_all_transactions_propagates_service_error(
         self, plaid_service: PlaidService
     ) -> None:
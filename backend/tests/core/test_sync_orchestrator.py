@@ -5,23 +5,28 @@ Tests all methods of SyncOrchestrator with proper mocking of dependencies.
 """
 
 import uuid
-from typing import Generator
+from concurrent.futures import Future
+from datetime import datetime, timedelta, timezone
+from typing import Any, Generator
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from sqlmodel import Session
 
+from app import crud
 from app.core.db_service import DatabaseService, DatabaseServiceError
 from app.core.plaid_service import PlaidAPIError, PlaidService, PlaidServiceError
-from app.core.sync_orchestrator import SyncOrchestrator, SyncOrchestratorError
+from app.core.sync_orchestrator import (
+    SyncOrchestrator,
+    SyncOrchestratorError,
+    _user_syncs_inflight,
+)
 from app.models import PlaidItem, User, UserCreate
 
 
 @pytest.fixture
 def test_user(db: Session) -> Generator[User, None, None]:
     """Create a test user for orchestrator operations."""
-    from app import crud
-    
     user_create = UserCreate(
         email=f"testuser_{uuid.uuid4()}@example.com",
         password="testpassword123",
@@ -178,6 +183,7 @@ class TestHandlePublicTokenExchange:
             public_token="public-sandbox-test-token"
         )
         mock_plaid_service.get_accounts.assert_called_once()
+        assert result["plaid_item"].accounts_refreshed_at is not None
     
     def test_handle_public_token_exchange_plaid_error(
         self,
@@ -245,6 +251,94 @@ class TestSyncUserTransactions:
         assert result["items_synced"] == 0
         assert len(result["results"]) == 0
     
+    def test_sync_user_transactions_joins_running_sync(
+        self,
+        sync_orchestrator: SyncOrchestrator,
+        test_user: User,
+        mock_plaid_service: MagicMock,
+    ) -> None:
+        """Test that a sync waits for one already running for the same user."""
+        running_result = {
+            "total_added": 3,
+            "total_modified": 0,
+            "total_removed": 0,
+            "items_synced": 1,
+            "results": [],
+        }
+        running: Future[dict[str, Any]] = Future()
+        running.set_result(running_result)
+        
+        with patch.dict(
+            "app.core.sync_orchestrator._user_syncs_inflight",
+            {test_user.id: running},
+        ):
+            result = sync_orchestrator.sync_user_transactions(user_id=test_user.id)
+        
+        assert result == running_result
+        mock_plaid_service.sync_all_transactions.assert_not_called()
+    
+    def test_iter_user_transaction_syncs_no_items(
+        self,
+        sync_orchestrator: SyncOrchestrator,
+        test_user: User,
+    ) -> None:
+        """Test that per-item sync progress is empty when user has no PlaidItems."""
+        results = list(sync_orchestrator.iter_user_transaction_syncs(test_user.id))
+        
+        assert results == []
+    
+    def test_iter_user_transaction_syncs_joins_running_sync(
+        self,
+        sync_orchestrator: SyncOrchestrator,
+        test_user: User,
+        mock_plaid_service: MagicMock,
+    ) -> None:
+        """Test that streamed progress replays a sync already running for the user."""
+        item_result = {
+            "plaid_item_id": str(uuid.uuid4()),
+            "institution_name": "Test Bank",
+            "added_count": 3,
+            "modified_count": 0,
+            "removed_count": 0,
+            "success": True,
+        }
+        running: Future[dict[str, Any]] = Future()
+        running.set_result({
+            "total_added": 3,
+            "total_modified": 0,
+            "total_removed": 0,
+            "items_synced": 1,
+            "results": [item_result],
+        })
+        
+        with patch.dict(
+            "app.core.sync_orchestrator._user_syncs_inflight",
+            {test_user.id: running},
+        ):
+            results = list(sync_orchestrator.iter_user_transaction_syncs(test_user.id))
+        
+        assert results == [item_result]
+        mock_plaid_service.sync_all_transactions.assert_not_called()
+    
+    def test_iter_user_transaction_syncs_registers_running_sync(
+        self,
+        sync_orchestrator: SyncOrchestrator,
+        test_user: User,
+    ) -> None:
+        """Test that a streamed sync is visible to, and released for, other callers."""
+        with patch.object(
+            sync_orchestrator,
+            "_iter_plaid_item_syncs",
+            return_value=iter([{"success": False, "error": "Item error"}]),
+        ):
+            syncs = sync_orchestrator.iter_user_transaction_syncs(test_user.id)
+            next(syncs)
+            running = _user_syncs_inflight[test_user.id]
+            assert list(syncs) == []
+        
+        assert test_user.id not in _user_syncs_inflight
+        assert running.result()["items_synced"] == 1
+    
     def test_sync_user_transactions_single_item(
         self,
         sync_orchestrator: SyncOrchestrator,
@@ -633,6 +727,295 @@ class TestSyncPlaidItem:
             cursor="cursor-old",
         )
     
+    def test_sync_plaid_item_initial_sync_fetches_accounts(
+        self,
+        sync_orchestrator: SyncOrchestrator,
+        test_user: User,
+        mock_plaid_service: MagicMock,
+        db: Session,
+    ) -> None:
+        """Test that an initial sync fetches accounts alongside transactions."""
+        db_service = DatabaseService(db)
+        
+        plaid_item = db_service.create_plaid_item(
+            user_id=test_user.id,
+            item_id="item-initial-sync",
+            access_token="access-token-initial-sync",
+            institution_name="Test Bank",
+        )
+        
+        mock_plaid_service.sync_all_transactions.return_value = {
+            "added": [],
+            "modified": [],
+            "removed": [],
+            "next_cursor": "cursor-initial",
+            "total_synced": 0,
+        }
+        mock_plaid_service.get_accounts.return_value = {
+            "accounts": [
+                {
+                    "account_id": "account-initial-sync",
+                    "name": "Checking",
+                    "official_name": "Test Checking",
+                    "type": "depository",
+                    "balances": {"current": 100.0, "iso_currency_code": "USD"},
+                },
+            ],
+            "item": {"item_id": "item-initial-sync"},
+        }
+        
+        result = sync_orchestrator.sync_plaid_item(plaid_item)
+        
+        assert result["success"] is True
+        mock_plaid_service.get_accounts.assert_called_once_with(
+            access_token="access-token-initial-sync"
+        )
+        assert db_service.get_account_by_plaid_id("account-initial-sync")
+    
+    def test_sync_plaid_item_no_changes_skips_accounts(
+        self,
+        sync_orchestrator: SyncOrchestrator,
+        test_user: User,
+        mock_plaid_service: MagicMock,
+        db: Session,
+    ) -> None:
+        """Test that an incremental sync with no changes does not fetch accounts."""
+        db_service = DatabaseService(db)
+        
+        plaid_item = db_service.create_plaid_item(
+            user_id=test_user.id,
+            item_id="item-no-changes",
+            access_token="access-token-no-changes",
+            institution_name="Test Bank",
+        )
+        db_service.update_sync_cursor(
+            plaid_item.id, "cursor-old", accounts_refreshed_at=datetime.now(timezone.utc)
+        )
+        
+        mock_plaid_service.sync_all_transactions.return_value = {
+            "added": [],
+            "modified": [],
+            "removed": [],
+            "next_cursor": "cursor-no-changes",
+            "total_synced": 0,
+        }
+        
+        result = sync_orchestrator.sync_plaid_item(plaid_item)
+        
+        assert result["success"] is True
+        mock_plaid_service.get_accounts.assert_not_called()
+        
+        updated_item = db_service.get_plaid_item_by_id(plaid_item.id)
+        assert updated_item.cursor == "cursor-no-changes"
+    
+    def test_sync_plaid_item_unchanged_skips_writes(
+        self,
+        sync_orchestrator: SyncOrchestrator,
+        test_user: User,
+        mock_plaid_service: MagicMock,
+        db: Session,
+    ) -> None:
+        """Test that a sync with no changes and the same cursor writes nothing."""
+        db_service = DatabaseService(db)
+        
+        plaid_item = db_service.create_plaid_item(
+            user_id=test_user.id,
+            item_id="item-unchanged",
+            access_token="access-token-unchanged",
+            institution_name="Test Bank",
+        )
+        db_service.update_sync_cursor(
+            plaid_item.id, "cursor-same", accounts_refreshed_at=datetime.now(timezone.utc)
+        )
+        
+        mock_plaid_service.sync_all_transactions.return_value = {
+            "added": [],
+            "modified": [],
+            "removed": [],
+            "next_cursor": "cursor-same",
+            "total_synced": 0,
+        }
+        
+        with patch.object(
+            sync_orchestrator.db_service, "update_sync_cursor"
+        ) as mock_update_cursor:
+            result = sync_orchestrator.sync_plaid_item(plaid_item)
+        
+        assert result["success"] is True
+        assert result["added_count"] == 0
+        mock_update_cursor.assert_not_called()
+    
+    def test_sync_plaid_item_stale_accounts_refreshed_without_changes(
+        self,
+        sync_orchestrator: SyncOrchestrator,
+        test_user: User,
+        mock_plaid_service: MagicMock,
+        db: Session,
+    ) -> None:
+        """Test that stale accounts are refreshed even with no transaction changes."""
+        db_service = DatabaseService(db)
+        
+        plaid_item = db_service.create_plaid_item(
+            user_id=test_user.id,
+            item_id="item-stale-accounts",
+            access_token="access-token-stale-accounts",
+            institution_name="Test Bank",
+        )
+        db_service.update_sync_cursor(
+            plaid_item.id,
+            "cursor-same",
+            accounts_refreshed_at=datetime.now(timezone.utc) - timedelta(days=2),
+        )
+        
+        mock_plaid_service.sync_all_transactions.return_value = {
+            "added": [],
+            "modified": [],
+            "removed": [],
+            "next_cursor": "cursor-same",
+            "total_synced": 0,
+        }
+        mock_plaid_service.get_accounts.return_value = {
+            "accounts": [
+                {
+                    "account_id": "account-stale-accounts",
+                    "name": "Checking",
+                    "official_name": "Test Checking",
+                    "type": "depository",
+                    "balances": {"current": 250.0, "iso_currency_code": "USD"},
+                },
+            ],
+            "item": {"item_id": "item-stale-accounts"},
+        }
+        
+        result = sync_orchestrator.sync_plaid_item(plaid_item)
+        
+        assert result["success"] is True
+        mock_plaid_service.get_accounts.assert_called_once_with(
+            access_token="access-token-stale-accounts"
+        )
+        account = db_service.get_account_by_plaid_id("account-stale-accounts")
+        assert account.current_balance == 250
+        updated_item = db_service.get_plaid_item_by_id(plaid_item.id)
+        assert (
+            datetime.now(timezone.utc) - updated_item.accounts_refreshed_at
+            < timedelta(minutes=1)
+        )
+    
+    def test_sync_plaid_item_recent_accounts_skips_accounts(
+        self,
+        sync_orchestrator: SyncOrchestrator,
+        test_user: User,
+        mock_plaid_service: MagicMock,
+        db: Session,
+    ) -> None:
+        """Test that recently stored accounts are reused instead of fetched."""
+        db_service = DatabaseService(db)
+        
+        plaid_item = db_service.create_plaid_item(
+            user_id=test_user.id,
+            item_id="item-recent-accounts",
+            access_token="access-token-recent-accounts",
+            institution_name="Test Bank",
+        )
+        db_service.upsert_accounts(
+            accounts=[
+                {
+                    "account_id": "account-recent",
+                    "name": "Checking",
+                    "official_name": "Test Checking",
+                    "type": "depository",
+                    "balances": {"current": 100.0, "iso_currency_code": "USD"},
+                },
+            ],
+            plaid_item_id=plaid_item.id,
+            user_id=test_user.id,
+        )
+        plaid_item = db_service.update_sync_cursor(
+            plaid_item.id, "cursor-old", accounts_refreshed_at=datetime.now(timezone.utc)
+        )
+        
+        mock_plaid_service.sync_all_transactions.return_value = {
+            "added": [
+                {
+                    "transaction_id": "txn-recent-accounts",
+                    "account_id": "account-recent",
+                    "amount": 12.00,
+                    "date": "2024-01-15",
+                    "merchant_name": "Starbucks",
+                    "pending": False,
+                    "category": ["Food and Drink"],
+                },
+            ],
+            "modified": [],
+            "removed": [],
+            "next_cursor": "cursor-new",
+            "total_synced": 1,
+        }
+        
+        result = sync_orchestrator.sync_plaid_item(plaid_item)
+        
+        assert result["success"] is True
+        assert result["added_count"] == 1
+        mock_plaid_service.get_accounts.assert_not_called()
+    
+    def test_sync_plaid_item_unknown_account_fetches_accounts(
+        self,
+        sync_orchestrator: SyncOrchestrator,
+        test_user: User,
+        mock_plaid_service: MagicMock,
+        db: Session,
+    ) -> None:
+        """Test that a transaction for a new account fetches accounts."""
+        db_service = DatabaseService(db)
+        
+        plaid_item = db_service.create_plaid_item(
+            user_id=test_user.id,
+            item_id="item-new-account",
+            access_token="access-token-new-account",
+            institution_name="Test Bank",
+        )
+        plaid_item = db_service.update_sync_cursor(
+            plaid_item.id, "cursor-old", accounts_refreshed_at=datetime.now(timezone.utc)
+        )
+        
+        mock_plaid_service.sync_all_transactions.return_value = {
+            "added": [
+                {
+                    "transaction_id": "txn-new-account",
+                    "account_id": "account-new",
+                    "amount": 30.00,
+                    "date": "2024-01-15",
+                    "merchant_name": "Target",
+                    "pending": False,
+                    "category": ["Shopping"],
+                },
+            ],
+            "modified": [],
+            "removed": [],
+            "next_cursor": "cursor-new",
+            "total_synced": 1,
+        }
+        mock_plaid_service.get_accounts.return_value = {
+            "accounts": [
+                {
+                    "account_id": "account-new",
+                    "name": "Savings",
+                    "official_name": "Test Savings",
+                    "type": "depository",
+                    "balances": {"current": 500.0, "iso_currency_code": "USD"},
+                },
+            ],
+            "item": {"item_id": "item-new-account"},
+        }
+        
+        result = sync_orchestrator.sync_plaid_item(plaid_item)
+        
+        assert result["success"] is True
+        mock_plaid_service.get_accounts.assert_called_once_with(
+            access_token="access-token-new-account"
+        )
+        assert db_service.get_account_by_plaid_id("account-new")
+    
     def test_sync_plaid_item_plaid_error(
         self,
         sync_orchestrator: SyncOrchestrator,
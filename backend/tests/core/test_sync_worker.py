@@ -0,0 +1,141 @@
+"""
+Unit tests for the sync worker.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlmodel import Session
+
+from app import crud
+from app.core.db_service import DatabaseService
+from app.core.plaid_service import PlaidService
+from app.core.sync_orchestrator import SyncOrchestratorError
+from app.core.sync_worker import sync_all_users
+from app.models import User, UserCreate
+
+
+@pytest.fixture
+def test_users(db: Session) -> Generator[list[User], None, None]:
+    """Create two users, each with a PlaidItem."""
+    users = []
+    for _ in range(2):
+        user = crud.create_user(
+            session=db,
+            user_create=UserCreate(
+                email=f"testuser_{uuid.uuid4()}@example.com",
+                password="testpassword123",
+                full_name="Test User",
+            ),
+        )
+        DatabaseService(db).create_plaid_item(
+            user_id=user.id,
+            item_id=f"item-{uuid.uuid4()}",
+            access_token=f"access-token-{uuid.uuid4()}",
+            institution_name="Test Bank",
+        )
+        users.append(user)
+    yield users
+    
+    # Cleanup
+    for user in users:
+        db.delete(user)
+    db.commit()
+
+
+class TestSyncAllUsers:
+    """Tests for sync_all_users."""
+    
+    def test_sync_all_users_syncs_each_user(self, test_users: list[User]) -> None:
+        """Test that every user with a PlaidItem is synced once."""
+        synced: list[uuid.UUID] = []
+        
+        def sync_user_transactions(user_id: uuid.UUID) -> dict[str, Any]:
+            synced.append(user_id)
+            return {"total_added": 2, "total_modified": 1, "total_removed": 0}
+        
+        with patch(
+            "app.core.sync_worker.SyncOrchestrator.sync_user_transactions",
+            side_effect=sync_user_transactions,
+        ):
+            summary = sync_all_users(plaid_service=MagicMock(spec=PlaidService))
+        
+        for user in test_users:
+            assert synced.count(user.id) == 1
+        assert summary["users_synced"] == len(synced)
+        assert summary["users_failed"] == 0
+        assert summary["total_added"] == 2 * len(synced)
+    
+    def test_sync_all_users_continues_after_failure(
+        self, test_users: list[User]
+    ) -> None:
+        """Test that a failed user sync is counted and the others still run."""
+        failing_user_id = test_users[0].id
+        
+        def sync_user_transactions(user_id: uuid.UUID) -> dict[str, Any]:
+            if user_id == failing_user_id:
+                raise SyncOrchestratorError("Sync failed")
+            return {"total_added": 0, "total_modified": 0, "total_removed": 0}
+        
+        with patch(
+            "app.core.sync_worker.SyncOrchestrator.sync_user_transactions",
+            side_effect=sync_user_transactions,
+        ):
+            summary = sync_all_users(plaid_service=MagicMock(spec=PlaidService))
+        
+        assert summary["users_failed"] == 1
+        assert summary["users_synced"] >= 1
+    
+    def test_sync_all_users_stalest_first(
+        self, db: Session, test_users: list[User]
+    ) -> None:
+        """Test that never-synced users come first, then the least recently refreshed."""
+        db_service = DatabaseService(db)
+        now = datetime.now(timezone.utc)
+        recent_user, stale_user = test_users
+        for user, refreshed_at in (
+            (recent_user, now),
+            (stale_user, now - timedelta(days=2)),
+        ):
+            plaid_item = db_service.get_plaid_items_for_user(user.id)[0]
+            db_service.update_sync_cursor(
+                plaid_item.id, "cursor-1", accounts_refreshed_at=refreshed_at
+            )
+        new_user = crud.create_user(
+            session=db,
+            user_create=UserCreate(
+                email=f"testuser_{uuid.uuid4()}@example.com",
+                password="testpassword123",
+                full_name="Test User",
+            ),
+        )
+        db_service.create_plaid_item(
+            user_id=new_user.id,
+            item_id=f"item-{uuid.uuid4()}",
+            access_token=f"access-token-{uuid.uuid4()}",
+            institution_name="Test Bank",
+        )
+        synced: list[uuid.UUID] = []
+        
+        def sync_user_transactions(user_id: uuid.UUID) -> dict[str, Any]:
+            synced.append(user_id)
+            return {"total_added": 0, "total_modified": 0, "total_removed": 0}
+        
+        try:
+            with patch(
+                "app.core.sync_worker.SyncOrchestrator.sync_user_transactions",
+                side_effect=sync_user_transactions,
+            ):
+                sync_all_users(plaid_service=MagicMock(spec=PlaidService), max_workers=1)
+        finally:
+            db.delete(new_user)
+            db.commit()
+        
+        assert (
+            synced.index(new_user.id)
+            < synced.index(stale_user.id)
+            < synced.index(recent_user.id)
+        )